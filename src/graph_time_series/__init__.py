@@ -1,14 +1,68 @@
 """graph_time_series package."""
 
-from graph_time_series import observables, plotting, utilities
+from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from graph_time_series import observables, utilities
+
+from ._internal.frames import FrameEdges
 from ._internal.graph import Graph
+from ._internal.lazy import deferred_attributes
+from ._internal.node_registry import NodeRegistry
+from ._internal.pipeline import FrameContext, ObservablePipeline
+from ._internal.result_cache import ResultCache
 from ._internal.timeseries import GraphTimeSeries
 
+if TYPE_CHECKING:
+    from graph_time_series import plotting
+
+    from ._internal.communities import CommunityTracking
+    from ._internal.distance_sampling import DistanceEstimate
+    from ._internal.live import LiveMonitor, LiveResult, iterate_queue
+    from ._internal.null_models import NullModelStats
+    from ._internal.shared_frames import SharedFrameHandle, SharedFrameStore
+    from ._internal.temporal_index import EgoNetwork, TemporalIndex
+
 __all__ = [
+    "CommunityTracking",
+    "DistanceEstimate",
+    "EgoNetwork",
+    "FrameContext",
+    "FrameEdges",
     "Graph",
     "GraphTimeSeries",
+    "LiveMonitor",
+    "LiveResult",
+    "NodeRegistry",
+    "NullModelStats",
+    "ObservablePipeline",
+    "ResultCache",
+    "SharedFrameHandle",
+    "SharedFrameStore",
+    "TemporalIndex",
+    "iterate_queue",
     "observables",
     "plotting",
     "utilities",
 ]
+
+
+# Rarely used, or pulling asyncio, multiprocessing or matplotlib: imported
+# on first access
+__getattr__ = deferred_attributes(
+    __name__,
+    {
+        "CommunityTracking": "._internal.communities",
+        "DistanceEstimate": "._internal.distance_sampling",
+        "EgoNetwork": "._internal.temporal_index",
+        "LiveMonitor": "._internal.live",
+        "LiveResult": "._internal.live",
+        "NullModelStats": "._internal.null_models",
+        "SharedFrameHandle": "._internal.shared_frames",
+        "SharedFrameStore": "._internal.shared_frames",
+        "TemporalIndex": "._internal.temporal_index",
+        "iterate_queue": "._internal.live",
+        "plotting": ".plotting",
+    },
+)
@@ -0,0 +1,208 @@
+"""Export a graph time-series as an animation."""
+
+from __future__ import annotations
+
+import contextlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.collections import PathCollection
+    from numpy.typing import NDArray
+
+    from .frames import FrameEdges
+    from .timeseries import GraphTimeSeries
+
+import numpy as np
+from matplotlib.animation import FFMpegWriter, PillowWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+VIDEO_WRITERS = {".gif": PillowWriter, ".mp4": FFMpegWriter}
+
+
+def _undirected_pairs(
+    edges: FrameEdges, n_nodes: int
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """Return the sorted pair keys, and the (low, high) endpoints."""
+    low = np.minimum(edges.src, edges.dst).astype(np.int64)
+    high = np.maximum(edges.src, edges.dst).astype(np.int64)
+    keys = np.unique(low * n_nodes + high)
+    return keys, keys // n_nodes, keys % n_nodes
+
+
+def _movable_nodes(
+    changed: NDArray[np.int64],
+    pairs: tuple[NDArray[np.int64], NDArray[np.int64]],
+    n_nodes: int,
+) -> NDArray[np.bool_]:
+    """Return the endpoints of the changed edges and their neighbours."""
+    movable = np.zeros(n_nodes, dtype=bool)
+    movable[changed // n_nodes] = movable[changed % n_nodes] = True
+    low, high = pairs
+    touched = movable[low] | movable[high]
+    movable[low[touched]] = movable[high[touched]] = True
+    return movable
+
+
+def _spring_layout_step(
+    pos: NDArray[np.float64],
+    pairs: tuple[NDArray[np.int64], NDArray[np.int64]],
+    movable: NDArray[np.bool_],
+    iterations: int,
+    k: float,
+) -> NDArray[np.float64]:
+    """Fruchterman-Reingold iterations moving only the `movable` nodes.
+
+    Repulsion is computed between the movable nodes and all the others,
+    so the cost scales with the number of nodes that need to move.
+    """
+    pos = pos.copy()
+    moving = np.flatnonzero(movable)
+    if moving.size == 0 or iterations == 0:
+        return pos
+    # Only edges touching a moving node produce a displacement
+    src = np.concatenate(pairs)
+    dst = np.concatenate(pairs[::-1])
+    touch = movable[src]
+    src, dst = src[touch], dst[touch]
+    row_of = np.full(pos.shape[0], -1)
+    row_of[moving] = np.arange(moving.size)
+
+    span = np.ptp(pos, axis=0).max() if pos.shape[0] > 1 else 1.0
+    temperatures = np.linspace(0.1 * span, 0.0, iterations + 1)[:-1]
+    for temp in temperatures:
+        delta = pos[moving, None, :] - pos[None, :, :]
+        dist = np.maximum(np.linalg.norm(delta, axis=-1), 1e-3)
+        disp = np.einsum("ij,ijk->ik", k**2 / dist**2, delta)
+
+        edge_delta = pos[src] - pos[dst]
+        edge_dist = np.maximum(np.linalg.norm(edge_delta, axis=-1), 1e-3)
+        attraction = edge_delta * (edge_dist / k)[:, None]
+        np.subtract.at(disp, row_of[src], attraction)
+
+        length = np.maximum(np.linalg.norm(disp, axis=-1), 1e-9)
+        pos[moving] += disp * (np.minimum(length, temp) / length)[:, None]
+    return pos
+
+
+def _blank_figure(
+    node_size: float,
+) -> tuple[Figure, Axes, tuple[LineCollection, PathCollection]]:
+    """Return a figure on the Agg canvas, with empty edges and nodes."""
+    fig = Figure(figsize=(6, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.set_axis_off()
+    lines = LineCollection([], colors="0.6", linewidths=0.6, zorder=1)
+    ax.add_collection(lines)
+    nodes = ax.scatter([], [], s=node_size, zorder=2)
+    return fig, ax, (lines, nodes)
+
+
+def _draw_frame(
+    ax: Axes,
+    artists: tuple[LineCollection, PathCollection],
+    pos: NDArray[np.float64],
+    edges: tuple[NDArray[np.int64], NDArray[np.int64]],
+) -> None:
+    """Move the edges and the present nodes, and fit the axes limits."""
+    lines, nodes = artists
+    low, high = edges
+    present = np.zeros(pos.shape[0], dtype=bool)
+    present[low] = present[high] = True
+    lines.set_segments(list(np.stack([pos[low], pos[high]], axis=1)))
+    nodes.set_offsets(pos[present])
+    bottom, top = pos.min(axis=0), pos.max(axis=0)
+    margin = 0.05 * np.maximum(top - bottom, 1e-6)
+    ax.set_xlim(bottom[0] - margin[0], top[0] + margin[0])
+    ax.set_ylim(bottom[1] - margin[1], top[1] + margin[1])
+
+
+def export_animation(
+    series: GraphTimeSeries,
+    out_path: Path | str,
+    *,
+    fps: int = 10,
+    max_iterations: int = 30,
+    dpi: int = 100,
+    node_size: float = 20.0,
+    seed: int | None = None,
+) -> NDArray[np.float64]:
+    """Write a graph time-series to a video or a sequence of frames.
+
+    The layout of each frame is warm-started from the positions of the
+    previous one: only the endpoints of edges that appeared or disappeared
+    (and their neighbours) are moved, for a number of iterations
+    proportional to the fraction of changed edges. Frames without changes
+    reuse the previous positions. Edges and nodes are drawn as single
+    collections updated in place, on the non-interactive Agg canvas.
+
+    Parameters:
+        series: the graph time-series.
+        out_path: a ".gif" or ".mp4" file (the latter requires ffmpeg), or
+            a directory where one PNG per frame is written.
+        fps: frames per second of the video.
+        max_iterations: layout iterations for the first frame, and upper
+            bound for the following ones.
+        dpi: resolution of the frames.
+        node_size: marker size of the nodes.
+        seed: optional, the seed for the initial positions.
+
+    Returns:
+        The node positions, an array of shape (n_frames, n_nodes, 2).
+    """
+    out_path = Path(out_path)
+    n_nodes = len(series.nodes)
+    rng = np.random.default_rng(seed)
+    k = 1 / np.sqrt(max(n_nodes, 1))
+    pos = rng.random((n_nodes, 2))
+    positions = np.empty((len(series), n_nodes, 2))
+
+    fig, ax, (lines, nodes) = _blank_figure(node_size)
+
+    suffix = out_path.suffix.lower()
+    writer = None
+    if suffix in VIDEO_WRITERS:
+        writer = VIDEO_WRITERS[suffix](fps=fps)
+        writer.setup(fig, str(out_path), dpi=dpi)
+    else:
+        out_path.mkdir(parents=True, exist_ok=True)
+
+    # The writer is finished, and a partial video removed, on errors too
+    completed = False
+    try:
+        prev_keys = np.empty(0, dtype=np.int64)
+        for t in range(len(series)):
+            keys, low, high = _undirected_pairs(series.frame_edges(t), n_nodes)
+            changed = np.setxor1d(keys, prev_keys, assume_unique=True)
+            if t == 0:
+                iterations = max_iterations
+                movable = np.ones(n_nodes, dtype=bool)
+            else:
+                frac = changed.size / max(keys.size + prev_keys.size, 1)
+                iterations = int(np.ceil(max_iterations * frac))
+                movable = _movable_nodes(changed, (low, high), n_nodes)
+            pos = _spring_layout_step(pos, (low, high), movable, iterations, k)
+            positions[t] = pos
+            prev_keys = keys
+
+            _draw_frame(ax, (lines, nodes), pos, (low, high))
+            if writer is not None:
+                writer.grab_frame()
+            else:
+                fig.savefig(out_path / f"frame_{t:06d}.png", dpi=dpi)
+
+        completed = True
+    finally:
+        if writer is not None and completed:
+            writer.finish()
+        elif writer is not None:
+            # Stops the encoder; its own errors would hide the first one
+            with contextlib.suppress(Exception):
+                writer.finish()
+            out_path.unlink(missing_ok=True)
+        fig.clear()
+    return positions
@@ -7,7 +7,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .graph import Graph
 
-import networkx as nx
+from .distance_sampling import estimate_closeness
+from .lazy import nx
 
 
 def degree_centrality(graph: Graph) -> dict[int, float]:
@@ -85,12 +86,24 @@ def h_index_centrality(graph: Graph) -> dict[int, int]:
     return centrality
 
 
-def closeness_centrality(graph: Graph) -> dict[int, float]:
+def closeness_centrality(
+    graph: Graph,
+    *,
+    precision: float | None = None,
+    confidence: float = 0.95,
+    max_sources: int | None = None,
+    seed: int | None = None,
+) -> dict[int, float]:
     """Return the closeness centrality of each node.
 
     Closeness centrality of node i is defined as the reciprocal of the average
     shortest path distance from i to all other reachable nodes.
 
+    With `precision`, the distances are estimated from BFS of sampled
+    sources, until the average distance to each node is known within that
+    relative precision at the `confidence` level, or `max_sources` sources
+    are drawn. This avoids the BFS from every node on large graphs.
+
     Example:
 
         .. testcode:: centr-close-test
@@ -110,6 +123,14 @@ def closeness_centrality(graph: Graph) -> dict[int, float]:
             import numpy as np
             assert np.isclose(dict_centrality[0], 0.6428571428571429)
     """
+    if precision is not None:
+        return estimate_closeness(
+            graph,
+            precision=precision,
+            confidence=confidence,
+            max_sources=max_sources,
+            seed=seed,
+        )
     return dict(nx.closeness_centrality(graph.nx_graph))
 
 
@@ -142,3 +163,102 @@ def betweenness_centrality(graph: Graph) -> dict[int, float]:
             assert np.isclose(dict_centrality[0], 0.2731481481481481)
     """
     return dict(nx.betweenness_centrality(graph.nx_graph, normalized=True))
+
+
+def eigenvector_centrality(graph: Graph) -> dict[int, float]:
+    """Return the eigenvector centrality of each node.
+
+    The eigenvector centrality of node i is the i-th component of the
+    leading eigenvector of the (weighted) adjacency matrix, normalized to
+    unit Euclidean norm. In directed graphs it is computed from the
+    in-edges.
+
+    Example:
+
+        .. testcode:: centr-eig-test
+
+            from graph_time_series import Graph
+            from graph_time_series.observables import eigenvector_centrality
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            ad_mat = random_adj_matrix_er(n=10, seed=42)
+            graph = Graph(ad_mat)
+
+            dict_centrality = eigenvector_centrality(graph)
+
+        .. testcode:: centr-eig-test
+            :hide:
+
+            import numpy as np
+            values = list(dict_centrality.values())
+            assert np.isclose(np.linalg.norm(values), 1)
+    """
+    return dict(
+        nx.eigenvector_centrality(
+            graph.nx_graph, max_iter=1000, weight="weight"
+        )
+    )
+
+
+def katz_centrality(
+    graph: Graph, alpha: float = 0.1, beta: float = 1.0
+) -> dict[int, float]:
+    """Return the Katz centrality of each node.
+
+    The Katz centrality solves x = alpha A^T x + beta: it counts the walks
+    ending at each node, those of length l weighted by alpha^l. Values are
+    normalized to unit Euclidean norm. alpha must be smaller than the
+    inverse of the largest eigenvalue of A.
+
+    Example:
+
+        .. testcode:: centr-katz-test
+
+            from graph_time_series import Graph
+            from graph_time_series.observables import katz_centrality
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            ad_mat = random_adj_matrix_er(n=10, seed=42)
+            graph = Graph(ad_mat)
+
+            dict_centrality = katz_centrality(graph)
+
+        .. testcode:: centr-katz-test
+            :hide:
+
+            assert all(value > 0 for value in dict_centrality.values())
+    """
+    return dict(
+        nx.katz_centrality(
+            graph.nx_graph, alpha=alpha, beta=beta, weight="weight"
+        )
+    )
+
+
+def pagerank_centrality(graph: Graph, alpha: float = 0.85) -> dict[int, float]:
+    """Return the PageRank of each node.
+
+    The PageRank is the stationary distribution of a random walk that
+    follows the (weighted) out-edges with probability alpha, and jumps to
+    a random node otherwise. Values sum to 1.
+
+    Example:
+
+        .. testcode:: centr-pagerank-test
+
+            from graph_time_series import Graph
+            from graph_time_series.observables import pagerank_centrality
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            ad_mat = random_adj_matrix_er(n=10, seed=42)
+            graph = Graph(ad_mat)
+
+            dict_centrality = pagerank_centrality(graph)
+
+        .. testcode:: centr-pagerank-test
+            :hide:
+
+            import numpy as np
+            assert np.isclose(sum(dict_centrality.values()), 1)
+    """
+    return dict(nx.pagerank(graph.nx_graph, alpha=alpha, weight="weight"))
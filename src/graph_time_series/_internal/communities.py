@@ -0,0 +1,338 @@
+"""Communities tracked across frames, by warm-started modularity moves.
+
+Each frame is partitioned with the Louvain method: nodes are moved to the
+neighbouring community that most increases the modularity, then the
+communities are merged into nodes of an aggregated graph, and so on. From
+the second frame on, the node moves start from the partition of the
+previous frame and only revisit the nodes whose edges changed, and the
+nodes around those that move. Communities left disconnected are split into
+their connected components. Finally, each community takes the id of the
+previous community it overlaps most, so that ids are stable over time.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import NDArray
+    from scipy.sparse import sparray
+
+    from .timeseries import GraphTimeSeries
+
+import numpy as np
+
+from .lazy import csgraph, sparse
+
+# Smallest modularity gain (times 2m) for a node to change community
+_MIN_GAIN = 1e-10
+
+
+class CommunityTracking(NamedTuple):
+    """Communities of the nodes over time, with stable ids.
+
+    `labels` has shape (n_frames, n_nodes_total): entry (t, i) is the id of
+    the community of node i in frame t, -1 if the node has no edges there.
+    `modularity` has shape (n_frames,), NaN for frames without edges.
+    """
+
+    labels: NDArray[np.int64]
+    modularity: NDArray[np.float64]
+
+
+def _undirected(series: GraphTimeSeries, t: int, n_nodes: int) -> sparray:
+    """Return the symmetric weight matrix of a frame.
+
+    Directed frames are symmetrized, summing the weights of both
+    directions.
+    """
+    adjacency = series.frame_edges(t).to_sparse(n_nodes).astype(np.float64)
+    if series.directed:
+        diagonal = sparse.diags_array(adjacency.diagonal())
+        adjacency = adjacency + adjacency.T - diagonal
+    return sparse.csr_array(adjacency)
+
+
+def _best_community(
+    links: dict[int, float], total: list[float], current: int, scale: float
+) -> int:
+    """Return the community of largest modularity gain for a node.
+
+    `links` is the weight from the node to each neighbouring community,
+    and `total` the degree of each community, without the node.
+    """
+    best = current
+    best_gain = links.get(current, 0.0) - scale * total[current]
+    for community, weight in links.items():
+        gain = weight - scale * total[community]
+        if gain > best_gain + _MIN_GAIN:
+            best, best_gain = community, gain
+    return best
+
+
+def _local_moving(
+    adjacency: sparray,
+    degree: NDArray[np.float64],
+    labels: NDArray[np.int64],
+    queue: Iterable[int],
+    resolution: float,
+) -> bool:
+    """Move the queued nodes to their best community, in place.
+
+    A node that moves queues its neighbours outside its new community.
+    The row of a node is read from the adjacency when it is first
+    dequeued, so that a short queue costs little on a large graph. Labels
+    must be smaller than the number of nodes. Returns whether any node
+    moved.
+    """
+    n_nodes = degree.size
+    two_m = float(degree.sum())
+    indptr, indices, data = adjacency.indptr, adjacency.indices, adjacency.data
+    rows: dict[int, tuple[list[int], list[float]]] = {}
+    label, strength = labels.tolist(), degree.tolist()
+    total = np.bincount(labels, weights=degree, minlength=n_nodes).tolist()
+    pending = deque(queue)
+    queued = [False] * n_nodes
+    for i in pending:
+        queued[i] = True
+    moved = False
+    while pending:
+        i = pending.popleft()
+        queued[i] = False
+        row = rows.get(i)
+        if row is None:
+            start, stop = indptr[i], indptr[i + 1]
+            row = rows[i] = (
+                indices[start:stop].tolist(),
+                data[start:stop].tolist(),
+            )
+        neighbours, weights = row
+        links: dict[int, float] = {}
+        for j, weight in zip(neighbours, weights):
+            if j != i:
+                links[label[j]] = links.get(label[j], 0.0) + weight
+        current, k_i = label[i], strength[i]
+        total[current] -= k_i
+        scale = resolution * k_i / two_m
+        best = _best_community(links, total, current, scale)
+        total[best] += k_i
+        if best == current:
+            continue
+        label[i] = best
+        moved = True
+        for j in neighbours:
+            if not queued[j] and label[j] != best:
+                queued[j] = True
+                pending.append(j)
+    if moved:
+        labels[:] = label
+    return moved
+
+
+def _louvain(
+    adjacency: sparray,
+    degree: NDArray[np.float64],
+    labels: NDArray[np.int64],
+    queue: Iterable[int],
+    resolution: float,
+) -> NDArray[np.int64]:
+    """Return the partition found from `labels`, moving `queue` first.
+
+    After the node moves, the communities are aggregated and moved as
+    single nodes, until no aggregated node moves. When no node moves, e.g.
+    when a warm start is already optimal, there is nothing to aggregate.
+    """
+    labels = labels.copy()
+    if not _local_moving(adjacency, degree, labels, queue, resolution):
+        return labels
+    while True:
+        _, members = np.unique(labels, return_inverse=True)
+        n_communities = int(members.max(initial=-1)) + 1
+        membership = sparse.csr_array(
+            (np.ones(members.size), (np.arange(members.size), members)),
+            shape=(members.size, n_communities),
+        )
+        aggregated = sparse.csr_array(membership.T @ adjacency @ membership)
+        aggregated_labels = np.arange(n_communities)
+        if not _local_moving(
+            aggregated,
+            np.bincount(
+                members, weights=degree, minlength=n_communities
+            ).astype(np.float64),
+            aggregated_labels,
+            range(n_communities),
+            resolution,
+        ):
+            return labels
+        labels = aggregated_labels[members]
+
+
+def _split_disconnected(
+    adjacency: sparray, labels: NDArray[np.int64]
+) -> NDArray[np.int64]:
+    """Return labels where each community is connected."""
+    coo = adjacency.tocoo()
+    inside = labels[coo.row] == labels[coo.col]
+    intra = sparse.coo_array(
+        (coo.data[inside], (coo.row[inside], coo.col[inside])),
+        shape=adjacency.shape,
+    )
+    _, components = csgraph.connected_components(intra, directed=False)
+    return components.astype(np.int64)
+
+
+def _modularity(
+    adjacency: sparray,
+    degree: NDArray[np.float64],
+    labels: NDArray[np.int64],
+    resolution: float,
+) -> float:
+    """Return the modularity of a partition; self-loops count twice."""
+    two_m = degree.sum()
+    if two_m == 0:
+        return np.nan
+    coo = adjacency.tocoo()
+    inside = labels[coo.row] == labels[coo.col]
+    weight_in = (
+        coo.data[inside].sum() + coo.data[inside & (coo.row == coo.col)].sum()
+    )
+    totals = np.bincount(labels, weights=degree)
+    return float(
+        weight_in / two_m - resolution * np.sum((totals / two_m) ** 2)
+    )
+
+
+def _match_ids(
+    previous: NDArray[np.int64],
+    communities: NDArray[np.int64],
+    next_id: int,
+) -> tuple[NDArray[np.int64], int]:
+    """Give each community the id of the previous one it overlaps most.
+
+    Pairs are matched greedily by decreasing overlap, each previous id
+    being used at most once; unmatched communities get new ids. Entries
+    -1 are absent nodes.
+    """
+    both = (previous >= 0) & (communities >= 0)
+    pairs, overlap = np.unique(
+        np.stack([communities[both], previous[both]]),
+        axis=1,
+        return_counts=True,
+    )
+    ids: dict[int, int] = {}
+    used: set[int] = set()
+    for p in np.argsort(-overlap, kind="stable").tolist():
+        new, old = int(pairs[0, p]), int(pairs[1, p])
+        if new not in ids and old not in used:
+            ids[new] = old
+            used.add(old)
+    for community in np.unique(communities[communities >= 0]).tolist():
+        if community not in ids:
+            ids[community] = next_id
+            next_id += 1
+    tracked = np.full(communities.size, -1, dtype=np.int64)
+    present = communities >= 0
+    tracked[present] = [ids[c] for c in communities[present].tolist()]
+    return tracked, next_id
+
+
+def track_communities(
+    series: GraphTimeSeries,
+    resolution: float = 1.0,
+    *,
+    warm_start: bool = True,
+) -> CommunityTracking:
+    """Return the communities of the nodes in each frame, tracked in time.
+
+    The partition of each frame maximizes the modularity with the Louvain
+    method. With `warm_start`, the optimization of a frame starts from the
+    partition of the previous frame and only re-evaluates the nodes whose
+    edges changed (and, as they move, their neighbours), which is faster
+    and avoids spurious jumps of the partition between similar frames.
+    Directed frames are symmetrized, and nodes without edges in a frame
+    are left out of it.
+
+    Community ids are consistent in time: each community of a frame takes
+    the id of the community of the previous frame with which it shares
+    the most nodes, if not taken by a larger overlap; communities that
+    appear, e.g. by splitting, get new ids.
+
+    Parameters:
+        series: the graph time-series.
+        resolution: the resolution of the modularity; larger values give
+            smaller communities.
+        warm_start: whether to start each frame from the previous
+            partition, rather than from singletons.
+
+    Returns:
+        A CommunityTracking with the (n_frames, n_nodes_total) labels and
+        the modularity of the partition of each frame.
+
+    Example:
+
+        .. testcode:: communities-test
+
+            import numpy as np
+            from graph_time_series import GraphTimeSeries
+            from graph_time_series.observables import track_communities
+
+            rng = np.random.default_rng(0)
+            blocks = np.repeat(np.arange(3), 10)
+            p = np.where(blocks[:, None] == blocks, 0.8, 0.02)
+            series = GraphTimeSeries(
+                [np.triu(rng.random((30, 30)) < p, 1) for _ in range(5)]
+            )
+            tracking = track_communities(series)
+
+        .. testcode:: communities-test
+            :hide:
+
+            # One community per block, with the same ids in all frames
+            for labels in tracking.labels:
+                assert np.array_equal(labels, tracking.labels[0])
+                assert len(set(labels)) == 3
+                assert len(set(zip(labels, blocks))) == 3
+    """
+    n_nodes = series.n_nodes_total()
+    labels = np.full((len(series), n_nodes), -1, dtype=np.int64)
+    modularity = np.full(len(series), np.nan)
+    previous = np.full(n_nodes, -1, dtype=np.int64)
+    last_adjacency = sparse.csr_array((n_nodes, n_nodes))
+    next_id = 0
+    for t in range(len(series)):
+        adjacency = _undirected(series, t, n_nodes)
+        # Self-loops count twice in the degrees
+        degree = (
+            np.asarray(adjacency.sum(axis=1)).ravel() + adjacency.diagonal()
+        )
+        present = degree > 0
+        if not present.any():
+            previous = labels[t]
+            continue
+
+        if warm_start and t > 0:
+            # Previous communities, as the index of one of their nodes
+            seeded = np.flatnonzero(previous >= 0)
+            _, first, inverse = np.unique(
+                previous[seeded], return_index=True, return_inverse=True
+            )
+            start = np.arange(n_nodes)
+            start[seeded] = seeded[first][inverse]
+            changed = np.asarray((adjacency != last_adjacency).sum(axis=1))
+            affected = (changed.ravel() > 0) | (previous < 0)
+            queue = np.flatnonzero(affected & present)
+        else:
+            start = np.arange(n_nodes)
+            queue = np.flatnonzero(present)
+        partition = _louvain(
+            adjacency, degree, start, queue.tolist(), resolution
+        )
+        partition = _split_disconnected(adjacency, partition)
+        modularity[t] = _modularity(adjacency, degree, partition, resolution)
+        partition[~present] = -1
+        labels[t], next_id = _match_ids(previous, partition, next_id)
+        previous, last_adjacency = labels[t], adjacency
+    return CommunityTracking(labels, modularity)
@@ -0,0 +1,413 @@
+"""Coreness (k-core index) of the nodes, frame by frame.
+
+The coreness of a node is the largest k such that the node belongs to the
+k-core, the maximal subgraph where all the nodes have degree >= k. It is
+the fixed point of the iterated H-index operator, whose first step is
+`h_index_centrality`. Edge weights and self-loops are ignored; in
+directed graphs the degree is the sum of the in- and out-degrees, as in
+networkx.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .frames import FrameEdges
+    from .graph import Graph
+    from .timeseries import GraphTimeSeries
+
+import heapq
+
+import numpy as np
+
+from .frames import edges_from_graph
+
+# Gap between consecutive ranks of the k-order, to insert nodes in between
+_RANK_SPACING = 2**20
+
+
+def _pairs(
+    edges: FrameEdges, directed: bool
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Return the edges as node pairs, once each and without self-loops."""
+    src, dst = edges.src.astype(np.int64), edges.dst.astype(np.int64)
+    keep = src != dst if directed else src < dst
+    return src[keep], dst[keep]
+
+
+def _bucket_cores(
+    pairs: tuple[NDArray[np.int64], NDArray[np.int64]], n_nodes: int
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Return the coreness of all the nodes, and their removal order.
+
+    Batagelj-Zaversnik algorithm: the nodes are kept sorted by current
+    degree in `vert`, with `bin_start` the start of each degree block and
+    `pos` the position of each node. Nodes are removed in order of degree;
+    each removal lowers the degree of the remaining higher-degree
+    neighbours, moving them one block down with a swap. The cost is
+    O(n_nodes + n_edges).
+    """
+    src, dst = pairs
+    # Both directions of each pair, grouped by node (CSR)
+    tails = np.concatenate([src, dst])
+    heads = np.concatenate([dst, src])
+    order = np.argsort(tails, kind="stable")
+    counts = np.bincount(tails, minlength=n_nodes)
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+
+    vert_arr = np.argsort(counts, kind="stable")
+    pos_arr = np.empty(n_nodes, dtype=np.int64)
+    pos_arr[vert_arr] = np.arange(n_nodes)
+    bin_counts = np.bincount(counts, minlength=1)
+    # Plain lists: the loop below is sequential, element by element
+    bin_start = (np.cumsum(bin_counts) - bin_counts).tolist()
+    deg, vert, pos = counts.tolist(), vert_arr.tolist(), pos_arr.tolist()
+    neighbors, bounds = heads[order].tolist(), indptr.tolist()
+
+    for v in vert:
+        for u in neighbors[bounds[v] : bounds[v + 1]]:
+            du = deg[u]
+            if du > deg[v]:
+                # Swap u with the first node of its block, then shrink it
+                pu, pw = pos[u], bin_start[du]
+                w = vert[pw]
+                if u != w:
+                    vert[pu], vert[pw] = w, u
+                    pos[u], pos[w] = pw, pu
+                bin_start[du] += 1
+                deg[u] = du - 1
+    return np.array(deg, dtype=np.int64), np.array(vert, dtype=np.int64)
+
+
+def coreness(graph: Graph) -> dict[int, int]:
+    """Return the coreness (k-core index) of each node.
+
+    The coreness of node i is the largest k such that i belongs to the
+    k-core of the graph, the maximal subgraph in which every node has at
+    least k neighbours. Same as networkx.core_number, in linear time.
+
+    Example:
+
+        .. testcode:: coreness-test
+
+            from graph_time_series import Graph
+            from graph_time_series.observables import coreness
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            ad_mat = random_adj_matrix_er(n=10, seed=42)
+            graph = Graph(ad_mat)
+
+            dict_coreness = coreness(graph)
+
+        .. testcode:: coreness-test
+            :hide:
+
+            import networkx as nx
+            assert dict_coreness == nx.core_number(graph.nx_graph)
+    """
+    nodes = list(graph.nx_graph.nodes)
+    n_nodes = max(nodes, default=-1) + 1
+    cores, _ = _bucket_cores(
+        _pairs(edges_from_graph(graph), graph.directed), n_nodes
+    )
+    return {node: int(cores[node]) for node in nodes}
+
+
+class _DynamicCores:
+    """Coreness maintained under single edge insertions and deletions.
+
+    Order-based algorithm of Zhang et al. (2017). Besides the cores, a
+    k-order is kept: an order of the nodes, by coreness then by `rank`,
+    in which they could be removed by the bucket algorithm. `later` counts
+    the neighbours of each node after it in the order, and never exceeds
+    its coreness; an order with this property proves that the cores are
+    correct. Adding an edge increments `later` for its earlier end, and
+    only if that exceeds the coreness k the nodes of coreness k that
+    follow, reachable through forward edges, are scanned in order; those
+    that keep more than k neighbours after them move to coreness k + 1.
+    Removing an edge only peels off the nodes left with less than k
+    neighbours of coreness >= k, which move to coreness k - 1.
+
+    Ranks are sparse integers, so that nodes can be moved between two
+    others; they are renumbered when there is no room left. Adjacency is
+    kept as a multigraph, so that reciprocal edges of directed graphs
+    count twice. `work` counts the adjacency entries scanned, to be
+    compared with the cost of a full decomposition.
+    """
+
+    def __init__(self, n_nodes: int) -> None:
+        self.adj: list[dict[int, int]] = [{} for _ in range(n_nodes)]
+        self.core = [0] * n_nodes
+        self.rank = [i * _RANK_SPACING for i in range(n_nodes)]
+        self.later = [0] * n_nodes
+        self.low = 0
+        self.high = (n_nodes - 1) * _RANK_SPACING
+        self.work = 0
+
+    def reset(
+        self,
+        pairs: tuple[NDArray[np.int64], NDArray[np.int64]],
+        core: NDArray[np.int64],
+        order: NDArray[np.int64],
+    ) -> None:
+        """Set the result of a full decomposition of the current edges."""
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        src, dst = pairs
+        first = np.where(rank[src] < rank[dst], src, dst)
+        self.core = core.tolist()
+        self.rank = (rank * _RANK_SPACING).tolist()
+        self.later = np.bincount(first, minlength=order.size).tolist()
+        self.low, self.high = 0, (order.size - 1) * _RANK_SPACING
+
+    def link(self, u: int, v: int, step: int) -> None:
+        """Add (step=1) or remove (step=-1) an edge, keeping the cores."""
+        for a, b in ((u, v), (v, u)):
+            count = self.adj[a].get(b, 0) + step
+            if count:
+                self.adj[a][b] = count
+            else:
+                del self.adj[a][b]
+
+    def _first(self, u: int, v: int) -> int:
+        """Return the end of the edge that comes first in the order."""
+        core, rank = self.core, self.rank
+        return u if (core[u], rank[u], u) < (core[v], rank[v], v) else v
+
+    def _renumber(self) -> None:
+        """Spread the ranks evenly again, keeping the order."""
+        core, rank = self.core, self.rank
+        order = sorted(range(len(rank)), key=lambda x: (core[x], rank[x], x))
+        for i, node in enumerate(order):
+            rank[node] = i * _RANK_SPACING
+        self.low, self.high = 0, (len(rank) - 1) * _RANK_SPACING
+
+    def _slot(self, prev: int, heap: list[tuple[int, int]]) -> int:
+        """Return a rank after node `prev` and before the nodes in heap."""
+        rank = self.rank
+        if heap and heap[0][0] - rank[prev] < 2:  # noqa: PLR2004
+            self._renumber()
+            heap[:] = [(rank[x], x) for _, x in heap]
+            heapq.heapify(heap)
+        stop = heap[0][0] if heap else rank[prev] + 2 * _RANK_SPACING
+        new = (rank[prev] + stop) // 2
+        # `high` stays above all the ranks, for moves to the end of a level
+        self.high = max(self.high, new)
+        return new
+
+    def insert(self, u: int, v: int) -> None:
+        """Add an edge and raise the coreness of the nodes that gain it."""
+        self.link(u, v, 1)
+        core, adj, rank, later = self.core, self.adj, self.rank, self.later
+        first = self._first(u, v)
+        later[first] += 1
+        k = core[first]
+        if later[first] <= k:
+            return
+        # Scan the nodes of coreness k after `first`, in order; `star`
+        # counts the neighbours before them that are still candidates
+        star = {first: 0}
+        candidates: set[int] = set()
+        heap = [(rank[first], first)]
+        while heap:
+            rank_w, w = heapq.heappop(heap)
+            self.work += len(adj[w])
+            if star[w] + later[w] > k:
+                candidates.add(w)
+                for x, mult in adj[w].items():
+                    if core[x] == k and (rank[x], x) > (rank_w, w):
+                        if x not in star:
+                            star[x] = 0
+                            heapq.heappush(heap, (rank[x], x))
+                        star[x] += mult
+            elif star[w]:
+                # Stays at k, with the candidates before it after it
+                self._withdraw(w, k, candidates, star, heap)
+        for c in sorted(candidates, key=lambda x: (rank[x], x), reverse=True):
+            # At the start of the nodes of coreness k + 1
+            self.low -= _RANK_SPACING
+            rank[c] = self.low
+            core[c] = k + 1
+
+    def _release(
+        self,
+        w: int,
+        k: int,
+        candidates: set[int],
+        star: dict[int, int],
+        was_candidate: bool,
+    ) -> list[int]:
+        """Settle w at coreness k, before all the remaining candidates.
+
+        Returns the candidates left without enough neighbours after them.
+        """
+        rank, later = self.rank, self.later
+        key_w = (rank[w], w)
+        self.work += len(self.adj[w])
+        evicted = []
+        for x, mult in self.adj[w].items():
+            if x in candidates:
+                if (rank[x], x) < key_w:
+                    later[x] -= mult
+                else:
+                    star[x] -= mult
+                if star[x] + later[x] <= k:
+                    evicted.append(x)
+            elif was_candidate and x in star and (rank[x], x) > key_w:
+                # Not scanned yet
+                star[x] -= mult
+        later[w] += star[w]
+        star[w] = 0
+        return evicted
+
+    def _withdraw(
+        self,
+        w: int,
+        k: int,
+        candidates: set[int],
+        star: dict[int, int],
+        heap: list[tuple[int, int]],
+    ) -> None:
+        """Settle w, and the candidates that can no longer follow it.
+
+        Each evicted candidate stays at coreness k, and is moved right
+        after the last node settled.
+        """
+        evicted = self._release(w, k, candidates, star, was_candidate=False)
+        prev = w
+        while evicted:
+            c = evicted.pop()
+            if c not in candidates:
+                continue
+            candidates.remove(c)
+            evicted += self._release(
+                c, k, candidates, star, was_candidate=True
+            )
+            self.rank[c] = self._slot(prev, heap)
+            prev = c
+
+    def delete(self, u: int, v: int) -> None:
+        """Remove an edge and lower the coreness of the nodes that lose it."""
+        first = self._first(u, v)
+        self.link(u, v, -1)
+        core, adj, rank, later = self.core, self.adj, self.rank, self.later
+        later[first] -= 1
+        k = min(core[u], core[v])
+        support = {w: self._support(w, k) for w in (u, v) if core[w] == k}
+        stack = [w for w, s in support.items() if s < k]
+        while stack:
+            w = stack.pop()
+            if core[w] != k:
+                continue
+            # At the end of the nodes of coreness k - 1
+            key_w = (rank[w], w)
+            core[w] = k - 1
+            later[w] = support[w]
+            self.high += _RANK_SPACING
+            rank[w] = self.high
+            self.work += len(adj[w])
+            for x, mult in adj[w].items():
+                if core[x] != k:
+                    continue
+                if (rank[x], x) < key_w:
+                    later[x] -= mult
+                if x in support:
+                    support[x] -= mult
+                else:
+                    # Counted after the drop of w
+                    support[x] = self._support(x, k)
+                if support[x] < k:
+                    stack.append(x)
+
+    def _support(self, w: int, k: int) -> int:
+        """Return the number of neighbours of w with coreness >= k."""
+        core = self.core
+        self.work += len(self.adj[w])
+        return sum(mult for x, mult in self.adj[w].items() if core[x] >= k)
+
+
+def _pair_keys(
+    pairs: tuple[NDArray[np.int64], NDArray[np.int64]], n_nodes: int
+) -> NDArray[np.int64]:
+    return pairs[0] * n_nodes + pairs[1]
+
+
+def coreness_over_time(
+    series: GraphTimeSeries, *, incremental: bool = True
+) -> NDArray[np.int64]:
+    """Return the coreness of every node, in every frame.
+
+    The first frame is decomposed with the Batagelj-Zaversnik bucket
+    algorithm, in O(n_nodes + n_edges). With `incremental`, the following
+    frames are obtained from the previous one by applying the edges
+    removed and added in between, one at a time; since consecutive frames
+    usually share most of their edges and the update of each edge only
+    visits a small part of the graph, this is much cheaper than a full
+    decomposition. When the updates of a frame have scanned as many
+    adjacency entries as a full decomposition would, the frame is
+    decomposed from scratch instead.
+
+    Parameters:
+        series: the graph time-series.
+        incremental: whether to update the coreness between consecutive
+            frames, rather than recomputing it.
+
+    Returns:
+        An int64 array of shape (n_frames, n_nodes_total). Nodes without
+        edges in a frame have coreness 0.
+
+    Example:
+
+        .. testcode:: coreness-over-time-test
+
+            from graph_time_series import GraphTimeSeries
+            from graph_time_series.observables import coreness_over_time
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_er(n=20, seed=i) for i in range(5)]
+            )
+            cores = coreness_over_time(series)
+
+        .. testcode:: coreness-over-time-test
+            :hide:
+
+            import networkx as nx
+            for t in range(len(series)):
+                expected = nx.core_number(series[t].nx_graph)
+                assert all(cores[t, i] == k for i, k in expected.items())
+    """
+    n_nodes = series.n_nodes_total()
+    result = np.zeros((len(series), n_nodes), dtype=np.int64)
+    dynamic = _DynamicCores(n_nodes)
+    previous = np.empty(0, dtype=np.int64)
+    for t in range(len(series)):
+        pairs = _pairs(series.frame_edges(t), series.directed)
+        if not incremental:
+            result[t] = _bucket_cores(pairs, n_nodes)[0]
+            continue
+
+        keys = np.unique(_pair_keys(pairs, n_nodes))
+        removed = np.setdiff1d(previous, keys, assume_unique=True)
+        added = np.setdiff1d(keys, previous, assume_unique=True)
+        previous = keys
+        # A full decomposition scans each of the 2 * n_pairs entries once
+        budget = 2 * keys.size if t > 0 else -1
+        dynamic.work = 0
+        for step, changes in ((-1, removed), (1, added)):
+            for key in changes.tolist():
+                u, v = divmod(key, n_nodes)
+                if dynamic.work > budget:
+                    dynamic.link(u, v, step)
+                elif step < 0:
+                    dynamic.delete(u, v)
+                else:
+                    dynamic.insert(u, v)
+        if dynamic.work > budget:
+            dynamic.reset(pairs, *_bucket_cores(pairs, n_nodes))
+        result[t] = dynamic.core
+    return result
@@ -0,0 +1,338 @@
+"""Distances estimated by breadth-first search from sampled sources.
+
+The exact average distance and closeness need a BFS from every node, which
+is out of reach on frames with millions of nodes. Here the BFS run from
+sources drawn at random without replacement, a batch at a time, and the
+sampling stops as soon as the confidence interval of the estimate is
+narrower than the requested precision. Once every node has been drawn, the
+estimates are exact.
+"""
+
+from __future__ import annotations
+
+from statistics import NormalDist
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from numpy.typing import NDArray
+    from scipy.sparse import sparray
+
+    from .graph import Graph
+
+import numpy as np
+
+from .lazy import csgraph, nx, sparse
+
+# Distances held in memory by a batch of BFS, and most sources per batch
+_BATCH_ENTRIES = 2**22
+# Sources drawn before the first stopping test (normal approximation)
+_MIN_SOURCES = 30
+
+
+class DistanceEstimate(NamedTuple):
+    """The average shortest distance, estimated from sampled sources.
+
+    `mean` is the average distance over the pairs of connected nodes and
+    `interval` its confidence interval, from `n_sources` BFS sources. The
+    connected components are ordered by decreasing size: their number of
+    nodes (`component_sizes`), of sources drawn (`component_sources`) and
+    their estimated average distance (`component_means`, NaN for isolated
+    nodes and for components without sources).
+    """
+
+    mean: float
+    interval: tuple[float, float]
+    n_sources: int
+    component_sizes: NDArray[np.int64]
+    component_sources: NDArray[np.int64]
+    component_means: NDArray[np.float64]
+
+
+def _check(precision: float, confidence: float) -> float:
+    """Validate the stopping parameters, return the normal quantile."""
+    if precision < 0:
+        msg = "precision must be non-negative."
+        raise ValueError(msg)
+    if not 0 < confidence < 1:
+        msg = "confidence must be between 0 and 1."
+        raise ValueError(msg)
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def _adjacency(graph: Graph, *, symmetric: bool) -> sparray:
+    """Return the CSR adjacency of a graph, in the order of its nodes.
+
+    With `symmetric`, directed edges are followed both ways; this is far
+    cheaper than converting the networkx graph to undirected.
+    """
+    adjacency = nx.to_scipy_sparse_array(
+        graph.nx_graph, weight=None, format="csr"
+    )
+    if symmetric and graph.directed:
+        adjacency = sparse.csr_array(adjacency + adjacency.T)
+    return adjacency
+
+
+def _hops(adjacency: sparray, source: int) -> NDArray[np.float64]:
+    """Return the number of hops from a source to all nodes, by BFS.
+
+    The depths in the BFS tree are found by pointer jumping on the
+    predecessors, in a logarithmic number of vectorized steps. Unreachable
+    nodes are at infinite distance.
+    """
+    n_nodes = adjacency.shape[0]
+    _, predecessors = csgraph.breadth_first_order(
+        adjacency, source, directed=True, return_predecessors=True
+    )
+    linked = predecessors >= 0
+    # Distance from each node to its ancestor, until all reach the root
+    ancestor = np.where(linked, predecessors, np.arange(n_nodes))
+    depth = linked.astype(np.float64)
+    while True:
+        step = depth[ancestor]
+        if not step.any():
+            break
+        depth += step
+        ancestor = ancestor[ancestor]
+    depth[~linked] = np.inf
+    depth[source] = 0.0
+    return depth
+
+
+def _bfs_batches(
+    adjacency: sparray, *, max_sources: int | None, seed: int | None
+) -> Iterator[tuple[NDArray[np.int64], NDArray[np.float64]]]:
+    """Yield random sources by batches, with their distances to all nodes.
+
+    The BFS follow the edges from row to column. The batches are small
+    enough to keep about _BATCH_ENTRIES distances in memory.
+    """
+    n_nodes = adjacency.shape[0]
+    order = np.random.default_rng(seed).permutation(n_nodes)
+    if max_sources is not None:
+        order = order[:max_sources]
+    batch = min(_MIN_SOURCES, max(1, _BATCH_ENTRIES // max(n_nodes, 1)))
+    for start in range(0, order.size, batch):
+        sources = order[start : start + batch]
+        yield sources, np.stack([_hops(adjacency, s) for s in sources])
+
+
+def _ratio_interval(
+    totals: NDArray[np.float64],
+    reached: NDArray[np.float64],
+    n_nodes: int,
+    z: float,
+) -> tuple[float, float]:
+    """Return the ratio estimate sum(totals) / sum(reached), and its error.
+
+    The half-width of the interval follows from the delta method, with the
+    finite population correction of sampling without replacement.
+    """
+    n_sources = totals.size
+    if reached.sum() == 0:
+        return np.nan, np.nan
+    mean = float(totals.sum() / reached.sum())
+    if n_sources < 2:  # noqa: PLR2004
+        return mean, np.inf
+    residuals = totals - mean * reached
+    variance = (
+        (1 - n_sources / n_nodes)
+        * residuals.var(ddof=1)
+        / (n_sources * reached.mean() ** 2)
+    )
+    return mean, z * float(np.sqrt(variance))
+
+
+def estimate_average_distance(
+    graph: Graph,
+    *,
+    precision: float = 0.01,
+    confidence: float = 0.95,
+    max_sources: int | None = None,
+    seed: int | None = None,
+) -> DistanceEstimate:
+    """Return the average shortest distance, estimated by sampled BFS.
+
+    The distances from a source, divided by the number of nodes it
+    reaches, average to the mean distance over the connected pairs, so
+    that BFS from random sources give an unbiased ratio estimate of it.
+    Sources are drawn until the half-width of the confidence interval is
+    at most `precision` times the estimate, at least 30 of them. Like
+    `average_distance`, edge directions and weights are ignored. On a
+    disconnected graph, the mean runs over the pairs of nodes in the same
+    component, and each component gets its own estimate. Without edges,
+    the mean is NaN.
+
+    Parameters:
+        graph: the graph.
+        precision: the target half-width of the confidence interval,
+            relative to the estimate; 0 draws all the sources.
+        confidence: the confidence level of the interval.
+        max_sources: optional, the largest number of sources to draw.
+        seed: the seed of the sampling of the sources.
+
+    Returns:
+        A DistanceEstimate, with the mean distance, its confidence
+        interval and the estimates of the connected components.
+
+    Raises:
+        ValueError: if precision is negative or confidence not in (0, 1).
+
+    Example:
+
+        .. testcode:: estimate-distance-test
+
+            from graph_time_series import Graph
+            from graph_time_series.observables import (
+                estimate_average_distance,
+            )
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            graph = Graph(random_adj_matrix_er(n=500, p=0.01, seed=0))
+            estimate = estimate_average_distance(graph, precision=0.01)
+
+        .. testcode:: estimate-distance-test
+            :hide:
+
+            import networkx as nx
+            low, high = estimate.interval
+            assert estimate.n_sources < 500
+            assert high - low <= 0.02 * estimate.mean
+            exact = nx.average_shortest_path_length(
+                graph.nx_graph.subgraph(
+                    max(nx.connected_components(graph.nx_graph), key=len)
+                )
+            )
+            assert abs(estimate.mean - exact) < 0.03 * exact
+    """
+    z = _check(precision, confidence)
+    if graph.nx_graph.number_of_edges() == 0:
+        # Isolated nodes, each its own component
+        n_nodes = len(graph.nx_graph)
+        return DistanceEstimate(
+            np.nan,
+            (np.nan, np.nan),
+            0,
+            np.ones(n_nodes, dtype=np.int64),
+            np.zeros(n_nodes, dtype=np.int64),
+            np.full(n_nodes, np.nan),
+        )
+    adjacency = _adjacency(graph, symmetric=True)
+    n_nodes = adjacency.shape[0]
+    n_components, labels = csgraph.connected_components(
+        adjacency, directed=False
+    )
+    # Components by decreasing size
+    sizes = np.bincount(labels, minlength=n_components)
+    by_size = np.argsort(-sizes, kind="stable")
+    rank = np.empty_like(by_size)
+    rank[by_size] = np.arange(n_components)
+    labels, sizes = rank[labels], sizes[by_size]
+
+    drawn = [np.empty(0, dtype=np.int64)]
+    totals, reached = [np.empty(0)], [np.empty(0)]
+    mean, half_width = np.nan, np.nan
+    n_sources = 0
+    for sources, distances in _bfs_batches(
+        adjacency, max_sources=max_sources, seed=seed
+    ):
+        finite = np.isfinite(distances)
+        drawn.append(sources)
+        totals.append(np.where(finite, distances, 0.0).sum(axis=1))
+        reached.append(finite.sum(axis=1) - 1.0)
+        n_sources += sources.size
+        mean, half_width = _ratio_interval(
+            np.concatenate(totals), np.concatenate(reached), n_nodes, z
+        )
+        if n_sources >= _MIN_SOURCES and half_width <= precision * mean:
+            break
+
+    sampled = labels[np.concatenate(drawn)]
+    component_totals = np.bincount(
+        sampled, weights=np.concatenate(totals), minlength=n_components
+    )
+    component_reached = np.bincount(
+        sampled, weights=np.concatenate(reached), minlength=n_components
+    )
+    return DistanceEstimate(
+        mean,
+        (mean - half_width, mean + half_width),
+        n_sources,
+        sizes.astype(np.int64),
+        np.bincount(sampled, minlength=n_components).astype(np.int64),
+        np.divide(
+            component_totals,
+            component_reached,
+            out=np.full(n_components, np.nan),
+            where=component_reached > 0,
+        ),
+    )
+
+
+def estimate_closeness(
+    graph: Graph,
+    *,
+    precision: float = 0.01,
+    confidence: float = 0.95,
+    max_sources: int | None = None,
+    seed: int | None = None,
+) -> dict[int, float]:
+    """Return the closeness centrality of each node, by sampled BFS.
+
+    The closeness of a node is, as in networkx, the fraction of the other
+    nodes that reach it over their average distance to it. Both are
+    estimated from the BFS of random sources, following Eppstein and Wang.
+    Sources are drawn until, for every node reached by two sources or
+    more, the confidence interval of the average distance is at most
+    `precision` times the estimate. Isolated nodes have closeness 0.
+
+    See `estimate_average_distance` for the parameters.
+    """
+    z = _check(precision, confidence)
+    if graph.nx_graph.number_of_edges() == 0:
+        return dict.fromkeys(graph.nx_graph, 0.0)
+    nodes = list(graph.nx_graph)
+    adjacency = _adjacency(graph, symmetric=False)
+    n_nodes = len(nodes)
+    # Sources other than the node itself that reach it, their distances
+    count = np.zeros(n_nodes)
+    total = np.zeros(n_nodes)
+    total_sq = np.zeros(n_nodes)
+    is_source = np.zeros(n_nodes, dtype=bool)
+    n_sources = 0
+    for sources, distances in _bfs_batches(
+        adjacency, max_sources=max_sources, seed=seed
+    ):
+        finite = np.isfinite(distances)
+        hops = np.where(finite, distances, 0.0)
+        count += finite.sum(axis=0)
+        count[sources] -= 1
+        total += hops.sum(axis=0)
+        total_sq += (hops**2).sum(axis=0)
+        is_source[sources] = True
+        n_sources += sources.size
+        if n_sources < _MIN_SOURCES:
+            continue
+        others = n_sources - is_source
+        tested = count >= 2  # noqa: PLR2004
+        mean = total[tested] / count[tested]
+        variance = (total_sq[tested] / count[tested] - mean**2) * (
+            count[tested] / (count[tested] - 1)
+        )
+        correction = 1 - others[tested] / max(n_nodes - 1, 1)
+        half_width = z * np.sqrt(
+            np.maximum(variance, 0) * correction / count[tested]
+        )
+        if np.all(half_width <= precision * mean):
+            break
+
+    others = n_sources - is_source
+    fraction = np.divide(
+        count, others, out=np.zeros(n_nodes), where=others > 0
+    )
+    closeness = np.divide(
+        fraction * count, total, out=np.zeros(n_nodes), where=total > 0
+    )
+    return dict(zip(nodes, closeness.tolist()))
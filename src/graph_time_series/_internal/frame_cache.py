@@ -0,0 +1,85 @@
+"""Bounded cache of materialized frames."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+T = TypeVar("T")
+
+EVICTION_POLICIES = ("lru", "fifo")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a FrameCache, as in functools.lru_cache."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class FrameCache(Generic[T]):
+    """A bounded mapping key -> object, built on demand.
+
+    Attributes:
+    -----------
+    maxsize :
+        Maximum number of objects kept. 0 disables the cache, None makes
+        it unbounded.
+    eviction :
+        "lru" evicts the least recently used object, "fifo" the oldest
+        inserted one.
+    """
+
+    def __init__(
+        self, maxsize: int | None = 128, eviction: str = "lru"
+    ) -> None:
+        """Initialize an empty cache."""
+        if eviction not in EVICTION_POLICIES:
+            msg = f"eviction must be one of {EVICTION_POLICIES}."
+            raise ValueError(msg)
+        if maxsize is not None and maxsize < 0:
+            msg = "maxsize must be non-negative."
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.eviction = eviction
+        self._data: OrderedDict[Hashable, T] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Return the object for `key`, building it if not cached."""
+        if key in self._data:
+            self._hits += 1
+            if self.eviction == "lru":
+                self._data.move_to_end(key)
+            return self._data[key]
+        self._misses += 1
+        value = build()
+        if self.maxsize != 0:
+            self._data[key] = value
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        """Return the number of cached objects."""
+        return len(self._data)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove the object for `key`, if cached."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the cached objects and reset the statistics."""
+        self._data.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self))
@@ -0,0 +1,450 @@
+"""Distances and similarities between the frames of a series.
+
+Frames are flattened into a sparse (n_frames, n_edges) edge-incidence
+matrix, whose columns are all the edges appearing at least once in the
+series. Comparisons between frames then become row-wise sparse operations.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy.typing import NDArray
+    from scipy.sparse import csr_array
+
+    from .timeseries import GraphTimeSeries
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .lazy import sparse
+
+CONSECUTIVE_METRICS = ("jaccard", "edit", "spectral")
+SIMILARITY_METRICS = ("jaccard", "cosine", "deltacon")
+
+# Relative rounding error of the squared DeltaCon distances
+_CANCELLATION_RTOL = 1e-10
+
+
+def edge_incidence_matrix(
+    series: GraphTimeSeries,
+) -> tuple[csr_array, NDArray[np.int64]]:
+    """Return the sparse (n_frames, n_edges) edge-incidence matrix.
+
+    Entry (t, e) is the weight of edge e in frame t. For undirected series,
+    each edge is counted once.
+
+    Parameters:
+        series: the graph time-series.
+
+    Returns:
+        - the incidence matrix, as a scipy CSR array
+        - the edge keys, src * n_nodes + dst, one per column
+
+    Example:
+
+        .. testcode:: incidence-test
+
+            from graph_time_series import GraphTimeSeries
+            from graph_time_series.utilities import (
+                edge_incidence_matrix,
+                random_adj_matrix_er,
+            )
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_er(n=10, seed=i) for i in range(5)]
+            )
+            incidence, keys = edge_incidence_matrix(series)
+
+        .. testcode:: incidence-test
+            :hide:
+
+            assert incidence.shape == (5, keys.size)
+            assert incidence[0].sum() == series[0].nx_graph.number_of_edges()
+    """
+    n_nodes = len(series.nodes)
+    keys, weights, counts = [], [], []
+    for t in range(len(series)):
+        edges = series.frame_edges(t)
+        keep = slice(None) if series.directed else edges.src <= edges.dst
+        keys.append(
+            edges.src[keep].astype(np.int64) * n_nodes + edges.dst[keep]
+        )
+        weights.append(edges.weight[keep].astype(np.float64))
+        counts.append(keys[-1].size)
+
+    all_keys = np.concatenate(keys) if keys else np.empty(0, np.int64)
+    columns, inverse = np.unique(all_keys, return_inverse=True)
+    indptr = np.concatenate([[0], np.cumsum(counts, dtype=np.int64)])
+    data = np.concatenate(weights) if weights else np.empty(0)
+    incidence = sparse.csr_array(
+        (data, inverse.ravel(), indptr), shape=(len(series), columns.size)
+    )
+    incidence.sort_indices()
+    return incidence, columns
+
+
+def consecutive_distances(
+    series: GraphTimeSeries,
+    metrics: Sequence[str] = CONSECUTIVE_METRICS,
+) -> dict[str, NDArray[np.float64]]:
+    """Return distances between each frame and the next one.
+
+    Available metrics:
+
+    - "jaccard": 1 - |E_t & E_t+1| / |E_t | E_t+1|, on the edge sets.
+    - "edit": sum over the edges of |w_t - w_t+1|, the weighted edit
+      distance.
+    - "spectral": the Euclidean distance between the Laplacian spectra,
+      reusing the spectra cached by the series.
+
+    Parameters:
+        series: the graph time-series.
+        metrics: the metrics to compute.
+
+    Returns:
+        A dict metric -> array of shape (n_frames - 1,), whose entry t
+        compares frames t and t + 1.
+
+    Example:
+
+        .. testcode:: consecutive-test
+
+            from graph_time_series import GraphTimeSeries
+            from graph_time_series.observables import consecutive_distances
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_er(n=10, seed=0)] * 3
+                + [random_adj_matrix_er(n=10, seed=1)]
+            )
+            dist = consecutive_distances(series)
+
+        .. testcode:: consecutive-test
+            :hide:
+
+            assert dist["jaccard"][:2].tolist() == [0.0, 0.0]
+            assert dist["jaccard"][2] > 0
+    """
+    unknown = set(metrics) - set(CONSECUTIVE_METRICS)
+    if unknown:
+        msg = f"Unknown metrics {sorted(unknown)}."
+        raise ValueError(msg)
+
+    result: dict[str, NDArray[np.float64]] = {}
+    if "jaccard" in metrics or "edit" in metrics:
+        incidence, _ = edge_incidence_matrix(series)
+        current, following = incidence[:-1], incidence[1:]
+    if "jaccard" in metrics:
+        present = (current != 0).astype(np.float64)
+        present_next = (following != 0).astype(np.float64)
+        inter = np.asarray(present.multiply(present_next).sum(axis=1))
+        sizes = np.diff(present.indptr) + np.diff(present_next.indptr)
+        union = sizes - inter
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result["jaccard"] = np.where(union > 0, 1 - inter / union, 0.0)
+    if "edit" in metrics:
+        result["edit"] = np.asarray(abs(current - following).sum(axis=1))
+    if "spectral" in metrics:
+        spectra = np.array(
+            [series.laplacian_spectrum(t) for t in range(len(series))]
+        ).reshape(len(series), -1)
+        result["spectral"] = np.linalg.norm(np.diff(spectra, axis=0), axis=1)
+    return result
+
+
+def change_point_scores(
+    distances: NDArray[np.float64],
+    window: int = 10,
+) -> NDArray[np.float64]:
+    """Return a robust z-score of each value against the preceding ones.
+
+    Score t is (d_t - median) / (1.4826 * MAD), with median and median
+    absolute deviation (MAD) computed over the `window` preceding values.
+    Large scores mark candidate change points. The first `window` values,
+    without enough history, get a score of 0.
+
+    Parameters:
+        distances: 1-dim array, e.g. one of the consecutive_distances.
+        window: the number of preceding values used as reference.
+
+    Returns:
+        An array with the same shape as `distances`.
+    """
+    if distances.ndim != 1:
+        msg = "Input array has wrong dimension."
+        raise ValueError(msg)
+    scores = np.zeros(distances.shape)
+    if distances.size <= window:
+        return scores
+    history = sliding_window_view(distances[:-1], window)
+    median = np.median(history, axis=1)
+    mad = 1.4826 * np.median(np.abs(history - median[:, None]), axis=1)
+    deviation = distances[window:] - median
+    # A flat history makes any deviation infinitely surprising
+    scale = np.where(mad > 0, mad, np.finfo(np.float64).eps)
+    scores[window:] = deviation / scale
+    return scores
+
+
+def _binary_adjacency(series: GraphTimeSeries, t: int) -> csr_array:
+    """Return the symmetric 0/1 adjacency matrix of frame `t`."""
+    adjacency = series.frame_edges(t).to_sparse(len(series.nodes))
+    return sparse.csr_array((adjacency + adjacency.T) != 0).astype(np.float64)
+
+
+def _deltacon_eps(series: GraphTimeSeries) -> float:
+    """Return eps = 1 / (1 + max degree), common to all the frames."""
+    max_degree = max(
+        (
+            float(_binary_adjacency(series, t).sum(axis=1).max(initial=0))
+            for t in range(len(series))
+        ),
+        default=0.0,
+    )
+    return 1 / (1 + max_degree)
+
+
+def _deltacon_root(series: GraphTimeSeries, t: int, eps: float) -> csr_array:
+    """Return the entrywise square root of the affinity matrix of frame t.
+
+    The FaBP affinity S = [I + eps^2 D - eps A]^-1 of DeltaCon is
+    approximated by its expansion I + eps A + eps^2 (A^2 - D).
+    """
+    adjacency = _binary_adjacency(series, t)
+    square = sparse.csr_array(adjacency @ adjacency)
+    # A^2 - D has a zero diagonal for a simple graph
+    square.setdiag(0)
+    eye = sparse.identity(adjacency.shape[0], format="csr")
+    root = sparse.csr_array(eye + eps * adjacency + eps**2 * square).sqrt()
+    root.sum_duplicates()
+    return root
+
+
+def _deltacon_features(
+    series: GraphTimeSeries, frames: range, eps: float
+) -> csr_array:
+    """Return the flattened sqrt-affinity matrices of `frames`, as rows.
+
+    Entry (i, j) of a frame goes to column i * n_nodes + j, computed in
+    int64 so that n_nodes**2 may exceed the int32 range.
+    """
+    n_nodes = len(series.nodes)
+    data, indices, indptr = [], [], [0]
+    for t in frames:
+        root = _deltacon_root(series, t, eps)
+        rows = np.repeat(
+            np.arange(n_nodes, dtype=np.int64), np.diff(root.indptr)
+        )
+        data.append(root.data)
+        indices.append(rows * n_nodes + root.indices)
+        indptr.append(indptr[-1] + root.nnz)
+    return sparse.csr_array(
+        (
+            np.concatenate(data),
+            np.concatenate(indices),
+            np.array(indptr, dtype=np.int64),
+        ),
+        shape=(len(frames), n_nodes * n_nodes),
+    )
+
+
+def _deltacon_source(
+    series: GraphTimeSeries,
+) -> tuple[Callable[[range], csr_array], NDArray[np.float64], int]:
+    """Return the DeltaCon features builder, squared norms, bytes per frame.
+
+    The affinity matrices are computed one frame at a time, and only their
+    norms and sizes are kept; features are rebuilt for each strip.
+    """
+    eps = _deltacon_eps(series)
+    sq_norms = np.zeros(len(series))
+    max_nnz = 1
+    for t in range(len(series)):
+        root = _deltacon_root(series, t, eps)
+        sq_norms[t] = float(root.power(2).sum())
+        max_nnz = max(max_nnz, root.nnz)
+
+    def features(frames: range) -> csr_array:
+        return _deltacon_features(series, frames, eps)
+
+    # float64 data and int64 indices
+    return features, sq_norms, 16 * max_nnz
+
+
+def _incidence_source(
+    series: GraphTimeSeries, metric: str
+) -> tuple[Callable[[range], csr_array], NDArray[np.float64]]:
+    """Return the edge-incidence features builder and squared norms."""
+    incidence, _ = edge_incidence_matrix(series)
+    if metric == "jaccard":
+        incidence = (incidence != 0).astype(np.float64)
+    sq_norms = np.asarray(incidence.multiply(incidence).sum(axis=1)).ravel()
+
+    def features(frames: range) -> csr_array:
+        return incidence[frames.start : frames.stop]
+
+    return features, sq_norms
+
+
+def _dot(rows: csr_array, cols: csr_array) -> NDArray[np.float64]:
+    """Return the dense product rows @ cols.T.
+
+    Only the columns used by either side are kept, so that the product
+    never allocates arrays as long as the (possibly huge) feature width.
+    """
+    keys = np.concatenate([rows.indices, cols.indices]).astype(np.int64)
+    _, inverse = np.unique(keys, return_inverse=True)
+    width = int(inverse.max(initial=-1)) + 1
+    left = sparse.csr_array(
+        (rows.data, inverse[: rows.nnz], rows.indptr),
+        shape=(rows.shape[0], width),
+    )
+    right = sparse.csr_array(
+        (cols.data, inverse[rows.nnz :], cols.indptr),
+        shape=(cols.shape[0], width),
+    )
+    return (left @ right.T).toarray()
+
+
+def _tile_similarity(
+    features: tuple[csr_array, csr_array],
+    sq_norms: tuple[NDArray[np.float64], NDArray[np.float64]],
+    metric: str,
+) -> NDArray[np.float64]:
+    """Return the similarity block between two sets of frames."""
+    dot = _dot(*features)
+    norm_r, norm_c = sq_norms[0][:, None], sq_norms[1][None, :]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if metric == "jaccard":
+            union = norm_r + norm_c - dot
+            return np.where(union > 0, dot / union, 1.0)
+        if metric == "cosine":
+            norms = np.sqrt(norm_r * norm_c)
+            both_empty = (norm_r == 0) & (norm_c == 0)
+            return np.where(norms > 0, dot / norms, both_empty * 1.0)
+    # DeltaCon: root Euclidean distance between sqrt-affinities. The
+    # expansion cancels catastrophically, below the rounding error is 0
+    sq_distance = norm_r + norm_c - 2 * dot
+    noise = _CANCELLATION_RTOL * (norm_r + norm_c)
+    distance = np.sqrt(np.where(sq_distance > noise, sq_distance, 0.0))
+    return 1 / (1 + distance)
+
+
+def frame_similarity_matrix(
+    series: GraphTimeSeries,
+    metric: str = "jaccard",
+    *,
+    memory_budget: int = 256 * 2**20,
+    out: Path | str | None = None,
+    n_jobs: int = 1,
+) -> NDArray[np.float64]:
+    """Return the (n_frames, n_frames) similarity matrix between frames.
+
+    Frames are flattened into sparse feature rows, and similarities come
+    from sparse products between blocks of rows, computed tile by tile on
+    the upper triangle so that the working memory stays within the budget.
+    The DeltaCon features, n_nodes**2 wide, are built for the frames of
+    each tile only.
+
+    Available metrics:
+
+    - "jaccard": |E_i & E_j| / |E_i | E_j| on the edge sets.
+    - "cosine": cosine similarity of the edge-weight vectors.
+    - "deltacon": DeltaCon-style similarity 1 / (1 + d), with d the
+      root Euclidean distance between the (approximate) FaBP node-affinity
+      matrices of the frames.
+
+    Parameters:
+        series: the graph time-series.
+        metric: the similarity metric.
+        memory_budget: approximate memory, in bytes, for the tiles being
+            computed at the same time.
+        out: optional, a ".npy" file where the matrix is written as a
+            memory-mapped array, for matrices larger than the memory.
+        n_jobs: number of threads computing tiles in parallel.
+
+    Returns:
+        The similarity matrix (memory-mapped if `out` is given). Two empty
+        frames have similarity 1.
+
+    Example:
+
+        .. testcode:: similarity-test
+
+            from graph_time_series import GraphTimeSeries
+            from graph_time_series.observables import frame_similarity_matrix
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_er(n=10, seed=i % 3) for i in range(6)]
+            )
+            sim = frame_similarity_matrix(series, "cosine")
+
+        .. testcode:: similarity-test
+            :hide:
+
+            import numpy as np
+            assert sim.shape == (6, 6)
+            assert np.isclose(sim[0, 3], 1.0)
+    """
+    if metric not in SIMILARITY_METRICS:
+        msg = f"metric must be one of {SIMILARITY_METRICS}."
+        raise ValueError(msg)
+    n_frames = len(series)
+    # Each tile needs a dense (tile, tile) block plus its temporaries
+    tile = int(np.sqrt(memory_budget / (8 * 4 * max(n_jobs, 1))))
+    if metric == "deltacon":
+        features, sq_norms, frame_bytes = _deltacon_source(series)
+        # Two strips of features per job
+        tile = min(tile, memory_budget // (2 * frame_bytes * max(n_jobs, 1)))
+    else:
+        features, sq_norms = _incidence_source(series, metric)
+    tile = min(max(tile, 1), max(n_frames, 1))
+    similarity = (
+        np.empty((n_frames, n_frames))
+        if out is None
+        else open_memmap(
+            Path(out), mode="w+", dtype=np.float64, shape=(n_frames, n_frames)
+        )
+    )
+
+    def compute_strip(start: int) -> None:
+        """Fill the tiles of the upper triangle in the rows of a strip."""
+        rows = range(start, min(start + tile, n_frames))
+        row_features = features(rows)
+        for col_start in range(start, n_frames, tile):
+            cols = range(col_start, min(col_start + tile, n_frames))
+            col_features = (
+                row_features if col_start == start else features(cols)
+            )
+            block = _tile_similarity(
+                (row_features, col_features),
+                (
+                    sq_norms[rows.start : rows.stop],
+                    sq_norms[cols.start : cols.stop],
+                ),
+                metric,
+            )
+            similarity[rows.start : rows.stop, cols.start : cols.stop] = block
+            similarity[cols.start : cols.stop, rows.start : rows.stop] = (
+                block.T
+            )
+
+    starts = range(0, n_frames, tile)
+    if n_jobs == 1:
+        for start in starts:
+            compute_strip(start)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            list(pool.map(compute_strip, starts))
+    if isinstance(similarity, np.memmap):
+        similarity.flush()
+    return similarity
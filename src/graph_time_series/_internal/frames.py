@@ -0,0 +1,150 @@
+"""Compact edge-list representation of the frames."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+    from scipy.sparse import sparray
+
+    from .graph import Graph
+
+import numpy as np
+
+from .laplacian import symmetric_laplacian
+from .lazy import sparse
+
+# Boolean, signed and unsigned integer, floating point
+WEIGHT_KINDS = "biuf"
+
+
+def weight_dtype(dtype: DTypeLike) -> np.dtype[Any]:
+    """Return the dtype used to store edge weights, validated."""
+    resolved = np.dtype(dtype)
+    if resolved.kind not in WEIGHT_KINDS:
+        msg = f"Unsupported weight dtype {resolved}."
+        raise ValueError(msg)
+    return resolved
+
+
+def _cast_weights(weights: NDArray[Any], dtype: np.dtype[Any]) -> NDArray[Any]:
+    """Cast the weights, refusing lossy casts to integers.
+
+    A boolean dtype stores unweighted edges, and drops the weights.
+    """
+    cast = weights.astype(dtype, copy=False)
+    if dtype.kind in "iu" and not np.array_equal(cast, weights):
+        msg = f"Edge weights cannot be represented as {dtype}."
+        raise ValueError(msg)
+    return cast
+
+
+class FrameEdges(NamedTuple):
+    """The edges of one frame, as indices into the series' NodeRegistry.
+
+    Undirected edges appear in both directions, as in a symmetric
+    adjacency matrix. Entries are sorted by (src, dst). Weights keep the
+    storage dtype of the series, computations cast them to float64.
+    """
+
+    src: NDArray[np.int32]
+    dst: NDArray[np.int32]
+    weight: NDArray[Any]
+
+    def to_sparse(self, n_nodes: int) -> sparray:
+        """Return the (n_nodes, n_nodes) sparse adjacency matrix."""
+        weight = self.weight
+        if weight.dtype == np.float16:
+            # Not supported by scipy.sparse
+            weight = weight.astype(np.float32)
+        return sparse.coo_array(
+            (weight, (self.src, self.dst)), shape=(n_nodes, n_nodes)
+        ).tocsr()
+
+    def to_laplacian(self, n_nodes: int) -> sparray:
+        """Return the Laplacian D - A of the symmetrized adjacency matrix."""
+        return symmetric_laplacian(self.to_sparse(n_nodes))
+
+
+def edges_from_matrix(
+    adjacency_matrix: NDArray[Any] | sparray,
+    directed: bool = True,
+    dtype: DTypeLike = np.float64,
+) -> FrameEdges:
+    """Return the non-zero entries of an adjacency matrix.
+
+    If not directed, the entries are symmetrized as networkx does when
+    building an undirected Graph: for each pair the last entry in row-major
+    order wins, and it is returned in both directions. Weights are stored
+    with the given dtype.
+    """
+    if isinstance(adjacency_matrix, np.ndarray):
+        rows, cols = np.nonzero(adjacency_matrix)
+        weights = adjacency_matrix[rows, cols]
+    else:
+        coo = adjacency_matrix.tocoo()
+        coo.sum_duplicates()
+        nonzero = coo.data != 0
+        rows, cols = coo.row[nonzero], coo.col[nonzero]
+        weights = coo.data[nonzero]
+    edges = FrameEdges(
+        rows.astype(np.int32),
+        cols.astype(np.int32),
+        _cast_weights(np.asarray(weights), weight_dtype(dtype)),
+    )
+    return edges if directed else _symmetrize(edges)
+
+
+def _symmetrize(edges: FrameEdges) -> FrameEdges:
+    """Return the undirected version of row-major sorted edges."""
+    low = np.minimum(edges.src, edges.dst).astype(np.int64)
+    high = np.maximum(edges.src, edges.dst).astype(np.int64)
+    keys = low * (int(high.max(initial=0)) + 1) + high
+    # Last occurrence of each pair = first occurrence in reversed order
+    _, first = np.unique(keys[::-1], return_index=True)
+    last = keys.size - 1 - first
+    low, high, weight = low[last], high[last], edges.weight[last]
+    loops = low == high
+    src = np.concatenate([low, high[~loops]]).astype(np.int32)
+    dst = np.concatenate([high, low[~loops]]).astype(np.int32)
+    weight = np.concatenate([weight, weight[~loops]])
+    order = np.lexsort((dst, src))
+    return FrameEdges(src[order], dst[order], weight[order])
+
+
+def frame_degrees(
+    edges: FrameEdges, directed: bool
+) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+    """Return the nodes with edges in a frame, and their weighted degrees.
+
+    As in networkx, self-loops count twice and the degree of a node of a
+    directed frame sums its in- and out-edges.
+    """
+    weight = edges.weight.astype(np.float64)
+    n_nodes = int(max(edges.src.max(initial=-1), edges.dst.max(initial=-1)))
+    n_nodes += 1
+    degree = np.bincount(edges.src, weights=weight, minlength=n_nodes)
+    if directed:
+        degree += np.bincount(edges.dst, weights=weight, minlength=n_nodes)
+    else:
+        loops = edges.src == edges.dst
+        degree += np.bincount(
+            edges.src[loops], weights=weight[loops], minlength=n_nodes
+        )
+    present = np.zeros(n_nodes, dtype=bool)
+    present[edges.src] = present[edges.dst] = True
+    nodes = np.flatnonzero(present)
+    return nodes.astype(np.int64), degree[nodes].astype(np.float64)
+
+
+def edges_from_graph(graph: Graph) -> FrameEdges:
+    """Return the edges of a Graph whose nodes are integer indices."""
+    triples = list(graph.nx_graph.edges(data="weight", default=1.0))
+    src = np.fromiter((e[0] for e in triples), np.int32, len(triples))
+    dst = np.fromiter((e[1] for e in triples), np.int32, len(triples))
+    weight = np.fromiter((e[2] for e in triples), graph.dtype, len(triples))
+    if not graph.directed:
+        return _symmetrize(FrameEdges(src, dst, weight))
+    order = np.lexsort((dst, src))
+    return FrameEdges(src[order], dst[order], weight[order])
@@ -5,13 +5,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from numpy.typing import NDArray
+    from numpy.typing import DTypeLike, NDArray
+    from scipy.sparse import sparray
 
-import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as np
 
 from . import observables
+from .frames import edges_from_matrix, weight_dtype
+from .lazy import nx
 
 
 class Graph:
@@ -23,23 +24,33 @@ class Graph:
         The adjacency matrix representing exchanges between nodes.
     directed :
         Whether the graph is directed.
+    dtype :
+        The dtype of the edge weights: a float, integer or boolean dtype
+        (the latter for unweighted graphs). Integer casts must be exact.
+        Weights are validated and rounded to this dtype, but networkx
+        stores them as Python objects: the dtype saves memory only on the
+        edge arrays of lazy series, not on a Graph.
     """
 
     def __init__(
         self,
-        adjacency_matrix: NDArray[np.float64],
+        adjacency_matrix: NDArray[Any] | sparray,
         directed: bool = False,
+        *,
+        dtype: DTypeLike = np.float64,
     ) -> None:
-        """Initialize a graph from an adjacency matrix."""
+        """Initialize a graph from a dense or sparse adjacency matrix."""
         self.directed = directed
+        self.dtype = weight_dtype(dtype)
         self.nx_graph = nx.DiGraph() if directed else nx.Graph()
         self._build_graph(adjacency_matrix)
 
-    def _build_graph(self, adjacency_matrix: NDArray[np.float64]) -> None:
+    def _build_graph(self, adjacency_matrix: NDArray[Any] | sparray) -> None:
         """Builds the networkx graph from the adjacency matrix."""
-        for (i, j), weight in np.ndenumerate(adjacency_matrix):
-            if weight != 0:
-                self.nx_graph.add_edge(i, j, weight=weight)
+        edges = edges_from_matrix(adjacency_matrix, dtype=self.dtype)
+        self.nx_graph.add_weighted_edges_from(
+            zip(edges.src.tolist(), edges.dst.tolist(), edges.weight.tolist())
+        )
 
     # --- Graph observables ---
     def get_n_nodes(self) -> int:
@@ -65,6 +76,8 @@ class Graph:
     # --- Plotting ---
     def plot(self, **kwargs: object) -> None:
         """Simple matplotlib plot of the graph."""
+        import matplotlib.pyplot as plt  # noqa: PLC0415
+
         pos = nx.spring_layout(self.nx_graph)
         nx.draw(self.nx_graph, pos, with_labels=True, **kwargs)
         edge_labels = nx.get_edge_attributes(self.nx_graph, "weight")
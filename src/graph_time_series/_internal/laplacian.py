@@ -6,12 +6,30 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
+    from scipy.sparse import sparray
 
     from .graph import Graph
 
-import networkx as nx
 import numpy as np
-from scipy.stats import linregress
+
+from .lazy import nx, sparse
+
+
+def symmetric_laplacian(adjacency: sparray) -> sparray:
+    """Return the Laplacian D - A of the symmetrized adjacency matrix.
+
+    A directed adjacency is replaced by (A + A^T) / 2, an undirected one is
+    left unchanged. Self-loops cancel out, as in networkx.
+    """
+    adjacency = sparse.csr_array(adjacency).astype(np.float64)
+    adjacency = (adjacency + adjacency.T) / 2
+    degrees = np.asarray(adjacency.sum(axis=1)).ravel()
+    return sparse.csr_array(sparse.diags_array(degrees) - adjacency)
+
+
+def spectrum_of_adjacency(adjacency: sparray) -> NDArray[np.float64]:
+    """Return the eigenvalues of `symmetric_laplacian`, ascending."""
+    return np.linalg.eigvalsh(symmetric_laplacian(adjacency).toarray())
 
 
 def laplacian(graph: Graph) -> NDArray[np.float64]:
@@ -83,8 +101,7 @@ def walk_length_distribution(graph: Graph, max_length: int) -> dict[int, int]:
 
             assert walk_dist[1] == 34
     """
-    l_matrix = laplacian(graph)
-    eigvals = np.linalg.eigvalsh(l_matrix)
+    eigvals = laplacian_spectrum(graph)
 
     dist: dict[int, int] = {}
     for ell in range(1, max_length + 1):
@@ -140,12 +157,55 @@ def spectral_dimension(
             import numpy as np
             assert np.isclose(d_s, 1.3164869124177108)
     """
-    l_sparse = laplacian(graph).astype(float)  # keep as sparse
-    # Convert to dense for eigvalsh
-    l_matrix = l_sparse.todense() if hasattr(l_sparse, "todense") else l_sparse
+    return _spectral_dimension_from_spectrum(
+        laplacian_spectrum(graph), bins, fit_range, eigen_threshold
+    )
+
+
+def laplacian_spectrum(graph: Graph) -> NDArray[np.float64]:
+    """Return the eigenvalues of the Laplacian, in ascending order.
+
+    The Laplacian is that of the nodes of the graph, symmetrized if the
+    graph is directed (see `GraphTimeSeries.laplacian_spectrum`, which
+    caches the same spectra, padded to the whole node registry).
+
+    Example:
+
+        .. testcode:: spectrum-test
+
+            from graph_time_series import Graph
+            from graph_time_series.observables import laplacian_spectrum
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            # Create a random graph
+            ad_mat = random_adj_matrix_er(n=10, seed=42)
+            graph = Graph(ad_mat)
+
+            # Compute the Laplacian eigenvalues
+            eigvals = laplacian_spectrum(graph)
+
+        .. testcode:: spectrum-test
+            :hide:
+
+            import numpy as np
+            assert np.isclose(eigvals[0], 0.0)
+    """
+    if graph.nx_graph.number_of_nodes() == 0:
+        return np.empty(0)
+    return spectrum_of_adjacency(
+        nx.to_scipy_sparse_array(graph.nx_graph, weight="weight")
+    )
+
+
+def _spectral_dimension_from_spectrum(
+    eigvals: NDArray[np.float64],
+    bins: int,
+    fit_range: tuple[int, int],
+    eigen_threshold: float,
+) -> float:
+    """Fit the spectral dimension from the Laplacian eigenvalues."""
+    from scipy.stats import linregress  # noqa: PLC0415
 
-    # Eigenvalues
-    eigvals = np.linalg.eigvalsh(l_matrix)
     eigvals = eigvals[eigvals > eigen_threshold]
 
     # Histogram DOS
@@ -156,6 +216,6 @@ def spectral_dimension(
     x = np.log(centers[fit_range[0] : fit_range[1]])
     y = np.log(hist[fit_range[0] : fit_range[1]])
 
-    slope, intercept, _, _, _ = linregress(x, y)
+    slope, _, _, _, _ = linregress(x, y)
 
     return 2 * (slope + 1)
@@ -0,0 +1,86 @@
+"""Deferred imports of the heavy dependencies.
+
+networkx, scipy and matplotlib take hundreds of milliseconds to import.
+The placeholders below stand for them, and the import only runs when an
+attribute is first accessed. Modules import them from here, e.g.
+`from .lazy import nx, sparse`; type checkers see the real modules.
+Likewise, the public modules expose their rarely used names through
+`deferred_attributes`, so that importing the package stays cheap.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    import networkx as nx
+    from scipy import sparse
+    from scipy.sparse import csgraph
+
+__all__ = [
+    "LazyModule",
+    "csgraph",
+    "deferred_attributes",
+    "lazy_module",
+    "nx",
+    "sparse",
+]
+
+
+class LazyModule:
+    """A placeholder importing a module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        """Record the name of the module, without importing it."""
+        self._lazy_name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        """Import the module, and fetch one of its attributes."""
+        value = getattr(importlib.import_module(self._lazy_name), attr)
+        # Later lookups find the attribute without calling __getattr__
+        setattr(self, attr, value)
+        return value
+
+    def __repr__(self) -> str:
+        """Return the repr of the placeholder."""
+        return f"<lazy module {self._lazy_name!r}>"
+
+
+def lazy_module(name: str) -> Any:
+    """Return a placeholder for module `name`, imported on first use."""
+    return LazyModule(name)
+
+
+def deferred_attributes(
+    module: str, origins: dict[str, str]
+) -> Callable[[str], Any]:
+    """Return a module `__getattr__` importing names on first access.
+
+    `origins` maps each name to the module defining it, relative to the
+    package of `module`; a name may also be a submodule of `module`. The
+    value is then stored in `module`, so that the lookup runs once.
+    """
+
+    def deferred(name: str) -> Any:
+        if name not in origins:
+            msg = f"module {module!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        origin = importlib.util.resolve_name(
+            origins[name], sys.modules[module].__package__
+        )
+        value = importlib.import_module(origin)
+        if origin != f"{module}.{name}":
+            value = getattr(value, name)
+        setattr(sys.modules[module], name, value)
+        return value
+
+    return deferred
+
+
+if not TYPE_CHECKING:
+    nx = lazy_module("networkx")
+    sparse = lazy_module("scipy.sparse")
+    csgraph = lazy_module("scipy.sparse.csgraph")
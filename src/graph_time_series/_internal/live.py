@@ -0,0 +1,223 @@
+"""Online computation of observables on frames arriving asynchronously."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+    from concurrent.futures import Executor
+
+    import numpy as np
+    from numpy.typing import NDArray
+    from scipy.sparse import sparray
+
+    from .pipeline import FrameContext
+
+from .graph import Graph
+from .pipeline import ObservablePipeline
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+
+class LiveResult(NamedTuple):
+    """The observables of one frame.
+
+    `frame` counts all the frames received from the source, dropped ones
+    included, so gaps in the published frames reveal the drops.
+    """
+
+    frame: int
+    values: dict[str, float]
+
+
+async def iterate_queue(
+    queue: asyncio.Queue[NDArray[np.float64] | None],
+) -> AsyncIterator[NDArray[np.float64]]:
+    """Yield the frames put in an asyncio.Queue, until None is received."""
+    while True:
+        frame = await queue.get()
+        if frame is None:
+            return
+        yield frame
+
+
+def _compute(
+    pipeline: ObservablePipeline,
+    directed: bool,
+    adjacency_matrix: NDArray[np.float64] | sparray,
+) -> dict[str, float]:
+    """Return the observables of a frame; picklable for process pools."""
+    return pipeline.evaluate(Graph(adjacency_matrix, directed=directed))
+
+
+class LiveMonitor:
+    """Watch a stream of adjacency matrices and compute observables.
+
+    Frames are consumed from an async iterator (e.g. a socket reader or
+    `iterate_queue`) into a bounded buffer. Observables are computed in an
+    executor, so the event loop stays responsive, and published through the
+    async iterator returned by `results()`. When the computation falls
+    behind and the buffer is full, the source is either paused ("block",
+    backpressure) or frames are dropped ("drop_oldest", "drop_newest").
+
+    Attributes:
+    -----------
+    observables :
+        The observables to compute, as accepted by ObservablePipeline.
+    directed :
+        Whether graphs are directed.
+    max_pending :
+        Size of the buffer of frames waiting for computation.
+    policy :
+        What to do when the buffer is full: "block", "drop_oldest" or
+        "drop_newest".
+    executor :
+        Optional, the executor running the computation. Defaults to the
+        event loop's default (thread) executor. With a process pool, only
+        the pipeline and the frame are sent to the workers, and custom
+        observables must be picklable (module-level functions).
+
+    Example:
+
+        .. testcode:: live-test
+
+            import asyncio
+            from graph_time_series import LiveMonitor
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            async def producer():
+                for seed in range(5):
+                    await asyncio.sleep(0)
+                    yield random_adj_matrix_er(n=10, p=0.5, seed=seed)
+
+            async def main():
+                monitor = LiveMonitor(["n_nodes", "degree"])
+                consumer = asyncio.create_task(
+                    collect(monitor.results())
+                )
+                await monitor.run(producer())
+                return await consumer
+
+            async def collect(results):
+                return [res async for res in results]
+
+            results = asyncio.run(main())
+
+        .. testcode:: live-test
+            :hide:
+
+            assert [res.frame for res in results] == [0, 1, 2, 3, 4]
+            assert results[0].values["n_nodes"] == 10
+    """
+
+    def __init__(
+        self,
+        observables: Sequence[
+            str | tuple[str, Callable[[FrameContext], float]]
+        ],
+        directed: bool = False,
+        *,
+        max_pending: int = 8,
+        policy: str = "block",
+        executor: Executor | None = None,
+    ) -> None:
+        """Prepare the monitor; nothing runs until `run` is awaited."""
+        if policy not in OVERFLOW_POLICIES:
+            msg = f"policy must be one of {OVERFLOW_POLICIES}."
+            raise ValueError(msg)
+        if max_pending < 1:
+            msg = "max_pending must be at least 1."
+            raise ValueError(msg)
+        self.pipeline = ObservablePipeline(observables)
+        self.directed = directed
+        self.max_pending = max_pending
+        self.policy = policy
+        self.executor = executor
+        self.n_received = 0
+        self.n_dropped = 0
+        self._results_queue: asyncio.Queue[LiveResult | None] | None = None
+
+    @property
+    def _results(self) -> asyncio.Queue[LiveResult | None]:
+        # Created on first use, inside the running event loop
+        if self._results_queue is None:
+            self._results_queue = asyncio.Queue()
+        return self._results_queue
+
+    async def _ingest(
+        self,
+        frames: AsyncIterator[NDArray[np.float64] | sparray],
+        pending: asyncio.Queue[tuple[int, NDArray[np.float64] | sparray]],
+    ) -> None:
+        async for matrix in frames:
+            item = (self.n_received, matrix)
+            self.n_received += 1
+            if self.policy == "block":
+                await pending.put(item)
+                continue
+            if pending.full():
+                self.n_dropped += 1
+                if self.policy == "drop_newest":
+                    continue
+                pending.get_nowait()
+                pending.task_done()
+            pending.put_nowait(item)
+
+    async def _process(
+        self,
+        pending: asyncio.Queue[tuple[int, NDArray[np.float64] | sparray]],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            frame, matrix = await pending.get()
+            try:
+                values = await loop.run_in_executor(
+                    self.executor,
+                    _compute,
+                    self.pipeline,
+                    self.directed,
+                    matrix,
+                )
+                await self._results.put(LiveResult(frame, values))
+            finally:
+                pending.task_done()
+
+    async def run(
+        self, frames: AsyncIterator[NDArray[np.float64] | sparray]
+    ) -> None:
+        """Consume the frames until the source is exhausted.
+
+        Returns once all the accepted frames have been processed and
+        published; the results stream is then closed.
+        """
+        pending: asyncio.Queue[tuple[int, NDArray[np.float64] | sparray]]
+        pending = asyncio.Queue(maxsize=self.max_pending)
+
+        async def feed() -> None:
+            await self._ingest(frames, pending)
+            await pending.join()
+
+        worker = asyncio.create_task(self._process(pending))
+        feeder = asyncio.create_task(feed())
+        try:
+            # The worker only stops by raising: propagate its error
+            done, _ = await asyncio.wait(
+                {worker, feeder}, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()
+        finally:
+            for task in (worker, feeder):
+                task.cancel()
+            await asyncio.gather(worker, feeder, return_exceptions=True)
+            await self._results.put(None)
+
+    async def results(self) -> AsyncIterator[LiveResult]:
+        """Yield the results as they are computed, until `run` ends."""
+        while True:
+            result = await self._results.get()
+            if result is None:
+                return
+            yield result
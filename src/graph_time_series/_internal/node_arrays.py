@@ -0,0 +1,146 @@
+"""Reductions over the nodes of (n_frames, n_nodes) observable arrays.
+
+Missing values (nodes absent from a frame) are expected to be NaN, and are
+ignored by all the reductions.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+import numpy as np
+
+
+def _check_2d(array: NDArray[np.float64]) -> None:
+    if array.ndim != 2:  # noqa: PLR2004
+        msg = "Input array must have shape (n_frames, n_nodes)."
+        raise ValueError(msg)
+
+
+def nodes_mean(array: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Return the average over the nodes of each frame.
+
+    Parameters:
+        array: array of shape (n_frames, n_nodes).
+
+    Returns:
+        An array of shape (n_frames,). Frames without nodes are NaN.
+
+    Example:
+
+        .. testcode:: nodes-mean-test
+
+            import numpy as np
+            from graph_time_series.utilities import nodes_mean
+
+            array = np.array([[1.0, 3.0, np.nan], [np.nan, 2.0, 4.0]])
+            mean = nodes_mean(array)
+
+        .. testcode:: nodes-mean-test
+            :hide:
+
+            assert np.allclose(mean, [2.0, 3.0])
+    """
+    _check_2d(array)
+    counts = np.sum(~np.isnan(array), axis=1)
+    sums = np.nansum(array, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def nodes_quantile(
+    array: NDArray[np.float64],
+    q: float | Sequence[float],
+) -> NDArray[np.float64]:
+    """Return quantiles over the nodes of each frame.
+
+    Parameters:
+        array: array of shape (n_frames, n_nodes).
+        q: the quantile(s) to compute, between 0 and 1.
+
+    Returns:
+        An array of shape (n_frames,) if q is a scalar, otherwise of shape
+        (len(q), n_frames).
+    """
+    _check_2d(array)
+    # Sort once (NaNs go last) and interpolate between order statistics
+    sorted_arr = np.sort(array, axis=1)
+    counts = np.sum(~np.isnan(array), axis=1)
+    q_arr = np.atleast_1d(np.asarray(q, dtype=np.float64))
+    if np.any((q_arr < 0) | (q_arr > 1)):
+        msg = "Quantiles must be in [0, 1]."
+        raise ValueError(msg)
+
+    positions = q_arr[:, None] * np.maximum(counts - 1, 0)[None, :]
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, np.maximum(counts - 1, 0)[None, :])
+    frac = positions - lower
+    rows = np.arange(array.shape[0])[None, :]
+    if array.shape[1] == 0:
+        result = np.full(positions.shape, np.nan)
+    else:
+        below, above = sorted_arr[rows, lower], sorted_arr[rows, upper]
+        result = (1 - frac) * below + frac * above
+    result[:, counts == 0] = np.nan
+    return result[0] if np.ndim(q) == 0 else result
+
+
+def nodes_histogram(
+    array: NDArray[np.float64],
+    bins: int | NDArray[np.float64] = 10,
+    value_range: tuple[float, float] | None = None,
+    density: bool = False,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Return the histogram of the node values of each frame.
+
+    All the frames share the same bin edges, so that the result can be
+    displayed as a (frame, value) heatmap.
+
+    Parameters:
+        array: array of shape (n_frames, n_nodes).
+        bins: number of bins, or the array of the bin edges.
+        value_range: optional, the (min, max) range of the bins. Defaults
+            to the range of the finite values in `array`.
+        density: if True, normalize each frame's histogram to unit area.
+
+    Returns:
+        - the histograms, an array of shape (n_frames, n_bins)
+        - the bin edges, an array of shape (n_bins + 1,)
+    """
+    _check_2d(array)
+    finite = np.isfinite(array)
+    if np.ndim(bins) == 0:
+        if value_range is None:
+            values = array[finite]
+            value_range = (
+                (float(values.min()), float(values.max()))
+                if values.size > 0
+                else (0.0, 1.0)
+            )
+        low, high = value_range
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        edges = np.linspace(low, high, int(bins) + 1)
+    else:
+        edges = np.asarray(bins, dtype=np.float64)
+    n_bins = edges.size - 1
+
+    # Right-most edge is included, as in np.histogram
+    bin_idx = np.searchsorted(edges, array, side="right") - 1
+    bin_idx[array == edges[-1]] = n_bins - 1
+    valid = finite & (bin_idx >= 0) & (bin_idx < n_bins)
+    rows = np.broadcast_to(np.arange(array.shape[0])[:, None], array.shape)
+    flat = rows[valid] * n_bins + bin_idx[valid]
+    counts = np.bincount(flat, minlength=array.shape[0] * n_bins)
+    hist = counts.reshape(array.shape[0], n_bins).astype(np.float64)
+
+    if density:
+        norm = hist.sum(axis=1, keepdims=True) * np.diff(edges)[None, :]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            hist = hist / norm
+    return hist, edges
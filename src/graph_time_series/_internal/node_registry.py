@@ -0,0 +1,113 @@
+"""Mapping between node labels and a contiguous integer index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
+
+    from numpy.typing import NDArray
+
+import numpy as np
+
+
+class _Unlabeled:
+    """Placeholder label of a node registered only to fill the index.
+
+    Each placeholder is equal to itself only, so it never collides with a
+    user label.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"<unlabeled node {self.index}>"
+
+
+class NodeRegistry:
+    """Series-level registry of the nodes.
+
+    Every node label is mapped to a fixed index in 0, ..., n - 1, shared by
+    all the frames of a series. Per-node results are arrays aligned with
+    this index, and frames only store int32 indices.
+
+    Attributes:
+    -----------
+    labels :
+        The node labels, in index order.
+
+    Example:
+
+        .. testcode:: registry-test
+
+            from graph_time_series import NodeRegistry
+
+            registry = NodeRegistry(["a", "b", "c"])
+            idx = registry.indices(["c", "a"])
+
+        .. testcode:: registry-test
+            :hide:
+
+            assert idx.tolist() == [2, 0]
+            assert registry.label(1) == "b"
+    """
+
+    def __init__(self, labels: Iterable[Hashable] = ()) -> None:
+        """Register the given labels, in order."""
+        self.labels: list[Hashable] = []
+        self._index: dict[Hashable, int] = {}
+        for label in labels:
+            if label in self._index:
+                msg = f"Duplicated node label {label!r}."
+                raise ValueError(msg)
+            self.add(label)
+
+    def add(self, label: Hashable) -> int:
+        """Register a label if new, and return its index."""
+        if label not in self._index:
+            self._index[label] = len(self.labels)
+            self.labels.append(label)
+        return self._index[label]
+
+    def pad(self, size: int) -> None:
+        """Register placeholder nodes until there are at least `size`.
+
+        The label of each new index is the index itself if it is not
+        already a label, otherwise a placeholder equal to nothing else.
+        """
+        for idx in range(len(self.labels), size):
+            self.add(_Unlabeled(idx) if idx in self._index else idx)
+
+    def index(self, label: Hashable) -> int:
+        """Return the index of a label."""
+        try:
+            return self._index[label]
+        except KeyError:
+            msg = f"Node {label!r} is not registered."
+            raise KeyError(msg) from None
+
+    def indices(self, labels: Iterable[Hashable]) -> NDArray[np.int32]:
+        """Return the int32 indices of several labels."""
+        return np.fromiter(
+            (self.index(label) for label in labels), dtype=np.int32
+        )
+
+    def label(self, idx: int) -> Hashable:
+        """Return the label of an index."""
+        return self.labels[idx]
+
+    def __len__(self) -> int:
+        """Return the number of registered nodes."""
+        return len(self.labels)
+
+    def __contains__(self, label: Hashable) -> bool:
+        """Return whether a label is registered."""
+        return label in self._index
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the labels, in index order."""
+        return iter(self.labels)
@@ -0,0 +1,394 @@
+"""Ensembles of randomized graphs, to assess observables against chance."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from .timeseries import GraphTimeSeries
+
+import warnings
+
+import numpy as np
+
+from .frames import FrameEdges, _symmetrize
+from .graph import Graph
+from .pipeline import FrameContext, ObservablePipeline
+
+NULL_MODELS = ("degree_preserving", "erdos_renyi", "configuration")
+
+
+class NullModelStats(NamedTuple):
+    """An observable compared with its null-model ensemble, over time.
+
+    All the fields are arrays of shape (n_frames,). The z-score is NaN
+    where the ensemble has zero standard deviation.
+    """
+
+    observed: NDArray[np.float64]
+    mean: NDArray[np.float64]
+    std: NDArray[np.float64]
+    zscore: NDArray[np.float64]
+
+
+def _pair_keys(
+    src: NDArray[np.int64],
+    dst: NDArray[np.int64],
+    n_nodes: int,
+    directed: bool,
+) -> NDArray[np.int64]:
+    """Return the keys of the node pairs, unordered if not directed."""
+    if directed:
+        return src * n_nodes + dst
+    return np.minimum(src, dst) * n_nodes + np.maximum(src, dst)
+
+
+def _edge_swaps(
+    pairs: tuple[NDArray[np.int64], NDArray[np.int64]],
+    directed: bool,
+    n_samples: int,
+    n_swaps: int,
+    rng: np.random.Generator,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Degree-preserving double edge swaps, on all the samples at once.
+
+    Each round pairs the edges of every sample at random, and proposes to
+    rewire (a, b), (c, d) into (a, d), (c, b); swaps creating self-loops or
+    multiple edges are rejected. Edges keep their position in the arrays,
+    hence their weight. Returns the (n_samples, n_edges) src and dst.
+    """
+    src, dst = pairs
+    n_edges = src.size
+    shape = (n_samples, n_edges)
+    src = np.broadcast_to(src, shape).copy()
+    dst = np.broadcast_to(dst, shape).copy()
+    half = n_edges // 2
+    if half == 0:
+        return src, dst
+    n_nodes = int(max(src.max(), dst.max())) + 1
+    # Keys of different samples must not collide
+    offset = (np.arange(n_samples) * n_nodes * n_nodes)[:, None]
+    rows = np.arange(n_samples)[:, None]
+    for _ in range(-(-n_swaps // half)):
+        perm = np.argsort(rng.random(shape), axis=1)
+        first, second = perm[:, :half], perm[:, half : 2 * half]
+        a, b = src[rows, first], dst[rows, first]
+        c, d = src[rows, second], dst[rows, second]
+        if not directed:
+            # Either of the two rewirings of an undirected pair of edges
+            flip = rng.random(a.shape) < 0.5  # noqa: PLR2004
+            c, d = np.where(flip, d, c), np.where(flip, c, d)
+        new_1 = _pair_keys(a, d, n_nodes, directed) + offset
+        new_2 = _pair_keys(c, b, n_nodes, directed) + offset
+        current = _pair_keys(src, dst, n_nodes, directed) + offset
+        accept = (a != d) & (c != b)
+        accept &= ~np.isin(new_1, current) & ~np.isin(new_2, current)
+        # Two accepted swaps must not create the same edge
+        keys, counts = np.unique(
+            np.concatenate([new_1[accept], new_2[accept]]), return_counts=True
+        )
+        repeated = keys[counts > 1]
+        accept &= ~(np.isin(new_1, repeated) | np.isin(new_2, repeated))
+        k, i = np.nonzero(accept)
+        src[k, first[k, i]], dst[k, first[k, i]] = a[k, i], d[k, i]
+        src[k, second[k, i]], dst[k, second[k, i]] = c[k, i], b[k, i]
+    return src, dst
+
+
+def _erdos_renyi(
+    nodes: NDArray[np.int64],
+    n_edges: int,
+    directed: bool,
+    n_samples: int,
+    rng: np.random.Generator,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Sample n_edges distinct pairs among the nodes, for each sample."""
+    n = nodes.size
+    n_pairs = n * (n - 1) if directed else n * (n - 1) // 2
+    picks = np.array(
+        [rng.choice(n_pairs, n_edges, replace=False) for _ in range(n_samples)]
+    ).reshape(n_samples, n_edges)
+    if directed:
+        i, j = np.divmod(picks, n - 1)
+        j += j >= i
+    else:
+        # Row-major position in the strict upper triangle -> (i, j)
+        i = (
+            n
+            - 2
+            - np.floor(np.sqrt(4 * n * (n - 1) - 8 * picks - 7) / 2 - 0.5)
+        )
+        i = i.astype(np.int64)
+        j = picks + i + 1 - n * (n - 1) // 2 + (n - i) * (n - i - 1) // 2
+    return nodes[i], nodes[j]
+
+
+def _configuration(
+    pairs: tuple[NDArray[np.int64], NDArray[np.int64]],
+    directed: bool,
+    n_samples: int,
+    rng: np.random.Generator,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Random stub matching; self-loops and multi-edges are removed later."""
+    src, dst = pairs
+    if directed:
+        out_stubs = np.broadcast_to(src, (n_samples, src.size))
+        in_stubs = rng.permuted(np.tile(dst, (n_samples, 1)), axis=1)
+        return out_stubs, in_stubs
+    stubs = rng.permuted(
+        np.tile(np.concatenate([src, dst]), (n_samples, 1)), axis=1
+    )
+    return stubs[:, 0::2], stubs[:, 1::2]
+
+
+def null_model_frames(
+    edges: FrameEdges,
+    model: str = "degree_preserving",
+    n_samples: int = 20,
+    *,
+    directed: bool = False,
+    n_swaps: int | None = None,
+    seed: int | np.random.SeedSequence | None = None,
+) -> list[FrameEdges]:
+    """Return randomized versions of a frame.
+
+    Available models:
+
+    - "degree_preserving": double edge swaps, keeping the degree (in- and
+      out-degree if directed) of every node; weights follow the edges.
+    - "erdos_renyi": the same number of edges placed uniformly at random
+      between the nodes of the frame; weights are shuffled.
+    - "configuration": random matching of the edge stubs, which keeps the
+      degrees up to the removed self-loops and multiple edges; weights are
+      shuffled.
+
+    Self-loops of the frame are kept as they are. All the samples are
+    generated together, with array operations.
+
+    Parameters:
+        edges: the edges of the frame, e.g. from `series.frame_edges(t)`.
+        model: the null model.
+        n_samples: the number of randomized frames.
+        directed: whether the frame is directed.
+        n_swaps: "degree_preserving" only, the number of attempted swaps
+            per sample; defaults to 10 times the number of edges.
+        seed: optional, the seed of the random generator.
+
+    Returns:
+        A list of `n_samples` FrameEdges.
+
+    Example:
+
+        .. testcode:: null-frames-test
+
+            import numpy as np
+            from graph_time_series import GraphTimeSeries
+            from graph_time_series.utilities import (
+                null_model_frames,
+                random_adj_matrix_ba,
+            )
+
+            series = GraphTimeSeries([random_adj_matrix_ba(n=30, seed=0)])
+            edges = series.frame_edges(0)
+            samples = null_model_frames(edges, n_samples=5, seed=1)
+
+        .. testcode:: null-frames-test
+            :hide:
+
+            degrees = np.bincount(edges.src)
+            for sample in samples:
+                assert np.array_equal(np.bincount(sample.src), degrees)
+    """
+    if model not in NULL_MODELS:
+        msg = f"model must be one of {NULL_MODELS}."
+        raise ValueError(msg)
+    rng = np.random.default_rng(seed)
+    src, dst = edges.src.astype(np.int64), edges.dst.astype(np.int64)
+    loops = src == dst
+    keep = ~loops if directed else src < dst
+    pairs = (src[keep], dst[keep])
+    weight = edges.weight[keep]
+
+    if model == "degree_preserving":
+        n_swaps = 10 * weight.size if n_swaps is None else n_swaps
+        new_src, new_dst = _edge_swaps(
+            pairs, directed, n_samples, n_swaps, rng
+        )
+        weights = np.broadcast_to(weight, new_src.shape)
+    else:
+        if model == "erdos_renyi":
+            nodes = np.unique(np.concatenate(pairs))
+            new_src, new_dst = _erdos_renyi(
+                nodes, weight.size, directed, n_samples, rng
+            )
+        else:
+            new_src, new_dst = _configuration(pairs, directed, n_samples, rng)
+        weights = rng.permuted(np.tile(weight, (n_samples, 1)), axis=1)
+
+    n_nodes = int(src.max(initial=0)) + 1
+    samples = []
+    for k in range(n_samples):
+        s, d, w = new_src[k], new_dst[k], weights[k]
+        # Stub matching can create self-loops and multiple edges
+        _, first = np.unique(
+            _pair_keys(s, d, n_nodes, directed), return_index=True
+        )
+        first = first[s[first] != d[first]]
+        frame = FrameEdges(
+            np.concatenate([s[first], src[loops]]).astype(np.int32),
+            np.concatenate([d[first], dst[loops]]).astype(np.int32),
+            np.concatenate([w[first], edges.weight[loops]]),
+        )
+        if directed:
+            order = np.lexsort((frame.dst, frame.src))
+            frame = FrameEdges(*(array[order] for array in frame))
+        else:
+            frame = _symmetrize(frame)
+        samples.append(frame)
+    return samples
+
+
+def _value_or_nan(
+    fn: Callable[[FrameContext], float], ctx: FrameContext
+) -> float:
+    """Return an observable, NaN where it is undefined."""
+    try:
+        return float(fn(ctx))
+    except RuntimeError:
+        return np.nan
+
+
+def _evaluate_quietly(
+    pipeline: ObservablePipeline, graph: Graph
+) -> list[float]:
+    """Return the observables of a graph, NaN where they are undefined."""
+    ctx = FrameContext(graph)
+    return [_value_or_nan(fn, ctx) for fn in pipeline.observables.values()]
+
+
+def _frame_ensemble(
+    edges: FrameEdges,
+    n_nodes: int,
+    directed: bool,
+    pipeline: ObservablePipeline,
+    options: dict[str, Any],
+) -> tuple[list[float], NDArray[np.float64]]:
+    """Return the observables of a frame and of its null ensemble."""
+    # The graphs keep the weight dtype of the series
+    dtype = edges.weight.dtype
+    observed = _evaluate_quietly(
+        pipeline,
+        Graph(edges.to_sparse(n_nodes), directed=directed, dtype=dtype),
+    )
+    samples = null_model_frames(edges, directed=directed, **options)
+    ensemble = np.array(
+        [
+            _evaluate_quietly(
+                pipeline,
+                Graph(
+                    sample.to_sparse(n_nodes), directed=directed, dtype=dtype
+                ),
+            )
+            for sample in samples
+        ]
+    ).reshape(len(samples), len(pipeline.observables))
+    return observed, ensemble
+
+
+def null_model_ensemble(
+    series: GraphTimeSeries,
+    observables: Sequence[str | tuple[str, Callable[[FrameContext], float]]],
+    model: str = "degree_preserving",
+    n_samples: int = 20,
+    *,
+    n_swaps: int | None = None,
+    seed: int | None = None,
+    n_jobs: int = 1,
+) -> dict[str, NullModelStats]:
+    """Compare observables with their values on null-model ensembles.
+
+    For each frame, `n_samples` randomized graphs are generated with
+    `null_model_frames`, and the observables are computed on the frame and
+    on the ensemble. Null graphs on which an observable is undefined (e.g.
+    a disconnected graph for the diameter) are left out of its statistics;
+    on the frame itself, the observed value and its z-score are NaN.
+
+    Parameters:
+        series: the graph time-series.
+        observables: the observables, as accepted by ObservablePipeline.
+        model: the null model, see `null_model_frames`.
+        n_samples: the size of the ensemble of each frame.
+        n_swaps: "degree_preserving" only, see `null_model_frames`.
+        seed: optional, the seed of the random generators. Results do not
+            depend on `n_jobs`.
+        n_jobs: the number of processes sharing the frames. With more than
+            one, custom observables must be picklable (module-level
+            functions).
+
+    Returns:
+        A dict observable name -> NullModelStats.
+
+    Example:
+
+        .. testcode:: null-ensemble-test
+
+            from graph_time_series import GraphTimeSeries
+            from graph_time_series.observables import null_model_ensemble
+            from graph_time_series.utilities import random_adj_matrix_ws
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_ws(n=40, k=6, seed=i) for i in range(3)]
+            )
+            stats = null_model_ensemble(series, ["clustering"], seed=0)
+
+        .. testcode:: null-ensemble-test
+            :hide:
+
+            # Small worlds are much more clustered than chance
+            assert (stats["clustering"].zscore > 3).all()
+    """
+    pipeline = ObservablePipeline(observables)
+    options = {
+        "model": model,
+        "n_samples": n_samples,
+        "n_swaps": n_swaps,
+    }
+    seeds = np.random.SeedSequence(seed).spawn(len(series))
+    args = [
+        (
+            series.frame_edges(t),
+            len(series.nodes),
+            series.directed,
+            pipeline,
+            {**options, "seed": seeds[t]},
+        )
+        for t in range(len(series))
+    ]
+    if n_jobs == 1:
+        results = [_frame_ensemble(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            results = list(pool.map(_frame_ensemble, *zip(*args)))
+
+    n_obs = len(pipeline.observables)
+    observed = np.array([res[0] for res in results]).reshape(-1, n_obs)
+    ensembles = np.array([res[1] for res in results]).reshape(
+        len(series), n_samples, n_obs
+    )
+    with warnings.catch_warnings(), np.errstate(invalid="ignore"):
+        # Observables undefined on the whole ensemble give NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nanmean(ensembles, axis=1)
+        std = np.nanstd(ensembles, axis=1)
+        zscore = np.where(std > 0, (observed - mean) / std, np.nan)
+    return {
+        name: NullModelStats(
+            observed[:, i], mean[:, i], std[:, i], zscore[:, i]
+        )
+        for i, name in enumerate(pipeline.observables)
+    }
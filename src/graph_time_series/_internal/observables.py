@@ -7,8 +7,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .graph import Graph
 
-
-import networkx as nx
+from .distance_sampling import estimate_average_distance
+from .lazy import nx
 
 
 def n_nodes(graph: Graph) -> int:
@@ -139,13 +139,38 @@ def diameter(graph: Graph) -> int:
     raise RuntimeError(msg)
 
 
-def average_distance(graph: Graph) -> float:
+def average_distance(
+    graph: Graph,
+    *,
+    precision: float | None = None,
+    confidence: float = 0.95,
+    max_sources: int | None = None,
+    seed: int | None = None,
+) -> float:
     """Return the average shortest distance between nodes.
 
+    With `precision`, the distance is estimated from BFS of sampled
+    sources, and averaged over the pairs of connected nodes on disconnected
+    graphs; see `estimate_average_distance`, which also returns the
+    confidence interval and the estimates of each component.
+
     Parameters
     ----------
     graph: graph_time_series.Graph
         The graph we want to compute the diameter.
+    precision: float, optional
+        The relative precision of the estimate. By default, the exact
+        average is computed.
+    confidence: float
+        The confidence level of the precision.
+    max_sources: int, optional
+        The largest number of sampled sources.
+    seed: int, optional
+        The seed of the sampling of the sources.
+
+    Raises:
+        ValueError: if `max_sources` or `seed` is given without
+            `precision`.
 
     Example:
 
@@ -168,6 +193,17 @@ def average_distance(graph: Graph) -> float:
             import numpy as np
             assert np.isclose(shortest_dist, 1.7777777777777777)
     """
+    if precision is None and (max_sources is not None or seed is not None):
+        msg = "max_sources and seed need a precision to sample sources."
+        raise ValueError(msg)
+    if precision is not None:
+        return estimate_average_distance(
+            graph,
+            precision=precision,
+            confidence=confidence,
+            max_sources=max_sources,
+            seed=seed,
+        ).mean
     if nx.is_connected(graph.nx_graph.to_undirected()):
         return nx.average_shortest_path_length(graph.nx_graph.to_undirected())
     msg = "Graph is not connected."
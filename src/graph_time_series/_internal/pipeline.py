@@ -0,0 +1,257 @@
+"""Compute several observables in a single pass over the frames."""
+
+from __future__ import annotations
+
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from .graph import Graph
+    from .timeseries import GraphTimeSeries
+
+import numpy as np
+
+from .laplacian import _spectral_dimension_from_spectrum, laplacian_spectrum
+from .lazy import nx
+
+
+class FrameContext:
+    """The intermediates of one frame, shared between observables.
+
+    Each intermediate is computed on first access and then reused by all
+    the observables of the pipeline evaluated on the same frame.
+
+    Attributes:
+    -----------
+    graph :
+        The Graph of the frame.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        spectrum: Callable[[], NDArray[np.float64]] | None = None,
+    ) -> None:
+        """Wrap a Graph, no intermediate is computed here.
+
+        `spectrum` optionally returns the Laplacian spectrum of the frame
+        from elsewhere, e.g. the cache of its series.
+        """
+        self.graph = graph
+        self._spectrum = spectrum
+
+    @cached_property
+    def undirected(self) -> nx.Graph:
+        """Undirected view of the frame."""
+        return self.graph.nx_graph.to_undirected(as_view=True)
+
+    @cached_property
+    def is_connected(self) -> bool:
+        """Whether the (undirected) frame is connected."""
+        return nx.is_connected(self.undirected)
+
+    @cached_property
+    def distances(self) -> NDArray[np.float64]:
+        """Hop distances between all the pairs of nodes.
+
+        Rows and columns follow the order of `undirected.nodes`; np.inf
+        marks pairs in different connected components.
+        """
+        nodes = list(self.undirected.nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        dist = np.full((len(nodes), len(nodes)), np.inf)
+        for source, lengths in nx.all_pairs_shortest_path_length(
+            self.undirected
+        ):
+            row = dist[index[source]]
+            row[[index[node] for node in lengths]] = list(lengths.values())
+        return dist
+
+    @cached_property
+    def laplacian_spectrum(self) -> NDArray[np.float64]:
+        """Eigenvalues of the Laplacian, in ascending order.
+
+        Same as `observables.laplacian_spectrum`: the nodes of the frame
+        only, symmetrized if directed.
+        """
+        if self._spectrum is not None:
+            return self._spectrum()
+        return laplacian_spectrum(self.graph)
+
+
+def _require_connected(ctx: FrameContext) -> None:
+    if not ctx.is_connected:
+        msg = "Graph is not connected."
+        raise RuntimeError(msg)
+
+
+def _diameter(ctx: FrameContext) -> float:
+    _require_connected(ctx)
+    return float(ctx.distances.max())
+
+
+def _average_distance(ctx: FrameContext) -> float:
+    _require_connected(ctx)
+    n = ctx.distances.shape[0]
+    return float(ctx.distances.sum() / (n * (n - 1))) if n > 1 else 0.0
+
+
+def _mean_value(values: dict[Any, float]) -> float:
+    return float(np.mean(np.fromiter(values.values(), np.float64)))
+
+
+def _n_nodes(ctx: FrameContext) -> float:
+    return ctx.graph.nx_graph.number_of_nodes()
+
+
+def _degree(ctx: FrameContext) -> float:
+    return _mean_value(dict(ctx.graph.nx_graph.degree(weight="weight")))
+
+
+def _clustering(ctx: FrameContext) -> float:
+    return _mean_value(nx.clustering(ctx.undirected, weight="weight"))
+
+
+def _spectral_dimension(ctx: FrameContext) -> float:
+    return _spectral_dimension_from_spectrum(
+        ctx.laplacian_spectrum, 50, (1, 10), 1e-10
+    )
+
+
+def _algebraic_connectivity(ctx: FrameContext) -> float:
+    spectrum = ctx.laplacian_spectrum
+    return float(spectrum[1]) if spectrum.size > 1 else 0.0
+
+
+# Module-level functions, so that pipelines can be sent to worker processes
+PIPELINE_OBSERVABLES: dict[str, Callable[[FrameContext], float]] = {
+    "n_nodes": _n_nodes,
+    "degree": _degree,
+    "clustering": _clustering,
+    "diameter": _diameter,
+    "average_distance": _average_distance,
+    "spectral_dimension": _spectral_dimension,
+    "algebraic_connectivity": _algebraic_connectivity,
+}
+"""The observables available by name.
+
+Local observables (degree, clustering) are averaged over the nodes, as in
+the `*_over_time` methods of GraphTimeSeries.
+"""
+
+
+class ObservablePipeline:
+    """A set of observables computed with one visit per frame.
+
+    Observables are declared once, either by name (see
+    `PIPELINE_OBSERVABLES`) or as custom functions taking a `FrameContext`
+    and returning a float. Intermediates such as the undirected view, the
+    all-pairs distances and the Laplacian spectrum are computed once per
+    frame and shared by all the observables that need them.
+
+    Example:
+
+        .. testcode:: pipeline-test
+
+            import numpy as np
+            from graph_time_series import GraphTimeSeries, ObservablePipeline
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_er(n=10, p=0.5, seed=i) for i in range(5)]
+            )
+            pipeline = ObservablePipeline(
+                ["degree", "clustering", "diameter", "average_distance"]
+            )
+            table = pipeline.run(series)
+
+        .. testcode:: pipeline-test
+            :hide:
+
+            assert np.allclose(table["diameter"], series.diameter_over_time())
+            assert np.array_equal(table["frame"], np.arange(5))
+    """
+
+    def __init__(
+        self,
+        observables: Sequence[
+            str | tuple[str, Callable[[FrameContext], float]]
+        ] = (),
+    ) -> None:
+        """Declare the observables to compute.
+
+        Parameters:
+            observables: names of built-in observables, or (name, function)
+                pairs for custom ones.
+        """
+        self.observables: dict[str, Callable[[FrameContext], float]] = {}
+        for obs in observables:
+            if isinstance(obs, str):
+                self.add(obs)
+            else:
+                self.add(*obs)
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[FrameContext], float] | None = None,
+    ) -> None:
+        """Add an observable to the pipeline.
+
+        Parameters:
+            name: the name of the observable, used as column of the output.
+            fn: optional, a function of a FrameContext. If None, `name`
+                must be one of the built-in observables.
+        """
+        if name == "frame" or name in self.observables:
+            msg = f"Observable '{name}' already in the pipeline."
+            raise ValueError(msg)
+        if fn is None:
+            if name not in PIPELINE_OBSERVABLES:
+                msg = f"Unknown observable '{name}'."
+                raise ValueError(msg)
+            fn = PIPELINE_OBSERVABLES[name]
+        self.observables[name] = fn
+
+    def run(self, series: GraphTimeSeries) -> NDArray[Any]:
+        """Compute all the observables, visiting each frame once.
+
+        The Laplacian spectra are taken from the cache of the series.
+
+        Parameters:
+            series: the graph time-series.
+
+        Returns:
+            A structured array with one row per frame: the "frame" field
+            holds the frame index, and there is one float field for each
+            observable.
+        """
+        dtype = [("frame", np.int64)] + [
+            (name, np.float64) for name in self.observables
+        ]
+        table = np.zeros(len(series), dtype=dtype)
+        table["frame"] = np.arange(len(series))
+        for t, graph in enumerate(series):
+            ctx = FrameContext(
+                graph,
+                partial(series.laplacian_spectrum, t, all_nodes=False),
+            )
+            for name, fn in self.observables.items():
+                table[name][t] = fn(ctx)
+        return table
+
+    def evaluate(self, graph: Graph) -> dict[str, float]:
+        """Compute all the observables on a single frame.
+
+        Parameters:
+            graph: the Graph of the frame.
+
+        Returns:
+            A dict observable name -> value.
+        """
+        ctx = FrameContext(graph)
+        return {name: fn(ctx) for name, fn in self.observables.items()}
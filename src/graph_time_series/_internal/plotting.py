@@ -5,12 +5,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from numpy.typing import NDArray
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+DOWNSAMPLING_METHODS = ("lttb", "minmax")
+MIN_LTTB_POINTS = 3
 
 
 def plot_global_obs(
@@ -34,8 +41,7 @@ def plot_global_obs(
     if time_series.ndim != 1:
         msg = "Input array has wrong dimension."
         raise ValueError(msg)
-    if fig_path is str:
-        fig_path = Path(fig_path)
+    fig_path = Path(fig_path)
 
     time_array = (
         np.linspace(0, len(time_series), len(time_series))
@@ -43,10 +49,225 @@ def plot_global_obs(
         else time
     )
 
-    fig, ax = plt.subplots()
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
     ax.plot(time_array, time_series, marker="o")
     ax.set_xlabel("Frame")
     if y_label is not None:
         ax.set_ylabel(y_label)
     fig.savefig(fig_path, dpi=600)
-    plt.close()
+
+
+def lttb_downsample(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    n_out: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Downsample a curve with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept; in between, the curve is split in
+    n_out - 2 buckets, and from each bucket the point forming the largest
+    triangle with the previously selected point and the average of the next
+    bucket is kept. This preserves the visual shape of the curve.
+
+    Parameters:
+        x: the x values, sorted.
+        y: the y values, same length as x.
+        n_out: the number of points to keep, at least 3.
+
+    Returns:
+        The downsampled x and y arrays.
+
+    Example:
+
+        .. testcode:: lttb-test
+
+            import numpy as np
+            from graph_time_series.plotting import lttb_downsample
+
+            x = np.arange(10_000, dtype=float)
+            y = np.sin(x / 500)
+            x_small, y_small = lttb_downsample(x, y, 200)
+
+        .. testcode:: lttb-test
+            :hide:
+
+            assert x_small.size == 200
+            assert x_small[0] == 0 and x_small[-1] == 9999
+    """
+    n = y.size
+    if n_out < MIN_LTTB_POINTS:
+        msg = "LTTB needs to keep at least 3 points."
+        raise ValueError(msg)
+    if n_out >= n:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < edges.size else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+        area = np.abs(
+            (x[prev] - avg_x) * (y[lo:hi] - y[prev])
+            - (x[prev] - x[lo:hi]) * (avg_y - y[prev])
+        )
+        prev = lo + int(np.argmax(area))
+        selected[i + 1] = prev
+    return x[selected], y[selected]
+
+
+def minmax_downsample(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    n_out: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Downsample a curve keeping the min and max of each bucket.
+
+    The curve is split in n_out // 2 buckets, and the minimum and maximum
+    points of each bucket are kept in their original order, so that all
+    the peaks of the curve are preserved.
+
+    Parameters:
+        x: the x values, sorted.
+        y: the y values, same length as x.
+        n_out: the (maximum) number of points to keep.
+
+    Returns:
+        The downsampled x and y arrays.
+    """
+    n = y.size
+    n_buckets = max(n_out // 2, 1)
+    if n_out >= n:
+        return x, y
+
+    bucket = (np.arange(n) * n_buckets) // n
+    # Within each bucket, the first point sorted by y is the min, the last
+    # one the max
+    order = np.lexsort((y, bucket))
+    starts = np.flatnonzero(
+        np.r_[True, bucket[order][1:] != bucket[order][:-1]]
+    )
+    ends = np.r_[starts[1:], n] - 1
+    selected = np.unique(np.concatenate([order[starts], order[ends]]))
+    return x[selected], y[selected]
+
+
+def _downsample(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    max_points: int | None,
+    method: str,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    if max_points is None or y.size <= max_points:
+        return x, y
+    if method == "lttb":
+        return lttb_downsample(x, y, max_points)
+    return minmax_downsample(x, y, max_points)
+
+
+def _render_figure(
+    fig_path: Path,
+    curves: list[tuple[str, NDArray[np.float64], NDArray[np.float64]]],
+    dpi: int,
+) -> None:
+    """Draw one panel per curve in a single figure, with the Agg canvas."""
+    fig = Figure(figsize=(6.4, 2.4 * len(curves)))
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(len(curves), 1, sharex=True, squeeze=False)[:, 0]
+    for ax, (name, x, y) in zip(axes, curves):
+        ax.plot(x, y, linewidth=0.8)
+        ax.set_ylabel(name)
+    axes[-1].set_xlabel("Frame")
+    fig.tight_layout()
+    fig.savefig(fig_path, dpi=dpi)
+
+
+def plot_global_obs_batch(
+    fig_path: Path | str,
+    observables: Mapping[str, NDArray[np.float64]],
+    *,
+    time: NDArray[np.float64] | None = None,
+    layout: str = "panels",
+    max_points: int | None = 5000,
+    downsampling: str = "lttb",
+    dpi: int = 150,
+    n_jobs: int = 1,
+) -> list[Path]:
+    """Plot several global quantities over time in one pass.
+
+    Figures are drawn with the non-interactive Agg canvas, and long series
+    are downsampled before drawing, so that rendering time and file size
+    do not grow with the number of frames.
+
+    Parameters:
+        fig_path: with layout="panels", the output Figure; with
+            layout="files", the directory where one Figure per observable
+            is saved as "<name>.png".
+
+        observables: the observables' values along time, by name. Each
+            array must be 1-dim.
+
+        time: optional, the time frame list. Must have the same length as
+            the observables.
+
+        layout: "panels" for a single Figure with one panel per
+            observable, "files" for one Figure per observable.
+
+        max_points: optional, the maximum number of points drawn per
+            observable. None disables downsampling.
+
+        downsampling: "lttb" (Largest-Triangle-Three-Buckets) or "minmax"
+            (min and max of each bucket).
+
+        dpi: resolution of the saved Figures.
+
+        n_jobs: with layout="files", the number of processes rendering the
+            Figures in parallel.
+
+    Returns:
+        The paths of the saved Figures.
+    """
+    if layout not in ("panels", "files"):
+        msg = "layout must be 'panels' or 'files'."
+        raise ValueError(msg)
+    if downsampling not in DOWNSAMPLING_METHODS:
+        msg = f"downsampling must be one of {DOWNSAMPLING_METHODS}."
+        raise ValueError(msg)
+
+    curves = []
+    for name, values in observables.items():
+        if values.ndim != 1:
+            msg = f"Input array '{name}' has wrong dimension."
+            raise ValueError(msg)
+        if time is not None and len(time) != values.size:
+            msg = f"Input array '{name}' and time have different lengths."
+            raise ValueError(msg)
+        x = np.arange(values.size, dtype=np.float64) if time is None else time
+        curves.append(
+            (name, *_downsample(x, values, max_points, downsampling))
+        )
+
+    fig_path = Path(fig_path)
+    if layout == "panels":
+        _render_figure(fig_path, curves, dpi)
+        return [fig_path]
+
+    fig_path.mkdir(parents=True, exist_ok=True)
+    paths = [fig_path / f"{name}.png" for name, _, _ in curves]
+    if n_jobs == 1:
+        for path, curve in zip(paths, curves):
+            _render_figure(path, [curve], dpi)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [
+                pool.submit(_render_figure, path, [curve], dpi)
+                for path, curve in zip(paths, curves)
+            ]
+            for future in futures:
+                future.result()
+    return paths
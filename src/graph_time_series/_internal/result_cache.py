@@ -0,0 +1,237 @@
+"""Persistent cache of observables, keyed by the content of the frames."""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import tempfile
+from functools import lru_cache, partial
+from pathlib import Path
+from types import CodeType, FunctionType
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from .frames import FrameEdges
+
+SUFFIX = ".pkl"
+
+
+@lru_cache(maxsize=None)
+def library_version() -> str:
+    """Return the installed version of the package."""
+    # Reading the package metadata is slow, so it is deferred to first use
+    from importlib.metadata import (  # noqa: PLC0415
+        PackageNotFoundError,
+        version,
+    )
+
+    try:
+        return version("graph-time-series")
+    except PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+
+def _code_digest(code: CodeType, digest: Any) -> None:
+    """Feed the bytecode of a function, and of its nested code, to a hash."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _code_digest(const, digest)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _function_digest(fn: FunctionType) -> str:
+    """Return a hash of the code, defaults and closure of a function.
+
+    Lambdas and closures share their qualified name, so that the name
+    alone does not tell them apart.
+
+    Raises:
+        ValueError: if a default or closure variable cannot be pickled.
+    """
+    digest = hashlib.sha256()
+    _code_digest(fn.__code__, digest)
+    cells = [cell.cell_contents for cell in fn.__closure__ or ()]
+    try:
+        bound = pickle.dumps(
+            (fn.__defaults__, fn.__kwdefaults__, cells),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    except (pickle.PicklingError, AttributeError, TypeError) as err:
+        msg = (
+            f"Cannot cache {fn.__qualname__}: its defaults or closure "
+            "variables cannot be pickled."
+        )
+        raise ValueError(msg) from err
+    digest.update(bound)
+    return digest.hexdigest()
+
+
+def observable_name(fn: Callable[..., Any]) -> str:
+    """Return an identifier of a function and its bound parameters.
+
+    functools.partial objects are unwrapped, and their arguments become
+    part of the name, so that different parameters get different keys.
+    Python functions add a hash of their code, defaults and closure
+    variables: lambdas and closures defined at the same place, but
+    computing different things, get different keys.
+
+    Raises:
+        ValueError: if the defaults or closure variables of the function
+            cannot be pickled.
+    """
+    params = []
+    while isinstance(fn, partial):
+        params.append(repr(fn.args))
+        params.append(repr(sorted(fn.keywords.items())))
+        fn = fn.func
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    if isinstance(fn, FunctionType):
+        params.append(_function_digest(fn))
+    return "|".join([name, *params])
+
+
+class ResultCache:
+    """An on-disk cache of per-frame results, with LRU eviction.
+
+    Each result is stored in its own file, named after the sha256 of the
+    frame content (edges, weights and their dtype, directedness), the
+    observable name, its parameters and the library version. Results are
+    thus reused across runs and notebooks, and identical frames share
+    their results. Once the total size exceeds `max_bytes`, the least
+    recently used files are removed.
+
+    Results are pickled: only point the cache to trusted directories.
+
+    Attributes:
+    -----------
+    directory :
+        Where the results are stored, created if needed.
+    max_bytes :
+        The size limit of the cache. It is checked by this object only,
+        so it is approximate when several processes share the directory.
+
+    Example:
+
+        .. testcode:: result-cache-test
+
+            import tempfile
+            from graph_time_series import GraphTimeSeries, ResultCache
+            from graph_time_series.observables import average_distance
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_er(n=10, p=0.5, seed=0)] * 3
+            )
+            with tempfile.TemporaryDirectory() as directory:
+                cache = ResultCache(directory)
+                dist = series.global_observable_over_time(
+                    average_distance, cache=cache
+                )
+                again = series.global_observable_over_time(
+                    average_distance, cache=cache
+                )
+
+        .. testcode:: result-cache-test
+            :hide:
+
+            assert (dist == again).all()
+            assert cache.misses == 1
+    """
+
+    def __init__(self, directory: Path | str, max_bytes: int = 2**30) -> None:
+        """Open (or create) a cache directory."""
+        if max_bytes < 0:
+            msg = "max_bytes must be non-negative."
+            raise ValueError(msg)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = self.size()
+
+    @staticmethod
+    def key(
+        edges: FrameEdges,
+        directed: bool,
+        name: str,
+        params: object = None,
+    ) -> str:
+        """Return the key of an observable computed on a frame."""
+        digest = hashlib.sha256()
+        header = (library_version(), name, repr(params), directed)
+        digest.update(repr(header).encode())
+        digest.update(edges.weight.dtype.str.encode())
+        for array in edges:
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    def _files(self) -> list[Path]:
+        return list(self.directory.glob(f"*{SUFFIX}"))
+
+    def size(self) -> int:
+        """Return the total size of the stored results, in bytes."""
+        return sum(path.stat().st_size for path in self._files())
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a result is stored for `key`."""
+        return self._path(key).exists()
+
+    def get(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the result stored for `key`, or compute and store it."""
+        path = self._path(key)
+        try:
+            with path.open("rb") as file:
+                result = pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            pass
+        else:
+            self.hits += 1
+            path.touch()
+            return result
+
+        self.misses += 1
+        result = compute()
+        self.put(key, result)
+        return result
+
+    def put(self, key: str, result: object) -> None:
+        """Store a result, then evict old ones if over the size limit."""
+        # Written aside then renamed, so readers never see partial files
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(file.name).replace(self._path(key))
+        self._size += self._path(key).stat().st_size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used results, down to max_bytes."""
+        entries = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= size
+
+    def clear(self) -> None:
+        """Remove all the stored results."""
+        for path in self._files():
+            path.unlink(missing_ok=True)
+        self._size = 0
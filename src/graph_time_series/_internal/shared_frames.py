@@ -0,0 +1,315 @@
+"""Frames of a series in shared memory, for multi-process analysis."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.util import Finalize
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from numpy.typing import NDArray
+    from typing_extensions import Self
+
+    from .timeseries import GraphTimeSeries
+
+import numpy as np
+
+from .frames import FrameEdges
+from .graph import Graph
+
+R = TypeVar("R")
+
+# The store attached by each worker process, see _attach_worker
+_WORKER_STATE: dict[str, SharedFrameStore] = {}
+
+
+class SharedFrameHandle(NamedTuple):
+    """The small, picklable description of a SharedFrameStore."""
+
+    name: str
+    backend: str
+    n_frames: int
+    n_edges: int
+    n_nodes: int
+    directed: bool
+    weight_dtype: str
+
+
+def _layout(handle: SharedFrameHandle) -> tuple[int, int, int, int]:
+    """Return the byte offsets of src, dst, weight, and the total size.
+
+    The buffer holds the int64 frame offsets, then the int32 src and dst
+    arrays and the weights, each aligned to 8 bytes.
+    """
+    src_start = 8 * (handle.n_frames + 1)
+    dst_start = src_start + 4 * handle.n_edges
+    weight_start = -(-(dst_start + 4 * handle.n_edges) // 8) * 8
+    itemsize = np.dtype(handle.weight_dtype).itemsize
+    return (
+        src_start,
+        dst_start,
+        weight_start,
+        weight_start + (itemsize * handle.n_edges),
+    )
+
+
+class SharedFrameStore:
+    """The edges of all the frames, concatenated in a shared buffer.
+
+    Frames are stored CSR-style: frame t spans the entries
+    offsets[t]:offsets[t + 1] of the src, dst and weight arrays. The buffer
+    is a multiprocessing.shared_memory block, or a memory-mapped file if
+    `path` is given. Other processes attach to it from the `handle` alone,
+    and get read-only views of the frames without copying or unpickling.
+
+    The store owning the buffer releases it on `close` (or at the end of a
+    `with` block); views returned by `frame` must not outlive it. A
+    memory-mapped file is left on disk.
+
+    Attributes:
+    -----------
+    series :
+        The graph time-series to share, or the handle of an existing store
+        to attach to.
+    path :
+        Optional, the file backing the buffer instead of shared memory.
+
+    Example:
+
+        .. testcode:: shared-test
+
+            from graph_time_series import GraphTimeSeries, SharedFrameStore
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_er(n=10, seed=i) for i in range(5)]
+            )
+            with SharedFrameStore(series) as store:
+                other = SharedFrameStore.attach(store.handle)
+                n_edges = other.frame(2).src.size
+                other.close()
+
+        .. testcode:: shared-test
+            :hide:
+
+            assert n_edges == series.frame_edges(2).src.size
+    """
+
+    def __init__(
+        self,
+        series: GraphTimeSeries | SharedFrameHandle,
+        path: Path | str | None = None,
+    ) -> None:
+        """Copy the frames of a series into a new shared buffer.
+
+        Given the handle of an existing store instead, attach to it.
+        """
+        self._shm: SharedMemory | None
+        if isinstance(series, SharedFrameHandle):
+            self.handle = series
+            self._owner = False
+            self._shm = (
+                SharedMemory(name=series.name)
+                if series.backend == "shm"
+                else None
+            )
+            self._map_arrays(max(_layout(series)[-1], 1), writable=False)
+            return
+
+        frames = [series.frame_edges(t) for t in range(len(series))]
+        counts = [frame.src.size for frame in frames]
+        handle = SharedFrameHandle(
+            name="" if path is None else str(Path(path)),
+            backend="shm" if path is None else "memmap",
+            n_frames=len(frames),
+            n_edges=sum(counts),
+            n_nodes=len(series.nodes),
+            directed=series.directed,
+            weight_dtype=series.dtype.str,
+        )
+        size = max(_layout(handle)[-1], 1)
+        self._shm = None
+        if path is None:
+            self._shm = SharedMemory(create=True, size=size)
+            handle = handle._replace(name=self._shm.name)
+        self.handle = handle
+        self._owner = True
+        self._map_arrays(size, writable=True)
+        self._offsets[0] = 0
+        np.cumsum(counts, out=self._offsets[1:])
+        for name in FrameEdges._fields:
+            if frames:
+                np.concatenate(
+                    [getattr(frame, name) for frame in frames],
+                    out=getattr(self, f"_{name}"),
+                )
+        for array in (self._offsets, self._src, self._dst, self._weight):
+            array.flags.writeable = False
+
+    @classmethod
+    def attach(cls, handle: SharedFrameHandle) -> SharedFrameStore:
+        """Return a read-only view of an existing store."""
+        return cls(handle)
+
+    def _map_arrays(self, size: int, *, writable: bool) -> None:
+        """Create the numpy views of the offsets, src, dst and weights."""
+        handle = self.handle
+        buffer: Any
+        self._memmap: np.memmap[Any, np.dtype[np.uint8]] | None = None
+        if self._shm is not None:
+            buffer = self._shm.buf
+        else:
+            buffer = self._memmap = np.memmap(
+                handle.name,
+                dtype=np.uint8,
+                mode="w+" if writable else "r",
+                shape=(size,),
+            )
+        src_start, dst_start, weight_start, _ = _layout(handle)
+        self._offsets: NDArray[np.int64] = np.ndarray(
+            (handle.n_frames + 1,), np.int64, buffer
+        )
+        self._src: NDArray[np.int32] = np.ndarray(
+            (handle.n_edges,), np.int32, buffer, src_start
+        )
+        self._dst: NDArray[np.int32] = np.ndarray(
+            (handle.n_edges,), np.int32, buffer, dst_start
+        )
+        self._weight: NDArray[Any] = np.ndarray(
+            (handle.n_edges,),
+            np.dtype(handle.weight_dtype),
+            buffer,
+            weight_start,
+        )
+        if not writable:
+            for array in (self._offsets, self._src, self._dst, self._weight):
+                array.flags.writeable = False
+
+    def __len__(self) -> int:
+        """Return the number of frames."""
+        return self.handle.n_frames
+
+    @property
+    def n_nodes(self) -> int:
+        """The number of nodes of the series."""
+        return self.handle.n_nodes
+
+    def frame(self, idx: int) -> FrameEdges:
+        """Return read-only views of the edges of frame `idx`."""
+        start, stop = self._offsets[idx], self._offsets[idx + 1]
+        return FrameEdges(
+            self._src[start:stop],
+            self._dst[start:stop],
+            self._weight[start:stop],
+        )
+
+    def graph(self, idx: int) -> Graph:
+        """Return the Graph of frame `idx`."""
+        return Graph(
+            self.frame(idx).to_sparse(self.n_nodes),
+            directed=self.handle.directed,
+            dtype=self.handle.weight_dtype,
+        )
+
+    def close(self) -> None:
+        """Release the buffer, and free it if this store created it."""
+        del self._offsets, self._src, self._dst, self._weight
+        if self._memmap is not None:
+            if self._owner:
+                self._memmap.flush()
+            self._memmap = None
+        if self._shm is not None:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> Self:
+        """Return the store itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the store."""
+        self.close()
+
+
+def _attach_worker(handle: SharedFrameHandle) -> None:
+    """Process pool initializer: attach once to the shared frames.
+
+    The store is closed when the worker exits. Pool workers end with
+    os._exit, which skips atexit handlers but not multiprocessing
+    finalizers.
+    """
+    store = SharedFrameStore.attach(handle)
+    _WORKER_STATE["store"] = store
+    Finalize(store, store.close, exitpriority=0)
+
+
+def _run_chunk(
+    fn: Callable[[SharedFrameStore, int], R], frames: range
+) -> list[R]:
+    """Apply `fn` to some frames of the store attached by the worker."""
+    store = _WORKER_STATE["store"]
+    return [fn(store, t) for t in frames]
+
+
+def map_frames(
+    series: GraphTimeSeries,
+    fn: Callable[[SharedFrameStore, int], R],
+    *,
+    n_jobs: int | None = None,
+    chunksize: int | None = None,
+    path: Path | str | None = None,
+) -> list[R]:
+    """Apply a function to every frame, on a pool of processes.
+
+    The frames are copied once into a SharedFrameStore; each worker
+    attaches to it when it starts, and tasks only carry frame indices.
+    `fn(store, t)` reads frame t with `store.frame(t)` (zero-copy edges)
+    or `store.graph(t)`, and must be picklable (e.g. a module-level
+    function) and return a picklable result, not a view of the store.
+
+    Parameters:
+        series: the graph time-series.
+        fn: the function computed on each frame.
+        n_jobs: the number of processes, defaults to the number of CPUs.
+            With 1, everything runs in the current process.
+        chunksize: the number of frames per task, defaults to an even
+            split in 4 tasks per process.
+        path: optional, a file backing the shared frames instead of
+            shared memory.
+
+    Returns:
+        The list of the results, one per frame.
+    """
+    with SharedFrameStore(series, path) as store:
+        if n_jobs == 1:
+            return [fn(store, t) for t in range(len(store))]
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_attach_worker,
+            initargs=(store.handle,),
+        ) as pool:
+            if chunksize is None:
+                n_tasks = 4 * (n_jobs or os.cpu_count() or 1)
+                chunksize = max(-(-len(store) // n_tasks), 1)
+            chunks = [
+                range(start, min(start + chunksize, len(store)))
+                for start in range(0, len(store), chunksize)
+            ]
+            return [
+                result
+                for chunk in pool.map(partial(_run_chunk, fn), chunks)
+                for result in chunk
+            ]
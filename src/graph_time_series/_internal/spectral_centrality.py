@@ -0,0 +1,205 @@
+"""Spectral centralities over time, by warm-started power iteration.
+
+Consecutive frames of a series usually have close leading eigenvectors, so
+the power iteration of each frame starts from the vector of the previous
+one and converges in a few iterations. Frames can also be iterated in
+batches: their operators are stacked in a block-diagonal sparse matrix and
+the vectors in a dense block, so that each iteration is a single sparse
+product for the whole batch.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from scipy.sparse import sparray
+
+    from .timeseries import GraphTimeSeries
+
+import numpy as np
+
+from .lazy import sparse
+
+SPECTRAL_CENTRALITIES = ("eigenvector", "katz", "pagerank")
+
+
+def _operator(
+    adjacency: sparray, measure: str, alpha: float
+) -> tuple[sparray, NDArray[np.float64]]:
+    """Return the iteration matrix of a frame, and its dangling nodes.
+
+    One step of the power iteration is x <- M @ x (+ a constant). The
+    dangling nodes, without out-edges, only matter for PageRank.
+    """
+    n_nodes = adjacency.shape[0]
+    out_weight = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = (out_weight == 0).astype(np.float64)
+    if measure == "eigenvector":
+        # The shift by the identity makes bipartite graphs converge too
+        matrix = adjacency.T + sparse.eye_array(n_nodes)
+    elif measure == "katz":
+        matrix = alpha * adjacency.T
+    else:
+        inverse = np.divide(
+            alpha, out_weight, out=np.zeros(n_nodes), where=out_weight != 0
+        )
+        matrix = (sparse.diags_array(inverse) @ adjacency).T
+    return sparse.csr_array(matrix), dangling
+
+
+def _iterate(
+    matrix: sparray,
+    dangling: NDArray[np.float64],
+    x: NDArray[np.float64],
+    *,
+    measure: str,
+    params: tuple[float, float],
+    tol: float,
+    max_iter: int,
+) -> NDArray[np.float64]:
+    """Run the power iteration on a batch, x of shape (n_frames, n_nodes).
+
+    Stops when every frame has changed by less than n_nodes * tol (in L1
+    norm) in one iteration, as networkx does.
+    """
+    alpha, beta = params
+    n_frames, n_nodes = x.shape
+    dangling = dangling.reshape(n_frames, n_nodes)
+    for _ in range(max_iter):
+        x_last = x
+        x = (matrix @ x_last.ravel()).reshape(n_frames, n_nodes)
+        if measure == "eigenvector":
+            norm = np.linalg.norm(x, axis=1, keepdims=True)
+            x = x / np.where(norm == 0, 1.0, norm)
+        elif measure == "katz":
+            x = x + beta
+        else:
+            lost = np.sum(dangling * x_last, axis=1, keepdims=True)
+            x = x + (alpha * lost + 1 - alpha) / n_nodes
+        error = np.abs(x - x_last).sum(axis=1)
+        if np.all(error < n_nodes * tol):
+            return x
+    msg = f"Power iteration did not converge in {max_iter} iterations."
+    raise RuntimeError(msg)
+
+
+def spectral_centrality_over_time(
+    series: GraphTimeSeries,
+    measure: str = "pagerank",
+    *,
+    alpha: float | None = None,
+    beta: float = 1.0,
+    tol: float = 1e-8,
+    max_iter: int = 1000,
+    batch_size: int = 1,
+    nstart: NDArray[np.float64] | None = None,
+) -> NDArray[np.float64]:
+    """Return a spectral centrality of every node, in every frame.
+
+    The centralities are those of `eigenvector_centrality`,
+    `katz_centrality` and `pagerank_centrality`, computed on all the nodes
+    of the registry with the edge weights: nodes without edges in a frame
+    have zero eigenvector centrality, Katz centrality beta before
+    normalization, and receive the random jumps of PageRank.
+
+    Each frame is solved by sparse power iteration, starting from the
+    solution of the previous frame. With `batch_size` > 1 the frames are
+    iterated by batches, as a single block-diagonal product, all starting
+    from the solution of the previous batch; this trades a few more
+    iterations for far fewer (larger) sparse products, which pays off for
+    many small frames. On disconnected frames the leading eigenvector is
+    not unique, and the eigenvector centrality depends on the start.
+
+    Parameters:
+        series: the graph time-series.
+        measure: one of "eigenvector", "katz", "pagerank".
+        alpha: the attenuation factor for "katz" (default 0.1), the
+            damping factor for "pagerank" (default 0.85).
+        beta: the constant term for "katz".
+        tol: the tolerance per node of the convergence test.
+        max_iter: the maximum number of iterations per batch.
+        batch_size: the number of frames iterated together.
+        nstart: optional, the starting vector for the first frame.
+
+    Returns:
+        An array of shape (n_frames, n_nodes_total). Eigenvector and Katz
+        centralities have unit Euclidean norm in each frame, PageRank
+        values sum to 1.
+
+    Raises:
+        RuntimeError: if the iteration of a batch does not converge.
+
+    Example:
+
+        .. testcode:: spectral-centrality-test
+
+            from graph_time_series import GraphTimeSeries
+            from graph_time_series.observables import (
+                spectral_centrality_over_time,
+            )
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_er(n=20, p=0.3, seed=i) for i in range(5)]
+            )
+            ranks = spectral_centrality_over_time(series, "pagerank")
+
+        .. testcode:: spectral-centrality-test
+            :hide:
+
+            import networkx as nx
+            import numpy as np
+            expected = nx.pagerank(series[3].nx_graph, tol=1e-10)
+            assert np.allclose(
+                ranks[3, list(expected)], list(expected.values()), atol=1e-6
+            )
+    """
+    if measure not in SPECTRAL_CENTRALITIES:
+        msg = f"measure must be one of {SPECTRAL_CENTRALITIES}."
+        raise ValueError(msg)
+    if batch_size < 1:
+        msg = "batch_size must be positive."
+        raise ValueError(msg)
+    if alpha is None:
+        alpha = 0.1 if measure == "katz" else 0.85
+    n_nodes = series.n_nodes_total()
+    result = np.empty((len(series), n_nodes))
+    x = (
+        np.full(n_nodes, 1.0 / max(n_nodes, 1))
+        if nstart is None
+        else np.asarray(nstart, dtype=np.float64)
+    )
+    if x.shape != (n_nodes,):
+        msg = "nstart must have one entry per node of the registry."
+        raise ValueError(msg)
+
+    for start in range(0, len(series), batch_size):
+        frames = range(start, min(start + batch_size, len(series)))
+        operators = [
+            _operator(
+                series.frame_edges(t).to_sparse(n_nodes).astype(np.float64),
+                measure,
+                alpha,
+            )
+            for t in frames
+        ]
+        matrix = sparse.block_diag([op[0] for op in operators], format="csr")
+        dangling = np.concatenate([op[1] for op in operators])
+        block = _iterate(
+            matrix,
+            dangling,
+            np.tile(x, (len(frames), 1)),
+            measure=measure,
+            params=(alpha, beta),
+            tol=tol,
+            max_iter=max_iter,
+        )
+        result[start : start + len(frames)] = block
+        x = block[-1]
+
+    if measure == "katz":
+        norm = np.linalg.norm(result, axis=1, keepdims=True)
+        result /= np.where(norm == 0, 1.0, norm)
+    return result
@@ -0,0 +1,269 @@
+"""Per-node temporal adjacency, for queries about single nodes."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .timeseries import GraphTimeSeries
+
+import numpy as np
+
+DIRECTIONS = ("out", "in")
+
+
+class _Runs(NamedTuple):
+    """CSR over nodes; the run of each node is sorted by frame, neighbour.
+
+    `keys` holds node * n_frames + frame for every entry, so that the
+    entries of (node, frame) are found by binary search.
+    """
+
+    indptr: NDArray[np.int64]
+    keys: NDArray[np.int64]
+    frames: NDArray[np.int32]
+    neighbors: NDArray[np.int32]
+    weights: NDArray[Any]
+
+
+class EgoNetwork(NamedTuple):
+    """The k-hop neighbourhoods of a node in each frame.
+
+    Entry i says that `nodes[i]` is `hops[i]` hops away from the ego node
+    in frame `frames[i]`. Entries are sorted by frame, hop and node.
+    """
+
+    frames: NDArray[np.int32]
+    nodes: NDArray[np.int32]
+    hops: NDArray[np.int32]
+
+
+def _build_runs(
+    frames: NDArray[np.int32],
+    src: NDArray[np.int32],
+    dst: NDArray[np.int32],
+    weights: NDArray[Any],
+    shape: tuple[int, int],
+) -> _Runs:
+    """Sort the entries by (src, frame, dst) and index them by src."""
+    n_nodes, n_frames = shape
+    order = np.lexsort((dst, frames, src))
+    src, frames = src[order], frames[order]
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n_nodes), out=indptr[1:])
+    keys = src.astype(np.int64) * n_frames + frames
+    return _Runs(indptr, keys, frames, dst[order], weights[order])
+
+
+def _expand(
+    starts: NDArray[np.int64], stops: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Return the positions in the ranges [starts, stops), and their range."""
+    lengths = stops - starts
+    owner = np.repeat(np.arange(starts.size), lengths)
+    first = np.cumsum(lengths) - lengths
+    positions = np.arange(lengths.sum()) - first[owner] + starts[owner]
+    return positions, owner
+
+
+class TemporalIndex:
+    """Time-sorted adjacency runs of every node, over a whole series.
+
+    All the (frame, neighbour, weight) entries of a node are stored
+    contiguously, sorted by frame then neighbour, in a CSR layout over the
+    nodes of the series' NodeRegistry. Queries about a node only touch its
+    own run, located by binary search, so their cost is proportional to
+    the size of the result, not of the series. For directed series, runs
+    are built for both the out- and the in-neighbours.
+
+    The index is a snapshot: frames appended to the series later are not
+    included.
+
+    Attributes:
+    -----------
+    series :
+        The graph time-series to index.
+
+    Example:
+
+        .. testcode:: temporal-index-test
+
+            from graph_time_series import GraphTimeSeries, TemporalIndex
+            from graph_time_series.utilities import random_adj_matrix_er
+
+            series = GraphTimeSeries(
+                [random_adj_matrix_er(n=20, seed=i) for i in range(10)]
+            )
+            index = TemporalIndex(series)
+            frames, neighbors, weights = index.neighbor_history(3)
+
+        .. testcode:: temporal-index-test
+            :hide:
+
+            for t in range(len(series)):
+                expected = sorted(series[t].nx_graph.neighbors(3))
+                assert neighbors[frames == t].tolist() == expected
+    """
+
+    def __init__(self, series: GraphTimeSeries) -> None:
+        """Build the index with one pass over the frames."""
+        self.directed = series.directed
+        self.n_frames = len(series)
+        self.n_nodes = len(series.nodes)
+        edges = [series.frame_edges(t) for t in range(self.n_frames)]
+        frames = np.repeat(
+            np.arange(self.n_frames, dtype=np.int32),
+            [frame.src.size for frame in edges],
+        )
+        src = np.concatenate([e.src for e in edges] or [np.empty(0, np.int32)])
+        dst = np.concatenate([e.dst for e in edges] or [np.empty(0, np.int32)])
+        weights = np.concatenate(
+            [e.weight for e in edges] or [np.empty(0, series.dtype)]
+        )
+        shape = (self.n_nodes, self.n_frames)
+        self._runs = {"out": _build_runs(frames, src, dst, weights, shape)}
+        # Undirected frames already hold both directions of each edge
+        self._runs["in"] = (
+            _build_runs(frames, dst, src, weights, shape)
+            if self.directed
+            else self._runs["out"]
+        )
+
+    def _get_runs(self, direction: str) -> _Runs:
+        if direction not in DIRECTIONS:
+            msg = f"direction must be one of {DIRECTIONS}."
+            raise ValueError(msg)
+        return self._runs[direction]
+
+    def _check_node(self, node: int) -> None:
+        if not 0 <= node < self.n_nodes:
+            msg = "Node out of range."
+            raise ValueError(msg)
+
+    def degree_over_time(
+        self, node: int, direction: str = "out"
+    ) -> NDArray[np.int64]:
+        """Return the number of neighbours of `node` in each frame."""
+        self._check_node(node)
+        runs = self._get_runs(direction)
+        run = slice(runs.indptr[node], runs.indptr[node + 1])
+        return np.bincount(runs.frames[run], minlength=self.n_frames)
+
+    def neighbor_history(
+        self,
+        node: int,
+        start: int = 0,
+        stop: int | None = None,
+        direction: str = "out",
+    ) -> tuple[NDArray[np.int32], NDArray[np.int32], NDArray[Any]]:
+        """Return the neighbours of a node in the frames [start, stop).
+
+        Parameters:
+            node: the index of the node in the NodeRegistry.
+            start: the first frame.
+            stop: optional, the frame where to stop (excluded).
+            direction: "out" or "in" neighbours, for directed series.
+
+        Returns:
+            - the frame of each entry, in ascending order
+            - the neighbour, ascending within each frame
+            - the weight of the edge
+        """
+        self._check_node(node)
+        runs = self._get_runs(direction)
+        stop = self.n_frames if stop is None else stop
+        base = node * self.n_frames
+        lo, hi = np.searchsorted(runs.keys, [base + start, base + stop])
+        return runs.frames[lo:hi], runs.neighbors[lo:hi], runs.weights[lo:hi]
+
+    def edge_lifetimes(
+        self, node: int, direction: str = "out"
+    ) -> tuple[NDArray[np.int32], NDArray[np.int32], NDArray[np.int32]]:
+        """Return the intervals in which each edge of a node is present.
+
+        Parameters:
+            node: the index of the node in the NodeRegistry.
+            direction: "out" or "in" edges, for directed series.
+
+        Returns:
+            - the neighbour
+            - the first frame of each interval of consecutive presence
+            - the frame after the last one of the interval
+            sorted by neighbour and start. stop - start is the duration.
+        """
+        frames, neighbors, _ = self.neighbor_history(node, direction=direction)
+        order = np.lexsort((frames, neighbors))
+        frames, neighbors = frames[order], neighbors[order]
+        new = np.ones(frames.size, dtype=bool)
+        new[1:] = (neighbors[1:] != neighbors[:-1]) | (
+            frames[1:] != frames[:-1] + 1
+        )
+        starts = np.flatnonzero(new)
+        ends = np.r_[starts[1:], frames.size] - 1
+        return neighbors[starts], frames[starts], frames[ends] + 1
+
+    def ego_network(
+        self,
+        node: int,
+        k: int = 1,
+        start: int = 0,
+        stop: int | None = None,
+        direction: str = "out",
+    ) -> EgoNetwork:
+        """Return the k-hop neighbourhood of a node, frame by frame.
+
+        A breadth-first search runs in every frame of [start, stop) where
+        the node has edges; all the frames are explored together, one hop
+        at a time, reading only the runs of the nodes reached.
+
+        Parameters:
+            node: the index of the ego node in the NodeRegistry.
+            k: the maximum number of hops.
+            start: the first frame.
+            stop: optional, the frame where to stop (excluded).
+            direction: follow "out" or "in" edges, for directed series.
+
+        Returns:
+            An EgoNetwork. The ego node is at hop 0 in the frames where it
+            has edges (in either direction); other frames are left out.
+        """
+        if k < 0:
+            msg = "k must be non-negative."
+            raise ValueError(msg)
+        runs = self._get_runs(direction)
+        # Frames where the node has edges, in either direction
+        own_frames = [
+            self.neighbor_history(node, start, stop, way)[0]
+            for way in DIRECTIONS
+        ]
+        frontier_t = np.unique(np.concatenate(own_frames)).astype(np.int64)
+        frontier_u = np.full(frontier_t.size, node, dtype=np.int64)
+        found = [(frontier_t, frontier_u, 0)]
+        visited = frontier_t * self.n_nodes + frontier_u
+        for hop in range(1, k + 1):
+            if frontier_t.size == 0:
+                break
+            keys = frontier_u * self.n_frames + frontier_t
+            positions, owner = _expand(
+                np.searchsorted(runs.keys, keys, side="left"),
+                np.searchsorted(runs.keys, keys, side="right"),
+            )
+            reached = np.unique(
+                frontier_t[owner] * self.n_nodes + runs.neighbors[positions]
+            )
+            reached = reached[~np.isin(reached, visited, assume_unique=True)]
+            visited = np.union1d(visited, reached)
+            frontier_t, frontier_u = np.divmod(reached, self.n_nodes)
+            found.append((frontier_t, frontier_u, hop))
+
+        frames = np.concatenate([f for f, _, _ in found])
+        nodes = np.concatenate([u for _, u, _ in found])
+        hops = np.concatenate([np.full(f.size, h) for f, _, h in found])
+        order = np.lexsort((nodes, hops, frames))
+        return EgoNetwork(
+            frames[order].astype(np.int32),
+            nodes[order].astype(np.int32),
+            hops[order].astype(np.int32),
+        )
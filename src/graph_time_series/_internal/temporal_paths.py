@@ -0,0 +1,249 @@
+"""Time-respecting paths and temporal reachability on graph time-series.
+
+A time-respecting path is a sequence of edges (u_0, u_1, t_1),
+(u_1, u_2, t_2), ... taken from frames with strictly increasing indices
+t_1 < t_2 < ..., so at most one hop is made per frame. All the functions
+here run a single forward sweep over the frames, updating a
+(sources x nodes) state matrix with vectorized scatter-reductions over the
+edges of each frame. The time-expanded graph is never built.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from numpy.typing import NDArray
+
+    from .timeseries import GraphTimeSeries
+
+import numpy as np
+
+
+def _sweep(
+    series: GraphTimeSeries,
+    start: int,
+    stop: int | None,
+) -> Iterator[
+    tuple[int, NDArray[np.int32], NDArray[np.int64], NDArray[np.int32]]
+]:
+    """Yield (t, src, group_starts, group_dst) for the frames to visit.
+
+    Edges are grouped by destination node: `group_starts` are the offsets
+    of each group in `src` (to be used with `ufunc.reduceat`) and
+    `group_dst` the corresponding destination nodes.
+    """
+    stop = len(series) if stop is None else stop
+    for t in range(start, stop):
+        edges = series.frame_edges(t)
+        if edges.src.size == 0:
+            continue
+        order = np.argsort(edges.dst, kind="stable")
+        src, dst = edges.src[order], edges.dst[order]
+        group_starts = np.flatnonzero(np.r_[True, dst[1:] != dst[:-1]])
+        yield t, src, group_starts, dst[group_starts]
+
+
+def _check_sources(
+    series: GraphTimeSeries,
+    sources: Sequence[int] | NDArray[np.int64] | None,
+) -> tuple[int, NDArray[np.int64]]:
+    """Return the total number of nodes and the array of sources."""
+    n_total = series.n_nodes_total()
+    if sources is None:
+        return n_total, np.arange(n_total)
+    sources_arr = np.asarray(sources, dtype=np.int64).ravel()
+    if np.any(sources_arr < 0) or np.any(sources_arr >= n_total):
+        msg = "Source node out of range."
+        raise ValueError(msg)
+    return n_total, sources_arr
+
+
+def earliest_arrival(
+    series: GraphTimeSeries,
+    sources: Sequence[int] | NDArray[np.int64] | None = None,
+    start: int = 0,
+    stop: int | None = None,
+) -> NDArray[np.float64]:
+    """Return the earliest arrival frame of time-respecting paths.
+
+    Parameters:
+        series: the graph time-series.
+        sources: optional, the source nodes. Defaults to all the nodes.
+        start: index of the first frame that can be used.
+        stop: optional, index of the frame where the sweep stops
+            (excluded). Defaults to the end of the series.
+
+    Returns:
+        An array of shape (n_sources, n_nodes). Entry (i, j) is the index
+        of the frame at which node j is first reached from sources[i].
+        Sources are considered reached at `start`; unreachable nodes are
+        marked with np.inf.
+
+    Example:
+
+        .. testcode:: arrival-test
+
+            import numpy as np
+            from graph_time_series import GraphTimeSeries
+            from graph_time_series.observables import earliest_arrival
+
+            # 0 - 1 at frame 0, then 1 - 2 at frame 1
+            ad_mat_0 = np.zeros((3, 3))
+            ad_mat_0[0, 1] = ad_mat_0[1, 0] = 1
+            ad_mat_1 = np.zeros((3, 3))
+            ad_mat_1[1, 2] = ad_mat_1[2, 1] = 1
+            series = GraphTimeSeries([ad_mat_0, ad_mat_1])
+
+            arrival = earliest_arrival(series, sources=[0, 2])
+
+        .. testcode:: arrival-test
+            :hide:
+
+            assert arrival[0, 2] == 1
+            assert np.isinf(arrival[1, 0])
+    """
+    n_total, sources_arr = _check_sources(series, sources)
+    rows = np.arange(sources_arr.size)
+    arrival = np.full((sources_arr.size, n_total), np.inf)
+    arrival[rows, sources_arr] = start - 1
+
+    for t, src, group_starts, group_dst in _sweep(series, start, stop):
+        reached = arrival[:, src] < t
+        hit = np.logical_or.reduceat(reached, group_starts, axis=1)
+        block = arrival[:, group_dst]
+        block[hit & np.isinf(block)] = t
+        arrival[:, group_dst] = block
+
+    arrival[rows, sources_arr] = start
+    return arrival
+
+
+def temporal_reachability(
+    series: GraphTimeSeries,
+    sources: Sequence[int] | NDArray[np.int64] | None = None,
+    start: int = 0,
+    stop: int | None = None,
+) -> NDArray[np.bool_]:
+    """Return which nodes are reachable through time-respecting paths.
+
+    Parameters:
+        series: the graph time-series.
+        sources: optional, the source nodes. Defaults to all the nodes.
+        start: index of the first frame that can be used.
+        stop: optional, index of the frame where the sweep stops
+            (excluded). Defaults to the end of the series.
+
+    Returns:
+        A boolean array of shape (n_sources, n_nodes). Entry (i, j) is True
+        if node j can be reached from sources[i] within the frame range.
+    """
+    return np.isfinite(earliest_arrival(series, sources, start, stop))
+
+
+def shortest_temporal_distance(
+    series: GraphTimeSeries,
+    sources: Sequence[int] | NDArray[np.int64] | None = None,
+    start: int = 0,
+    stop: int | None = None,
+) -> NDArray[np.float64]:
+    """Return the length (number of hops) of shortest time-respecting paths.
+
+    Parameters:
+        series: the graph time-series.
+        sources: optional, the source nodes. Defaults to all the nodes.
+        start: index of the first frame that can be used.
+        stop: optional, index of the frame where the sweep stops
+            (excluded). Defaults to the end of the series.
+
+    Returns:
+        An array of shape (n_sources, n_nodes) with the minimum number of
+        hops needed to reach node j from sources[i]. Unreachable nodes are
+        marked with np.inf.
+    """
+    n_total, sources_arr = _check_sources(series, sources)
+    hops = np.full((sources_arr.size, n_total), np.inf)
+    hops[np.arange(sources_arr.size), sources_arr] = 0
+
+    for _, src, group_starts, group_dst in _sweep(series, start, stop):
+        # Candidates only use paths completed before the current frame
+        candidates = hops[:, src] + 1
+        best = np.minimum.reduceat(candidates, group_starts, axis=1)
+        hops[:, group_dst] = np.minimum(hops[:, group_dst], best)
+
+    return hops
+
+
+def fastest_temporal_duration(
+    series: GraphTimeSeries,
+    sources: Sequence[int] | NDArray[np.int64] | None = None,
+    start: int = 0,
+    stop: int | None = None,
+) -> NDArray[np.float64]:
+    """Return the duration of fastest time-respecting paths.
+
+    The duration of a path is the number of frames between its first and
+    its last edge, both included.
+
+    Parameters:
+        series: the graph time-series.
+        sources: optional, the source nodes. Defaults to all the nodes.
+        start: index of the first frame that can be used.
+        stop: optional, index of the frame where the sweep stops
+            (excluded). Defaults to the end of the series.
+
+    Returns:
+        An array of shape (n_sources, n_nodes) with the minimum duration of
+        a path from sources[i] to node j. Unreachable nodes are marked with
+        np.inf, sources have duration 0.
+    """
+    n_total, sources_arr = _check_sources(series, sources)
+    rows = np.arange(sources_arr.size)
+    # Latest departure frame of a path reaching each node so far
+    departure = np.full((sources_arr.size, n_total), -np.inf)
+    duration = np.full((sources_arr.size, n_total), np.inf)
+    duration[rows, sources_arr] = 0
+
+    for t, src, group_starts, group_dst in _sweep(series, start, stop):
+        previous = departure.copy()
+        previous[rows, sources_arr] = t
+        candidates = previous[:, src]
+        best = np.maximum.reduceat(candidates, group_starts, axis=1)
+        departure[:, group_dst] = np.maximum(departure[:, group_dst], best)
+        duration[:, group_dst] = np.minimum(
+            duration[:, group_dst], t - best + 1
+        )
+
+    duration[rows, sources_arr] = 0
+    return duration
+
+
+def temporal_closeness(
+    series: GraphTimeSeries,
+    sources: Sequence[int] | NDArray[np.int64] | None = None,
+    start: int = 0,
+    stop: int | None = None,
+) -> NDArray[np.float64]:
+    """Return the temporal (harmonic) closeness of the source nodes.
+
+    The temporal closeness of node i is the average over the other nodes
+    of 1 / (a_ij - start + 1), where a_ij is the earliest arrival frame at
+    node j from node i. Unreachable nodes contribute 0.
+
+    Parameters:
+        series: the graph time-series.
+        sources: optional, the source nodes. Defaults to all the nodes.
+        start: index of the first frame that can be used.
+        stop: optional, index of the frame where the sweep stops
+            (excluded). Defaults to the end of the series.
+
+    Returns:
+        An array of shape (n_sources,) with the closeness values.
+    """
+    n_total, sources_arr = _check_sources(series, sources)
+    arrival = earliest_arrival(series, sources_arr, start, stop)
+    inverse = 1 / (arrival - start + 1)
+    inverse[np.arange(sources_arr.size), sources_arr] = 0
+    return inverse.sum(axis=1) / max(n_total - 1, 1)
@@ -2,55 +2,484 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable
+import copy
+import warnings
+from collections.abc import Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, overload
 
 from graph_time_series import observables
 
 if TYPE_CHECKING:
-    from numpy.typing import NDArray
+    from collections.abc import Hashable, Iterable, Iterator
+
+    from numpy.typing import DTypeLike, NDArray
+    from scipy.sparse import csr_array
+
+    from .communities import CommunityTracking
+    from .result_cache import ResultCache
 
 import numpy as np
 
+from .frame_cache import CacheInfo, FrameCache
+from .frames import (
+    FrameEdges,
+    edges_from_graph,
+    edges_from_matrix,
+    frame_degrees,
+    weight_dtype,
+)
 from .graph import Graph
+from .laplacian import spectrum_of_adjacency
+from .lazy import nx, sparse
+from .node_arrays import nodes_mean
+from .node_registry import NodeRegistry
+from .pipeline import FrameContext, ObservablePipeline
+from .result_cache import observable_name
+
+if TYPE_CHECKING:
+    # Per-node values of a frame: a dict, or (nodes, values) arrays
+    LocalValues = (
+        dict[Any, float] | tuple[NDArray[np.integer], NDArray[np.floating]]
+    )
+
+
+class _GraphSequence(Sequence[Graph]):
+    """Read-only sequence of the Graphs of a series, built on access.
+
+    Mutating it through `append`, `extend` or item assignment is
+    deprecated: it still changes the series, with a DeprecationWarning.
+    """
+
+    def __init__(self, series: GraphTimeSeries) -> None:
+        """Wrap a series, without building any Graph."""
+        self._series = series
+
+    @overload
+    def __getitem__(self, idx: int) -> Graph: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[Graph]: ...
+
+    def __getitem__(self, idx: int | slice) -> Graph | list[Graph]:
+        """Return a Graph, or a list of Graphs for a slice."""
+        if isinstance(idx, slice):
+            return [self._series[t] for t in range(len(self))[idx]]
+        return self._series[idx]
+
+    def __len__(self) -> int:
+        """Return the number of frames."""
+        return len(self._series)
+
+    @staticmethod
+    def _warn() -> None:
+        msg = (
+            "Mutating GraphTimeSeries.graphs is deprecated, use "
+            "GraphTimeSeries.append_graph or replace_graph instead."
+        )
+        warnings.warn(msg, DeprecationWarning, stacklevel=3)
+
+    def __setitem__(self, idx: int, graph: Graph) -> None:
+        """Replace a frame of the series (deprecated)."""
+        self._warn()
+        self._series.replace_graph(idx, graph)
+
+    def append(self, graph: Graph) -> None:
+        """Append a graph to the series (deprecated)."""
+        self._warn()
+        self._series.append_graph(graph)
+
+    def extend(self, graphs: Iterable[Graph]) -> None:
+        """Append graphs to the series (deprecated)."""
+        self._warn()
+        for graph in graphs:
+            self._series.append_graph(graph)
 
 
 class GraphTimeSeries:
     """A time-series of graphs.
 
+    All the frames share a NodeRegistry, mapping node labels to a fixed
+    index 0, ..., n - 1. The nodes of each Graph are these indices, and
+    per-node results are arrays aligned with them.
+
+    In lazy mode, frames are kept as int32 edge lists and the Graph of a
+    frame is only built when accessed, through a bounded cache, so that
+    memory stays flat when iterating over long series.
+
+    Edge weights are stored with the `dtype` of the series, e.g. float32,
+    uint8 contact counts or bool for unweighted graphs, while node indices
+    are int32; observables are still accumulated in float64. The memory
+    savings apply to the edge arrays of lazy mode only: eager frames, and
+    the Graphs built in lazy mode, hold their weights in networkx as
+    Python objects (with values rounded to the dtype).
+
+    Indexing with a slice, a boolean mask or an array of indices returns a
+    view: a GraphTimeSeries sharing the frames, the Graph cache, the
+    Laplacian spectra and the node registry of its base series, on which
+    all the methods work without copying any frame.
+
     Attributes:
     -----------
     matrices :
         A list of adjacency matrices (one per timestep).
     directed :
         Whether graphs are directed.
+    node_labels :
+        Optional, the labels of the matrices' rows. Defaults to the row
+        indices.
+    lazy :
+        Whether Graphs are built on demand.
+    cache_size :
+        The maximum number of Laplacian spectra and, in lazy mode, of
+        Graphs kept in memory (None for no limit, 0 to disable the cache).
+    eviction :
+        The cache eviction policy, "lru" or "fifo".
+    dtype :
+        The dtype of the edge weights, see Graph.
     """
 
     def __init__(
         self,
-        matrices: list[NDArray[np.float64]],
+        matrices: list[NDArray[Any]],
         directed: bool = False,
+        *,
+        node_labels: Sequence[Hashable] | None = None,
+        lazy: bool = False,
+        cache_size: int | None = 128,
+        eviction: str = "lru",
+        dtype: DTypeLike = np.float64,
     ) -> None:
         """Initialize the time-series from a list of adjacency matrices."""
         self.directed = directed
-        self.graphs: list[Graph] = [
-            Graph(m, directed=directed) for m in matrices
+        self.dtype = weight_dtype(dtype)
+        self.lazy = lazy
+        size = max((m.shape[0] for m in matrices), default=0)
+        if node_labels is None:
+            node_labels = range(size)
+        elif len(node_labels) < size:
+            msg = "Fewer node labels than rows in the adjacency matrices."
+            raise ValueError(msg)
+        self.nodes = NodeRegistry(node_labels)
+        self._cache: FrameCache[Graph] = FrameCache(cache_size, eviction)
+        self._spectra: FrameCache[NDArray[np.float64]] = FrameCache(
+            cache_size, eviction
+        )
+        self._frames: list[Graph | FrameEdges] = [
+            edges_from_matrix(m, directed, self.dtype)
+            if lazy
+            else Graph(m, directed=directed, dtype=self.dtype)
+            for m in matrices
         ]
+        # Positions in _frames of the frames of a view, None for all
+        self._positions: range | NDArray[np.int64] | None = None
+        self.base: GraphTimeSeries | None = None
+
+    def _base_index(self, idx: int) -> int:
+        """Return the position in `_frames` of frame `idx`."""
+        n_frames = len(self)
+        if not -n_frames <= idx < n_frames:
+            msg = "Frame index out of range."
+            raise IndexError(msg)
+        idx %= n_frames
+        return idx if self._positions is None else int(self._positions[idx])
+
+    def _view(
+        self, idx: slice | Sequence[int] | NDArray[Any]
+    ) -> GraphTimeSeries:
+        """Return a view of the frames selected by `idx`."""
+        positions: range | NDArray[np.int64] = (
+            range(len(self._frames))
+            if self._positions is None
+            else self._positions
+        )
+        if isinstance(idx, slice):
+            positions = positions[idx]
+        else:
+            selection = np.asarray(idx)
+            if selection.dtype == bool:
+                if selection.shape != (len(self),):
+                    msg = "Boolean index must have one entry per frame."
+                    raise IndexError(msg)
+                selection = np.flatnonzero(selection)
+            elif selection.size == 0:
+                selection = selection.astype(np.int64)
+            positions = np.asarray(positions)[selection]
+        view = copy.copy(self)
+        view._positions = positions  # noqa: SLF001
+        view.base = self if self.base is None else self.base
+        return view
+
+    @overload
+    def __getitem__(self, idx: int) -> Graph: ...
 
-    def __getitem__(self, idx: int) -> Graph:
-        """Return the Graph at index `idx`."""
-        return self.graphs[idx]
+    @overload
+    def __getitem__(
+        self, idx: slice | Sequence[int] | NDArray[Any]
+    ) -> GraphTimeSeries: ...
+
+    def __getitem__(
+        self, idx: int | slice | Sequence[int] | NDArray[Any]
+    ) -> Graph | GraphTimeSeries:
+        """Return the Graph at index `idx`, or a view of several frames.
+
+        Parameters
+        ----------
+        idx :
+            An integer, or a slice, boolean mask or array of indices
+            selecting the frames of a view. A single boolean is
+            rejected with a TypeError, rather than read as 0 or 1.
+        """
+        if isinstance(idx, (bool, np.bool_)):
+            msg = "Frame index must be an integer, not a boolean."
+            raise TypeError(msg)
+        if not isinstance(idx, (int, np.integer)):
+            return self._view(idx)
+        key = self._base_index(int(idx))
+        frame = self._frames[key]
+        if isinstance(frame, Graph):
+            return frame
+        return self._cache.get(
+            key,
+            lambda: Graph(
+                frame.to_sparse(len(self.nodes)),
+                directed=self.directed,
+                dtype=self.dtype,
+            ),
+        )
 
     def __len__(self) -> int:
         """Return the number of timesteps in the series."""
-        return len(self.graphs)
+        if self._positions is None:
+            return len(self._frames)
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[Graph]:
+        """Iterate over the Graphs of the series."""
+        for t in range(len(self)):
+            yield self[t]
+
+    @property
+    def graphs(self) -> Sequence[Graph]:
+        """A read-only sequence of the Graphs, built on access."""
+        return _GraphSequence(self)
+
+    def _indexed(self, graph: Graph) -> Graph:
+        """Return `graph` with registry indices as nodes.
+
+        Registered nodes map to their index. Other nodes are registered as
+        new labels; the registry is first padded up to new integer nodes,
+        see `NodeRegistry.pad`, so that they keep their value as index
+        when it is free. The graph is relabeled on a copy if any node
+        changes.
+        """
+        mapping: dict[Hashable, int] = {}
+        for node in graph.nx_graph.nodes:
+            if node in self.nodes:
+                mapping[node] = self.nodes.index(node)
+            elif isinstance(node, (int, np.integer)) and not isinstance(
+                node, bool
+            ):
+                if node < 0:
+                    msg = f"Negative node index {node}."
+                    raise ValueError(msg)
+                # Padded so that the node is registered at its own index
+                self.nodes.pad(int(node))
+                mapping[node] = self.nodes.add(node)
+            else:
+                mapping[node] = self.nodes.add(node)
+        if all(node == idx for node, idx in mapping.items()):
+            return graph
+        indexed = copy.copy(graph)
+        indexed.nx_graph = nx.relabel_nodes(graph.nx_graph, mapping)
+        return indexed
 
     def append_graph(self, graph: Graph) -> None:
-        """Append a graph at the end of the list."""
-        self.graphs.append(graph)
+        """Append a graph at the end of the list.
+
+        Nodes of `graph` are labels of the node registry, mapped to their
+        index; new ones are registered. A new integer node n is given
+        index n if it is free, the registry being padded with placeholder
+        nodes up to it. A relabeled copy of `graph` is stored if needed.
+        Negative integer nodes that are not labels are rejected. Views
+        cannot be extended.
+        """
+        if self.base is not None:
+            msg = "Cannot append a graph to a view."
+            raise ValueError(msg)
+        self._frames.append(self._indexed(graph))
+
+    def replace_graph(self, idx: int, graph: Graph) -> None:
+        """Replace the graph of frame `idx`.
+
+        The nodes of `graph` are mapped to the registry as in
+        `append_graph`. Frames of views cannot be replaced.
+        """
+        if self.base is not None:
+            msg = "Cannot replace a graph of a view."
+            raise ValueError(msg)
+        key = self._base_index(idx)
+        self._frames[key] = self._indexed(graph)
+        self._cache.discard(key)
+        self._spectra.discard(key)
+
+    def frame_edges(self, idx: int) -> FrameEdges:
+        """Return the edges of frame `idx` as int32 node indices.
+
+        In lazy mode this does not build the Graph of the frame.
+        """
+        frame = self._frames[self._base_index(idx)]
+        if isinstance(frame, Graph):
+            return edges_from_graph(frame)
+        return frame
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the lazy-mode Graph cache."""
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """Drop all the Graphs built in lazy mode."""
+        self._cache.clear()
+
+    def laplacian_spectrum(
+        self, idx: int, *, all_nodes: bool = True
+    ) -> NDArray[np.float64]:
+        """Return the Laplacian eigenvalues of frame `idx`, ascending.
+
+        The Laplacian is that of `observables.laplacian_spectrum`, on the
+        nodes with edges in the frame, symmetrized if directed. With
+        `all_nodes`, the spectrum spans all the nodes of the registry
+        (nodes without edges add zero eigenvalues), so that all the frames
+        have spectra of the same length. Spectra are kept in a bounded LRU
+        cache of `cache_size` frames, shared by all the methods and
+        pipelines that need them.
+        """
+        key = self._base_index(idx)
+        n_nodes = len(self.nodes)
+        spectrum = self._spectra.get(key, lambda: self._registry_spectrum(idx))
+        if spectrum.size < n_nodes:
+            # The registry grew since the spectrum was cached
+            spectrum = np.concatenate(
+                [np.zeros(n_nodes - spectrum.size), spectrum]
+            )
+        if all_nodes:
+            return spectrum
+        edges = self.frame_edges(idx)
+        n_present = np.unique(np.concatenate([edges.src, edges.dst])).size
+        return spectrum[n_nodes - n_present :]
+
+    def _registry_spectrum(self, idx: int) -> NDArray[np.float64]:
+        """Return the spectrum of frame `idx`, padded to the registry."""
+        edges = self.frame_edges(idx)
+        present = np.unique(np.concatenate([edges.src, edges.dst]))
+        adjacency = edges.to_sparse(len(self.nodes))[present][:, present]
+        spectrum = spectrum_of_adjacency(adjacency)
+        return np.concatenate(
+            [np.zeros(len(self.nodes) - present.size), spectrum]
+        )
+
+    def n_nodes_total(self) -> int:
+        """Return the number of nodes in the registry of the series."""
+        return len(self.nodes)
+
+    def _apply(
+        self, fn: Callable[[Graph], Any], cache: ResultCache | None
+    ) -> list[Any]:
+        """Return fn applied to each Graph, going through the cache.
+
+        With a cache, identical frames are also computed only once.
+        """
+        if cache is None:
+            return [fn(graph) for graph in self]
+        name = observable_name(fn)
+        seen: dict[str, Any] = {}
+        results = []
+        for t in range(len(self)):
+            key = cache.key(self.frame_edges(t), self.directed, name)
+            if key not in seen:
+
+                def compute(t: int = t) -> Any:
+                    return fn(self[t])
+
+                seen[key] = cache.get(key, compute)
+            results.append(seen[key])
+        return results
+
+    def _local_observable_entries(
+        self,
+        fn: Callable[[Graph], LocalValues],
+        cache: ResultCache | None = None,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64]]:
+        """Return the (frame, node, value) entries of a local observable.
+
+        Observables returning (nodes, values) arrays are gathered without
+        any Python loop over the nodes; dicts are still walked per frame.
+        """
+        rows, cols, vals = [], [], []
+        for t, values in enumerate(self._apply(fn, cache)):
+            if isinstance(values, tuple):
+                nodes = np.asarray(values[0], dtype=np.int64)
+                vals.append(np.asarray(values[1], dtype=np.float64))
+            else:
+                count = len(values)
+                nodes = np.fromiter(values.keys(), np.int64, count)
+                vals.append(np.fromiter(values.values(), np.float64, count))
+            rows.append(np.full(nodes.size, t, dtype=np.int64))
+            cols.append(nodes)
+        if not rows:
+            return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0)
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(vals)
+
+    def local_observable_array(
+        self,
+        fn: Callable[[Graph], LocalValues],
+        fill_value: float = np.nan,
+        *,
+        cache: ResultCache | None = None,
+    ) -> NDArray[np.float64]:
+        """Apply a local observable function and keep the per-node values.
+
+        Parameters
+        ----------
+        fn :
+            A function that takes a Graph and returns a dict node -> value,
+            or a tuple of arrays (nodes, values).
+        fill_value :
+            The value used for nodes not present in a frame.
+        cache :
+            Optional, a ResultCache storing the values of each frame.
+
+        Returns:
+        -------
+        array
+            array of shape (n_frames, n_nodes_total), row t holds the
+            values of frame t, column i those of node i.
+        """
+        rows, cols, vals = self._local_observable_entries(fn, cache)
+        array = np.full((len(self), self.n_nodes_total()), fill_value)
+        array[rows, cols] = vals
+        return array
+
+    def local_observable_sparse(
+        self,
+        fn: Callable[[Graph], LocalValues],
+        *,
+        cache: ResultCache | None = None,
+    ) -> csr_array:
+        """Apply a local observable function and keep the per-node values.
+
+        Same as `local_observable_array`, but returns a scipy sparse array
+        where nodes not present in a frame are implicit zeros.
+        """
+        rows, cols, vals = self._local_observable_entries(fn, cache)
+        shape = (len(self), self.n_nodes_total())
+        return sparse.coo_array((vals, (rows, cols)), shape=shape).tocsr()
 
-    # --- Observables over time ---
     def local_observable_over_time(
-        self, fn: Callable[[Graph], Any]
+        self,
+        fn: Callable[[Graph], Any],
+        *,
+        cache: ResultCache | None = None,
     ) -> NDArray[np.float64]:
         """Apply a local observable function to each graph in the series.
 
@@ -58,20 +487,21 @@ class GraphTimeSeries:
         ----------
         fn :
             A function that takes a Graph and returns an observable.
+        cache :
+            Optional, a ResultCache storing the values of each frame.
 
         Returns:
         -------
         list
             list of average values, one per timestep.
         """
-        list_of_dicts = [fn(g) for g in self.graphs]
-        tmp_list = [
-            np.mean([float(v) for v in d.values()]) for d in list_of_dicts
-        ]
-        return np.array(tmp_list)
+        return nodes_mean(self.local_observable_array(fn, cache=cache))
 
     def global_observable_over_time(
-        self, fn: Callable[[Graph], Any]
+        self,
+        fn: Callable[[Graph], Any],
+        *,
+        cache: ResultCache | None = None,
     ) -> NDArray[np.float64]:
         """Apply a global observable function to each graph in the series.
 
@@ -79,13 +509,16 @@ class GraphTimeSeries:
         ----------
         fn :
             A function that takes a Graph and returns an observable.
+        cache :
+            Optional, a ResultCache storing the value of each frame. Use
+            functools.partial to bind parameters, they are part of the key.
 
         Returns:
         -------
         list
             list of values, one per timestep.
         """
-        return np.array([fn(g) for g in self.graphs])
+        return np.array(self._apply(fn, cache))
 
     def clustering_over_time(self) -> NDArray[np.float64]:
         """Return clustering coefficients for each graph in the series."""
@@ -93,16 +526,88 @@ class GraphTimeSeries:
 
     def degree_over_time(self) -> NDArray[np.float64]:
         """Return node degrees for each graph in the series."""
-        return self.local_observable_over_time(observables.degree)
+        return nodes_mean(self.degree_array_over_time())
+
+    def clustering_array_over_time(self) -> NDArray[np.float64]:
+        """Return the (n_frames, n_nodes_total) clustering coefficients."""
+        return self.local_observable_array(observables.clustering)
+
+    def degree_array_over_time(self) -> NDArray[np.float64]:
+        """Return the (n_frames, n_nodes_total) node degrees.
+
+        The degrees are summed from the edge arrays of the frames, without
+        building the Graphs.
+        """
+        array = np.full((len(self), self.n_nodes_total()), np.nan)
+        for t in range(len(self)):
+            nodes, values = frame_degrees(self.frame_edges(t), self.directed)
+            array[t, nodes] = values
+        return array
 
     def n_nodes_over_time(self) -> NDArray[np.float64]:
         """Return the number of nodes for each graph in the series."""
         return self.global_observable_over_time(observables.n_nodes)
 
-    def diameter_over_time(self) -> NDArray[np.float64]:
+    def diameter_over_time(
+        self, *, cache: ResultCache | None = None
+    ) -> NDArray[np.float64]:
         """Return graph diameters for each graph in the series."""
-        return self.global_observable_over_time(observables.diameter)
+        return self.global_observable_over_time(
+            observables.diameter, cache=cache
+        )
+
+    def aver_shortest_dist_over_time(
+        self,
+        *,
+        precision: float | None = None,
+        confidence: float = 0.95,
+        max_sources: int | None = None,
+        seed: int | None = None,
+        cache: ResultCache | None = None,
+    ) -> NDArray[np.float64]:
+        """Return average shortest distance for each graph in the series.
+
+        With `precision`, each frame is estimated from sampled sources;
+        `confidence`, `max_sources` and `seed` are passed on to
+        `observables.average_distance`, which rejects `max_sources` and
+        `seed` without `precision`.
+        """
+        fn = partial(
+            observables.average_distance,
+            precision=precision,
+            confidence=confidence,
+            max_sources=max_sources,
+            seed=seed,
+        )
+        return self.global_observable_over_time(fn, cache=cache)
+
+    def communities_over_time(
+        self, resolution: float = 1.0, *, warm_start: bool = True
+    ) -> CommunityTracking:
+        """Return the communities of each frame, with ids stable in time.
+
+        Each frame is optimized starting from the previous partition, see
+        `observables.track_communities`.
+        """
+        return observables.track_communities(
+            self, resolution, warm_start=warm_start
+        )
+
+    def observables_over_time(
+        self,
+        names: Sequence[str | tuple[str, Callable[[FrameContext], float]]],
+    ) -> NDArray[Any]:
+        """Compute several observables with a single pass over the frames.
 
-    def aver_shortest_dist_over_time(self) -> NDArray[np.float64]:
-        """Return average shortest distance for each graph in the series."""
-        return self.global_observable_over_time(observables.average_distance)
+        Parameters
+        ----------
+        names :
+            The observables to compute, see `ObservablePipeline`.
+
+        Returns:
+        -------
+        array
+            structured array with a "frame" field and one field per
+            observable, one row per timestep.
+        """
+        return ObservablePipeline(names).run(self)
@@ -2,34 +2,37 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from numpy.typing import NDArray
+    from numpy.typing import DTypeLike, NDArray
 
-import networkx as nx
 import numpy as np
 
+from .lazy import nx
+
 
 def random_adj_matrix_er(
     n: int,
     p: float = 0.3,
     directed: bool = False,
     seed: int | None = None,
-) -> NDArray[np.float64]:
+    dtype: DTypeLike = np.float64,
+) -> NDArray[Any]:
     """Generate adjacency matrix from Erdős-Rényi random graph."""
     g = nx.gnp_random_graph(n, p, directed=directed, seed=seed)
-    return nx.to_numpy_array(g)
+    return nx.to_numpy_array(g, dtype=dtype)
 
 
 def random_adj_matrix_ba(
     n: int,
     m: int = 2,
     seed: int | None = None,
-) -> NDArray[np.float64]:
+    dtype: DTypeLike = np.float64,
+) -> NDArray[Any]:
     """Generate adjacency matrix from Barabási-Albert scale-free graph."""
     g = nx.barabasi_albert_graph(n, m, seed=seed)
-    return nx.to_numpy_array(g)
+    return nx.to_numpy_array(g, dtype=dtype)
 
 
 def random_adj_matrix_ws(
@@ -37,22 +40,26 @@ def random_adj_matrix_ws(
     k: int = 2,
     p: float = 0.1,
     seed: int | None = None,
-) -> NDArray[np.float64]:
+    dtype: DTypeLike = np.float64,
+) -> NDArray[Any]:
     """Generate adjacency matrix from Watts-Strogatz small-world graph."""
     g = nx.watts_strogatz_graph(n, k, p, seed=seed)
-    return nx.to_numpy_array(g)
+    return nx.to_numpy_array(g, dtype=dtype)
 
 
 def random_weighted_adj_matrix(
-    n: int, p: float = 0.3, max_weight: float = 10.0
-) -> NDArray[np.float64]:
-    """Random weighted adjacency matrix."""
+    n: int,
+    p: float = 0.3,
+    max_weight: float = 10.0,
+    dtype: DTypeLike = np.float64,
+) -> NDArray[Any]:
+    """Random weighted adjacency matrix (weights truncated for int dtypes)."""
     rng = np.random.default_rng()
     mask = rng.random((n, n)) < p
     weights = rng.uniform(1, max_weight, size=(n, n))
     mat = mask * weights
     np.fill_diagonal(mat, 0)  # no self-loops
-    return mat
+    return mat.astype(dtype)
 
 
 def eigenpairs(
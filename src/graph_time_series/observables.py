@@ -1,16 +1,26 @@
 """Module graph_time_series.observables."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from ._internal.centrality_measures import (
     betweenness_centrality,
     closeness_centrality,
     degree_centrality,
+    eigenvector_centrality,
     h_index_centrality,
+    katz_centrality,
+    pagerank_centrality,
 )
+from ._internal.distance_sampling import estimate_average_distance
 from ._internal.laplacian import (
     laplacian,
+    laplacian_spectrum,
     spectral_dimension,
     walk_length_distribution,
 )
+from ._internal.lazy import deferred_attributes
 from ._internal.observables import (
     average_distance,
     clustering,
@@ -19,17 +29,73 @@ from ._internal.observables import (
     n_nodes,
 )
 
+if TYPE_CHECKING:
+    from ._internal.communities import track_communities
+    from ._internal.coreness import coreness, coreness_over_time
+    from ._internal.frame_similarity import (
+        change_point_scores,
+        consecutive_distances,
+        frame_similarity_matrix,
+    )
+    from ._internal.null_models import null_model_ensemble
+    from ._internal.spectral_centrality import spectral_centrality_over_time
+    from ._internal.temporal_paths import (
+        earliest_arrival,
+        fastest_temporal_duration,
+        shortest_temporal_distance,
+        temporal_closeness,
+        temporal_reachability,
+    )
+
 __all__ = [
     "average_distance",
     "betweenness_centrality",
+    "change_point_scores",
     "closeness_centrality",
     "clustering",
+    "consecutive_distances",
+    "coreness",
+    "coreness_over_time",
     "degree",
     "degree_centrality",
     "diameter",
+    "earliest_arrival",
+    "eigenvector_centrality",
+    "estimate_average_distance",
+    "fastest_temporal_duration",
+    "frame_similarity_matrix",
     "h_index_centrality",
+    "katz_centrality",
     "laplacian",
+    "laplacian_spectrum",
     "n_nodes",
+    "null_model_ensemble",
+    "pagerank_centrality",
+    "shortest_temporal_distance",
+    "spectral_centrality_over_time",
     "spectral_dimension",
+    "temporal_closeness",
+    "temporal_reachability",
+    "track_communities",
     "walk_length_distribution",
 ]
+
+# Imported on first access, to keep the package import cheap
+__getattr__ = deferred_attributes(
+    __name__,
+    {
+        "change_point_scores": "._internal.frame_similarity",
+        "consecutive_distances": "._internal.frame_similarity",
+        "coreness": "._internal.coreness",
+        "coreness_over_time": "._internal.coreness",
+        "earliest_arrival": "._internal.temporal_paths",
+        "fastest_temporal_duration": "._internal.temporal_paths",
+        "frame_similarity_matrix": "._internal.frame_similarity",
+        "null_model_ensemble": "._internal.null_models",
+        "shortest_temporal_distance": "._internal.temporal_paths",
+        "spectral_centrality_over_time": "._internal.spectral_centrality",
+        "temporal_closeness": "._internal.temporal_paths",
+        "temporal_reachability": "._internal.temporal_paths",
+        "track_communities": "._internal.communities",
+    },
+)
@@ -1,9 +1,17 @@
 """Module graph_time_series.plotting."""
 
+from ._internal.animation import export_animation
 from ._internal.plotting import (
+    lttb_downsample,
+    minmax_downsample,
     plot_global_obs,
+    plot_global_obs_batch,
 )
 
 __all__ = [
+    "export_animation",
+    "lttb_downsample",
+    "minmax_downsample",
     "plot_global_obs",
+    "plot_global_obs_batch",
 ]
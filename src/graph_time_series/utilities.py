@@ -1,5 +1,11 @@
 """Module graph_time_series.utilities."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._internal.lazy import deferred_attributes
+from ._internal.node_arrays import nodes_histogram, nodes_mean, nodes_quantile
 from ._internal.utilities import (
     eigenpairs,
     random_adj_matrix_ba,
@@ -8,10 +14,31 @@ from ._internal.utilities import (
     random_weighted_adj_matrix,
 )
 
+if TYPE_CHECKING:
+    from ._internal.frame_similarity import edge_incidence_matrix
+    from ._internal.null_models import null_model_frames
+    from ._internal.shared_frames import map_frames
+
 __all__ = [
+    "edge_incidence_matrix",
     "eigenpairs",
+    "map_frames",
+    "nodes_histogram",
+    "nodes_mean",
+    "nodes_quantile",
+    "null_model_frames",
     "random_adj_matrix_ba",
     "random_adj_matrix_er",
     "random_adj_matrix_ws",
     "random_weighted_adj_matrix",
 ]
+
+# Imported on first access, to keep the package import cheap
+__getattr__ = deferred_attributes(
+    __name__,
+    {
+        "edge_incidence_matrix": "._internal.frame_similarity",
+        "map_frames": "._internal.shared_frames",
+        "null_model_frames": "._internal.null_models",
+    },
+)
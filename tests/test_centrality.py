@@ -8,7 +8,10 @@ from graph_time_series.observables import (
     betweenness_centrality,
     closeness_centrality,
     degree_centrality,
+    eigenvector_centrality,
     h_index_centrality,
+    katz_centrality,
+    pagerank_centrality,
 )
 from graph_time_series.utilities import random_adj_matrix_er
 
@@ -96,3 +99,15 @@ def test_random_graph_h_index() -> None:
     for v in hc.values():
         assert v >= 0
         assert isinstance(v, int)
+
+
+def test_spectral_centralities_star(star_graph: Graph) -> None:
+    for centrality in (
+        eigenvector_centrality(star_graph),
+        katz_centrality(star_graph),
+        pagerank_centrality(star_graph),
+    ):
+        # Center node highest, leaves all equal
+        assert centrality[0] > max(centrality[i] for i in range(1, 5))
+        leaves = [centrality[i] for i in range(1, 5)]
+        assert np.allclose(leaves, leaves[0])
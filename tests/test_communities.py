@@ -0,0 +1,106 @@
+"""Pytest for the community tracking."""
+
+from __future__ import annotations
+
+from collections import deque
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_time_series import GraphTimeSeries
+from graph_time_series.observables import track_communities
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module")
+def blocks() -> np.ndarray:
+    return np.repeat(np.arange(4), 15)
+
+
+@pytest.fixture(scope="module")
+def series(blocks: np.ndarray) -> GraphTimeSeries:
+    """Planted partition; halfway, blocks 2 and 3 merge."""
+    rng = np.random.default_rng(0)
+    matrices = []
+    for t in range(10):
+        merged = np.where(blocks == 3, 2, blocks) if t >= 5 else blocks  # noqa: PLR2004
+        p = np.where(merged[:, None] == merged, 0.7, 0.02)
+        upper = np.triu(rng.random(p.shape) < p, 1)
+        matrices.append((upper | upper.T).astype(float))
+    return GraphTimeSeries(matrices)
+
+
+# ---------------- Tests ----------------
+
+
+@pytest.mark.parametrize("warm_start", [True, False])
+def test_track_communities(
+    series: GraphTimeSeries, blocks: np.ndarray, warm_start: bool
+) -> None:
+    tracking = series.communities_over_time(warm_start=warm_start)
+    labels = tracking.labels
+    assert labels.shape == (len(series), series.n_nodes_total())
+    before, after = labels[:5], labels[5:]
+    # Planted blocks are found, with the same ids while they last
+    assert np.all(before == before[0])
+    assert len(set(zip(before[0], blocks))) == len(set(blocks)) == 4  # noqa: PLR2004
+    assert np.all(after == after[0])
+    assert len(set(after[0])) == 3  # noqa: PLR2004
+    for block in (0, 1):
+        assert after[0, blocks == block][0] == before[0, blocks == block][0]
+
+    for t, graph in enumerate(series):
+        communities: dict[int, set[int]] = {}
+        for node, label in enumerate(labels[t]):
+            communities.setdefault(label, set()).add(node)
+        expected = nx.community.modularity(
+            graph.nx_graph, communities.values()
+        )
+        assert np.isclose(tracking.modularity[t], expected)
+
+
+def test_absent_nodes() -> None:
+    path = np.zeros((5, 5))
+    path[0, 1] = path[1, 2] = 1
+    series = GraphTimeSeries([path, np.zeros((5, 5)), path.T], directed=True)
+    tracking = track_communities(series)
+    assert np.all(tracking.labels[:, 3:] == -1)
+    assert np.all(tracking.labels[1] == -1)
+    assert np.isnan(tracking.modularity[1])
+    assert np.all(tracking.labels[[0, 2], :3] >= 0)
+
+
+def test_warm_start_touches_fewer_nodes(
+    blocks: np.ndarray, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """On a slowly changing series, only the changed edges are revisited."""
+    rng = np.random.default_rng(1)
+    p = np.where(blocks[:, None] == blocks, 0.7, 0.02)
+    upper = np.triu(rng.random(p.shape) < p, 1)
+    matrices = []
+    for _ in range(10):
+        # A few edges flip between frames
+        flips = np.triu(rng.random(p.shape) < 0.002, 1)  # noqa: PLR2004
+        upper ^= flips
+        matrices.append((upper | upper.T).astype(float))
+    series = GraphTimeSeries(matrices)
+
+    evaluated: list[int] = []
+
+    class CountingDeque(deque[int]):
+        def popleft(self) -> int:
+            evaluated.append(1)
+            return super().popleft()
+
+    monkeypatch.setattr(
+        "graph_time_series._internal.communities.deque", CountingDeque
+    )
+    cold = track_communities(series, warm_start=False)
+    n_cold = len(evaluated)
+    evaluated.clear()
+    warm = track_communities(series, warm_start=True)
+    assert len(evaluated) < n_cold / 3
+    assert np.allclose(warm.modularity, cold.modularity, atol=0.01)
+    assert np.all(warm.labels == warm.labels[0])
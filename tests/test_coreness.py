@@ -0,0 +1,71 @@
+"""Pytest for the coreness decomposition."""
+
+from __future__ import annotations
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_time_series import Graph, GraphTimeSeries, utilities
+from graph_time_series.observables import coreness, coreness_over_time
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["undir", "dir"])
+def series(request: pytest.FixtureRequest) -> GraphTimeSeries:
+    """Frames differing by a few edge flips, with occasional jumps."""
+    directed = request.param
+    rng = np.random.default_rng(0)
+    matrix = utilities.random_adj_matrix_er(
+        n=40, p=0.15, directed=directed, seed=1
+    )
+    matrices = []
+    for t in range(30):
+        if t % 10 == 0:
+            matrix = utilities.random_adj_matrix_er(
+                n=40, p=0.15, directed=directed, seed=t
+            )
+        matrix = matrix.copy()
+        for _ in range(4):
+            i, j = rng.choice(40, size=2, replace=False)
+            matrix[i, j] = 1 - matrix[i, j]
+            if not directed:
+                matrix[j, i] = matrix[i, j]
+        matrices.append(matrix)
+    return GraphTimeSeries(matrices, directed=directed)
+
+
+# ---------------- Tests ----------------
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_coreness(directed: bool) -> None:
+    for seed in range(5):
+        graph = Graph(
+            utilities.random_adj_matrix_er(
+                n=30, p=0.2, directed=directed, seed=seed
+            ),
+            directed=directed,
+        )
+        assert coreness(graph) == nx.core_number(graph.nx_graph)
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_coreness_over_time(
+    series: GraphTimeSeries, incremental: bool
+) -> None:
+    cores = coreness_over_time(series, incremental=incremental)
+    assert cores.shape == (len(series), series.n_nodes_total())
+    for t, graph in enumerate(series):
+        expected = np.zeros(series.n_nodes_total(), dtype=np.int64)
+        for node, k in nx.core_number(graph.nx_graph).items():
+            expected[node] = k
+        assert np.array_equal(cores[t], expected)
+
+
+def test_coreness_edge_cases() -> None:
+    empty = GraphTimeSeries([np.zeros((4, 4)), np.eye(4)])
+    assert not coreness_over_time(empty).any()
+    # Self-loops are ignored
+    assert coreness(Graph(np.eye(3))) == {0: 0, 1: 0, 2: 0}
@@ -0,0 +1,122 @@
+"""Pytest for the distances estimated from sampled sources."""
+
+from __future__ import annotations
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_time_series import Graph, GraphTimeSeries, utilities
+from graph_time_series.observables import (
+    average_distance,
+    closeness_centrality,
+    estimate_average_distance,
+)
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module")
+def sparse_graph() -> Graph:
+    """A disconnected graph: a giant component and a few small ones."""
+    return Graph(utilities.random_adj_matrix_er(n=300, p=0.008, seed=2))
+
+
+# ---------------- Tests ----------------
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_exact_when_all_sources(directed: bool) -> None:
+    graph = Graph(
+        utilities.random_adj_matrix_er(
+            n=60, p=0.05, directed=directed, seed=3
+        ),
+        directed=directed,
+    )
+    closeness = closeness_centrality(graph, precision=0)
+    for node, value in nx.closeness_centrality(graph.nx_graph).items():
+        assert np.isclose(closeness[node], value)
+
+    estimate = estimate_average_distance(graph, precision=0)
+    undirected = graph.nx_graph.to_undirected()
+    components = sorted(
+        nx.connected_components(undirected), key=len, reverse=True
+    )
+    assert estimate.n_sources == len(undirected)
+    assert estimate.interval == (estimate.mean, estimate.mean)
+    assert estimate.component_sizes.tolist() == [len(c) for c in components]
+    for mean, component in zip(estimate.component_means, components):
+        assert np.isclose(
+            mean,
+            nx.average_shortest_path_length(undirected.subgraph(component)),
+        )
+
+
+def test_estimate(sparse_graph: Graph) -> None:
+    nx_graph = sparse_graph.nx_graph
+    components = list(nx.connected_components(nx_graph))
+    lengths = dict(nx.shortest_path_length(nx_graph))
+    exact = sum(sum(d.values()) for d in lengths.values()) / sum(
+        len(c) * (len(c) - 1) for c in components
+    )
+    # Disconnected graphs only raise in exact mode
+    with pytest.raises(RuntimeError, match="not connected"):
+        average_distance(sparse_graph)
+    assert np.isclose(average_distance(sparse_graph, precision=0), exact)
+
+    covered = 0
+    for seed in range(40):
+        estimate = estimate_average_distance(
+            sparse_graph, precision=0.05, seed=seed
+        )
+        low, high = estimate.interval
+        assert high - low <= 0.1 * estimate.mean
+        assert estimate.n_sources < len(nx_graph)
+        assert estimate.component_sources.sum() == estimate.n_sources
+        covered += low <= exact <= high
+    assert covered >= 32  # noqa: PLR2004
+
+    closeness = closeness_centrality(sparse_graph, precision=0.05, seed=0)
+    expected = nx.closeness_centrality(nx_graph)
+    giant = max(components, key=len)
+    errors = [abs(closeness[i] / expected[i] - 1) for i in giant]
+    assert np.mean(errors) < 0.05  # noqa: PLR2004
+
+
+def test_over_time() -> None:
+    series = GraphTimeSeries(
+        [utilities.random_adj_matrix_er(n=50, p=0.2, seed=i) for i in range(3)]
+    )
+    assert np.allclose(
+        series.aver_shortest_dist_over_time(precision=0),
+        series.aver_shortest_dist_over_time(),
+    )
+    estimates = series.aver_shortest_dist_over_time(precision=0.05, seed=0)
+    assert np.allclose(
+        estimates, series.aver_shortest_dist_over_time(), rtol=0.1
+    )
+    with pytest.raises(ValueError, match="confidence"):
+        average_distance(series[0], precision=0.1, confidence=1.0)
+    # All the estimator parameters reach each frame
+    capped = series.aver_shortest_dist_over_time(
+        precision=0.05, max_sources=2, seed=0
+    )
+    assert np.array_equal(
+        capped,
+        [
+            estimate_average_distance(graph, max_sources=2, seed=0).mean
+            for graph in series
+        ],
+    )
+    with pytest.raises(ValueError, match="precision"):
+        series.aver_shortest_dist_over_time(seed=0)
+
+
+def test_no_edges() -> None:
+    empty = Graph(np.zeros((5, 5)))
+    estimate = estimate_average_distance(empty, precision=0.05)
+    assert np.isnan(estimate.mean)
+    assert np.all(np.isnan(estimate.interval))
+    assert estimate.n_sources == 0
+    assert np.isnan(average_distance(empty, precision=0.05))
+    assert closeness_centrality(empty, precision=0.05) == {}
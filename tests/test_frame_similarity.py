@@ -0,0 +1,174 @@
+"""Pytest for distances and similarities between frames."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import networkx as nx
+import numpy as np
+import pytest
+from scipy import sparse
+
+from graph_time_series import GraphTimeSeries, ObservablePipeline, utilities
+from graph_time_series.observables import (
+    change_point_scores,
+    consecutive_distances,
+    frame_similarity_matrix,
+    laplacian_spectrum,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module")
+def matrices() -> list[np.ndarray]:
+    """Two regimes: sparse graphs, then dense weighted graphs."""
+    sparse = [
+        utilities.random_adj_matrix_er(n=12, p=0.2, seed=seed)
+        for seed in range(15)
+    ]
+    rng = np.random.default_rng(0)
+    dense = []
+    for seed in range(15, 25):
+        ad_mat = utilities.random_adj_matrix_er(n=12, p=0.7, seed=seed)
+        weights = np.triu(rng.integers(1, 5, size=(12, 12)), k=1)
+        dense.append(ad_mat * (weights + weights.T))
+    return sparse + dense
+
+
+# ---------------- Tests ----------------
+
+
+def test_consecutive_distances(matrices: list[np.ndarray]) -> None:
+    series = GraphTimeSeries(matrices, lazy=True)
+    dist = consecutive_distances(series)
+    assert all(
+        values.shape == (len(matrices) - 1,) for values in dist.values()
+    )
+
+    for t in (0, 14, 20):
+        edges = [set(nx.Graph(m).edges) for m in matrices[t : t + 2]]
+        inter = len(edges[0] & edges[1])
+        union = len(edges[0] | edges[1])
+        assert np.isclose(dist["jaccard"][t], 1 - inter / union)
+        expected_edit = np.abs(np.triu(matrices[t] - matrices[t + 1])).sum()
+        assert np.isclose(dist["edit"][t], expected_edit)
+        spectra = [
+            np.linalg.eigvalsh(nx.laplacian_matrix(nx.Graph(m)).toarray())
+            for m in matrices[t : t + 2]
+        ]
+        assert np.isclose(
+            dist["spectral"][t], np.linalg.norm(spectra[1] - spectra[0])
+        )
+
+    # Spectra are computed once, then reused
+    assert series.laplacian_spectrum(3) is series.laplacian_spectrum(3)
+    assert series.cache_info().misses == 0
+
+    with pytest.raises(ValueError, match="Unknown metrics"):
+        consecutive_distances(series, ["hamming"])
+
+
+def test_deltacon_many_nodes() -> None:
+    """DeltaCon features are built per tile, past the int32 index range."""
+    n_nodes = 47_000  # n_nodes**2 > 2**31
+    rng = np.random.default_rng(0)
+    matrices = [
+        sparse.coo_array(
+            (np.ones(500), rng.integers(0, n_nodes, size=(2, 500))),
+            shape=(n_nodes, n_nodes),
+        ).tocsr()
+        for _ in range(3)
+    ]
+    series = GraphTimeSeries(matrices, lazy=True)
+    similarity = frame_similarity_matrix(
+        series, "deltacon", memory_budget=2**20
+    )
+    assert np.allclose(np.diag(similarity), 1.0)
+    assert np.allclose(similarity, similarity.T)
+    off_diagonal = similarity[~np.eye(3, dtype=bool)]
+    assert np.all((off_diagonal > 0) & (off_diagonal < 1))
+
+
+def test_shared_spectra(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pipelines, observables and distances use the same cached spectra."""
+    matrices = [
+        utilities.random_adj_matrix_er(n=8, p=0.3, directed=True, seed=seed)
+        for seed in range(6)
+    ]
+    series = GraphTimeSeries(matrices, directed=True, cache_size=4)
+    for t in range(len(series)):
+        spectrum = series.laplacian_spectrum(t, all_nodes=False)
+        assert np.allclose(spectrum, laplacian_spectrum(series[t]))
+    table = ObservablePipeline(["algebraic_connectivity"]).run(series[2:])
+
+    # Only the last 4 spectra are kept, and the pipeline computed them
+    def fail(_: object) -> None:
+        msg = "spectrum recomputed"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(
+        "graph_time_series._internal.timeseries.spectrum_of_adjacency", fail
+    )
+    spectral = consecutive_distances(series[2:], ["spectral"])["spectral"]
+    assert spectral.shape == (3,)
+    assert np.allclose(
+        table["algebraic_connectivity"],
+        [
+            series.laplacian_spectrum(t, all_nodes=False)[1]
+            for t in range(2, 6)
+        ],
+    )
+    with pytest.raises(AssertionError, match="recomputed"):
+        series.laplacian_spectrum(0)
+
+
+def test_change_point(matrices: list[np.ndarray]) -> None:
+    series = GraphTimeSeries(matrices)
+    dist = consecutive_distances(series, ["edit"])["edit"]
+    scores = change_point_scores(dist, window=5)
+    # Distance 14 compares the last sparse and the first dense frame
+    assert np.argmax(scores) == 14  # noqa: PLR2004
+    assert np.all(scores[:5] == 0)
+
+
+def test_similarity_matrix(matrices: list[np.ndarray], tmp_path: Path) -> None:
+    series = GraphTimeSeries(matrices, lazy=True)
+    n_frames = len(matrices)
+    edge_sets = [set(nx.Graph(m).edges) for m in matrices]
+    jaccard = frame_similarity_matrix(series, "jaccard")
+    assert jaccard.shape == (n_frames, n_frames)
+    assert np.allclose(np.diag(jaccard), 1.0)
+    for i, j in ((0, 3), (2, 20), (18, 24)):
+        union = len(edge_sets[i] | edge_sets[j])
+        expected = len(edge_sets[i] & edge_sets[j]) / union
+        assert np.isclose(jaccard[i, j], expected)
+        assert jaccard[j, i] == jaccard[i, j]
+
+    # Small tiles and parallel tiles give the same matrix
+    for metric in ("cosine", "deltacon"):
+        full = frame_similarity_matrix(series, metric)
+        tiled = frame_similarity_matrix(
+            series, metric, memory_budget=8 * 4 * 7**2, n_jobs=3
+        )
+        assert np.allclose(full, tiled)
+        assert np.allclose(full, full.T)
+        assert np.allclose(np.diag(full), 1.0)
+        assert np.all((full >= 0) & (full <= 1 + 1e-12))
+
+    vectors = np.array([np.triu(m).ravel() for m in matrices])
+    norms = np.linalg.norm(vectors, axis=1)
+    expected = vectors @ vectors.T / np.outer(norms, norms)
+    assert np.allclose(frame_similarity_matrix(series, "cosine"), expected)
+
+    mapped = frame_similarity_matrix(
+        series, out=tmp_path / "sim.npy", memory_budget=1024
+    )
+    assert isinstance(mapped, np.memmap)
+    assert np.allclose(np.load(tmp_path / "sim.npy"), jaccard)
+
+    with pytest.raises(ValueError, match="metric must be"):
+        frame_similarity_matrix(series, "euclidean")
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import networkx as nx
 import numpy as np
 import pytest
 
-from graph_time_series import GraphTimeSeries, utilities
+from graph_time_series import Graph, GraphTimeSeries, observables, utilities
 
 # ---------------- Fixtures ----------------
 
@@ -36,3 +37,260 @@ def test_graph(gts: GraphTimeSeries) -> None:
     _ = gts.degree_over_time()
     _ = gts.clustering_over_time()
     _ = gts.diameter_over_time()
+
+
+def test_local_observable_array(gts: GraphTimeSeries) -> None:
+    """Per-node arrays are aligned with the per-frame dicts."""
+    degrees = gts.degree_array_over_time()
+    assert degrees.shape == (len(gts), 10)
+    for t in (0, 50, 99):
+        for node, value in gts[t].get_degree().items():
+            assert degrees[t, node] == value
+    assert np.allclose(
+        gts.degree_over_time(),
+        [np.mean(list(g.get_degree().values())) for g in gts.graphs],
+    )
+    sparse = gts.local_observable_sparse(observables.degree)
+    assert np.allclose(sparse.toarray(), np.nan_to_num(degrees))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_degree_from_edges(directed: bool) -> None:
+    """Degrees from the edge arrays match networkx, self-loops included."""
+    matrices = [
+        utilities.random_adj_matrix_er(n=8, directed=directed, seed=seed)
+        + np.diag(np.arange(8) % 2)
+        for seed in range(5)
+    ]
+    series = GraphTimeSeries(matrices, directed=directed)
+    expected = series.local_observable_array(observables.degree)
+    assert np.array_equal(
+        series.degree_array_over_time(), expected, equal_nan=True
+    )
+
+    # Observables may return (nodes, values) arrays instead of dicts
+    def as_arrays(graph: Graph) -> tuple[np.ndarray, np.ndarray]:
+        degrees = observables.degree(graph)
+        return np.array(list(degrees)), np.array(list(degrees.values()))
+
+    assert np.array_equal(
+        series.local_observable_array(as_arrays), expected, equal_nan=True
+    )
+
+
+def test_node_reductions() -> None:
+    array = np.array([[1.0, 2.0, 3.0, np.nan], [np.nan] * 4, [4, 4, 5, 9]])
+    mean = utilities.nodes_mean(array)
+    assert np.allclose(mean[[0, 2]], [2.0, 5.5])
+    assert np.isnan(mean[1])
+
+    quantiles = utilities.nodes_quantile(array, [0.25, 0.5])
+    for t in (0, 2):
+        expected = np.nanquantile(array[t], [0.25, 0.5])
+        assert np.allclose(quantiles[:, t], expected)
+    assert np.isnan(quantiles[:, 1]).all()
+
+    hist, edges = utilities.nodes_histogram(array, bins=4)
+    for t in (0, 2):
+        expected, _ = np.histogram(array[t][~np.isnan(array[t])], edges)
+        assert np.array_equal(hist[t], expected)
+    assert hist[1].sum() == 0
+
+
+def test_lazy_series(gts: GraphTimeSeries) -> None:
+    """Lazy series give the same results with bounded memory."""
+    matrices = [
+        utilities.random_adj_matrix_er(n=10, p=0.5, seed=seed)
+        for seed in range(1, 101)
+    ]
+    cache_size = 4
+    lazy = GraphTimeSeries(matrices, lazy=True, cache_size=cache_size)
+    assert len(lazy) == len(gts)
+    assert lazy.cache_info().currsize == 0
+
+    # Degrees are summed from the edge arrays, without building Graphs
+    assert np.allclose(lazy.degree_over_time(), gts.degree_over_time())
+    assert lazy.cache_info().misses == 0
+
+    assert np.allclose(lazy.clustering_over_time(), gts.clustering_over_time())
+    info = lazy.cache_info()
+    assert info.currsize == info.maxsize == cache_size
+    assert info.misses == len(lazy)
+    assert lazy[-1] is lazy[99]
+
+    lazy.clear_cache()
+    assert lazy.cache_info().currsize == 0
+
+
+def test_append_labeled_graph() -> None:
+    """Non-integer node labels are mapped through the registry."""
+    matrix = utilities.random_adj_matrix_er(n=3, p=1.0, seed=0)
+    series = GraphTimeSeries([matrix], node_labels=["a", "b", "c"])
+    graph = Graph(matrix)
+    graph.nx_graph = nx.relabel_nodes(graph.nx_graph, {0: "c", 1: "d", 2: 7})
+    series.append_graph(graph)
+    assert series.nodes.labels == ["a", "b", "c", "d", 4, 5, 6, 7]
+    edges = series.frame_edges(1)
+    pairs = set(zip(edges.src.tolist(), edges.dst.tolist()))
+    assert pairs == {(i, j) for i in (2, 3, 7) for j in (2, 3, 7) if i != j}
+    assert set(graph.nx_graph) == {"c", "d", 7}
+
+    graph.nx_graph = nx.relabel_nodes(graph.nx_graph, {7: -1})
+    with pytest.raises(ValueError, match="Negative node index"):
+        series.append_graph(graph)
+
+
+def test_append_integer_labels() -> None:
+    """Integer labels are labels first, never mistaken for indices."""
+    matrix = np.ones((2, 2)) - np.eye(2)
+    series = GraphTimeSeries([matrix], node_labels=[5, 7])
+    graph = Graph(np.ones((3, 3)) - np.eye(3))
+    graph.nx_graph = nx.relabel_nodes(graph.nx_graph, {0: 5, 1: 6, 2: 1})
+    series.append_graph(graph)
+    labels = series.nodes.labels
+    assert labels[:2] == [5, 7]
+    assert labels[2:5] == [2, 3, 4]
+    # Index 5 holds label 5 already, so it gets a placeholder
+    assert labels[5] not in (5, 7)
+    assert labels[6:] == [6, 1]
+    edges = series.frame_edges(1)
+    pairs = set(zip(edges.src.tolist(), edges.dst.tolist()))
+    assert pairs == {(i, j) for i in (0, 6, 7) for j in (0, 6, 7) if i != j}
+
+
+def test_graphs_sequence() -> None:
+    """`graphs` is a view: lazy frames are built on access only."""
+    matrices = [utilities.random_adj_matrix_er(n=6, seed=i) for i in range(4)]
+    series = GraphTimeSeries(matrices, lazy=True)
+    graphs = series.graphs
+    assert len(graphs) == len(series)
+    assert series.cache_info().misses == 0
+    assert graphs[-1] is series[3]
+    assert len(graphs[1:3]) == 2  # noqa: PLR2004
+
+    # Mutations still apply to the series, but are deprecated
+    new = Graph(matrices[0])
+    with pytest.warns(DeprecationWarning, match="append_graph"):
+        graphs.append(new)  # type: ignore[attr-defined]
+    assert series[4] is new
+    with pytest.warns(DeprecationWarning, match="replace_graph"):
+        graphs[0] = new  # type: ignore[index]
+    assert series[0] is new
+
+
+@pytest.mark.parametrize(("eviction", "misses"), [("lru", 3), ("fifo", 4)])
+def test_lazy_eviction(eviction: str, misses: int) -> None:
+    matrices = [utilities.random_adj_matrix_er(n=5, seed=i) for i in range(3)]
+    lazy = GraphTimeSeries(
+        matrices, lazy=True, cache_size=2, eviction=eviction
+    )
+    for t in (0, 1, 0, 2, 0):
+        _ = lazy[t]
+    # LRU keeps frame 0 (recently used), FIFO evicts it when 2 arrives
+    assert lazy.cache_info().misses == misses
+
+    with pytest.raises(ValueError, match="eviction"):
+        GraphTimeSeries(matrices, lazy=True, eviction="random")
+
+
+def test_node_registry() -> None:
+    """Frames share a fixed node index, even for nodes without edges."""
+    ad_mat_0 = np.zeros((4, 4))
+    ad_mat_0[0, 1] = ad_mat_0[1, 0] = 2.0
+    ad_mat_1 = np.zeros((4, 4))
+    ad_mat_1[2, 3] = ad_mat_1[3, 2] = 1.0
+    labels = ["a", "b", "c", "d"]
+    for lazy in (False, True):
+        series = GraphTimeSeries(
+            [ad_mat_0, ad_mat_1], node_labels=labels, lazy=lazy
+        )
+        assert len(series.nodes) == series.n_nodes_total() == len(labels)
+        assert series.nodes.index("c") == 2  # noqa: PLR2004
+        assert list(series.nodes) == labels
+
+        edges = series.frame_edges(1)
+        assert edges.src.dtype == edges.dst.dtype == np.int32
+        assert edges.src.tolist() == [2, 3]
+        assert edges.dst.tolist() == [3, 2]
+        assert np.array_equal(edges.to_sparse(4).toarray(), ad_mat_1)
+
+        degrees = series.degree_array_over_time()
+        assert degrees[0].tolist()[:2] == [2.0, 2.0]
+        assert np.isnan(degrees[0, 2:]).all()
+
+    with pytest.raises(ValueError, match="Duplicated"):
+        GraphTimeSeries([ad_mat_0], node_labels=["a", "a", "b", "c"])
+    with pytest.raises(ValueError, match="Fewer node labels"):
+        GraphTimeSeries([ad_mat_0], node_labels=["a"])
+
+
+def test_weight_dtype() -> None:
+    """Compact weight storage gives the same observables."""
+    rng = np.random.default_rng(0)
+    matrices = []
+    for seed in range(4):
+        ad_mat = utilities.random_adj_matrix_er(n=10, p=0.4, seed=seed)
+        counts = np.triu(rng.integers(1, 200, size=(10, 10)), k=1)
+        matrices.append(ad_mat * (counts + counts.T))
+    reference = GraphTimeSeries(matrices, lazy=True)
+    for dtype in (np.uint8, np.float32, np.float16):
+        series = GraphTimeSeries(matrices, lazy=True, dtype=dtype)
+        assert series.frame_edges(0).weight.dtype == dtype
+        assert np.allclose(
+            series.degree_array_over_time(),
+            reference.degree_array_over_time(),
+            rtol=1e-3,
+            equal_nan=True,
+        )
+        assert np.allclose(
+            series.laplacian_spectrum(1),
+            reference.laplacian_spectrum(1),
+            rtol=1e-3,
+        )
+
+    unweighted = GraphTimeSeries(matrices, dtype=bool)
+    assert unweighted.frame_edges(2).weight.dtype == np.bool_
+    assert unweighted.degree_array_over_time()[2].tolist() == [
+        float(d) for d in (matrices[2] > 0).sum(axis=1)
+    ]
+    generated = utilities.random_adj_matrix_er(n=5, seed=0, dtype=np.uint8)
+    assert generated.dtype == np.uint8
+
+    with pytest.raises(ValueError, match="cannot be represented"):
+        GraphTimeSeries([matrices[0] / 3], dtype=np.int16)
+    with pytest.raises(ValueError, match="Unsupported weight dtype"):
+        GraphTimeSeries(matrices, dtype=np.complex64)
+
+
+def test_views() -> None:
+    matrices = [
+        utilities.random_adj_matrix_er(n=10, p=0.4, seed=i) for i in range(12)
+    ]
+    series = GraphTimeSeries(matrices, lazy=True)
+    degrees = series.degree_over_time()
+
+    view = series[2:11:3]
+    assert len(view) == len(range(2, 11, 3))
+    assert view.base is series
+    assert np.allclose(view.degree_over_time(), degrees[2:11:3])
+    assert view[0] is series[2]
+    assert view[-1] is series[8]
+    assert view.laplacian_spectrum(1) is series.laplacian_spectrum(5)
+
+    mask = degrees > np.median(degrees)
+    assert np.allclose(series[mask].degree_over_time(), degrees[mask])
+    assert np.allclose(
+        series[[3, 0, 3]].degree_over_time(), degrees[[3, 0, 3]]
+    )
+
+    nested = view[::-1][[0, 2]]
+    assert nested.base is series
+    assert nested[1] is series[2]
+
+    with pytest.raises(IndexError, match="out of range"):
+        view.frame_edges(3)
+    for flag in (True, np.True_):
+        with pytest.raises(TypeError, match="boolean"):
+            series[flag]  # type: ignore[index]
+    with pytest.raises(ValueError, match="view"):
+        view.append_graph(series[0])
@@ -0,0 +1,73 @@
+"""Pytest for the import cost of the package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+HEAVY_MODULES = (
+    "asyncio",
+    "concurrent",
+    "matplotlib",
+    "multiprocessing",
+    "networkx",
+    "scipy",
+)
+
+
+def _loaded_after(code: str) -> set[str]:
+    """Return the heavy top-level packages loaded by `code`."""
+    script = (
+        f"import sys\n{code}\n"
+        "print(' '.join({m.split('.')[0] for m in sys.modules}))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split()) & set(HEAVY_MODULES)
+
+
+# ---------------- Tests ----------------
+
+
+def test_import_is_light() -> None:
+    assert _loaded_after("import graph_time_series") == set()
+    assert _loaded_after("from graph_time_series import observables") == set()
+    assert (
+        _loaded_after(
+            "from graph_time_series import GraphTimeSeries, utilities"
+        )
+        == set()
+    )
+
+
+def test_first_use_imports() -> None:
+    # Plotting in batches uses a process pool
+    assert _loaded_after("import graph_time_series as gts\ngts.plotting") == {
+        "concurrent",
+        "matplotlib",
+        "multiprocessing",
+    }
+    assert _loaded_after(
+        "from graph_time_series import utilities\n"
+        "utilities.random_adj_matrix_er(5)"
+    ) == {"networkx"}
+
+
+def test_deferred_names() -> None:
+    """Rarely used names import their module on first access only."""
+    assert _loaded_after("from graph_time_series import LiveMonitor") == {
+        "asyncio",
+        "concurrent",
+    }
+    for code in (
+        "from graph_time_series import NullModelStats",
+        "from graph_time_series.utilities import map_frames",
+    ):
+        assert _loaded_after(code) == {"concurrent", "multiprocessing"}
+    assert (
+        _loaded_after("from graph_time_series import TemporalIndex") == set()
+    )
@@ -0,0 +1,133 @@
+"""Pytest for the asyncio live-ingestion mode."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from graph_time_series import (
+    FrameContext,
+    GraphTimeSeries,
+    LiveMonitor,
+    LiveResult,
+    iterate_queue,
+    utilities,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+N_FRAMES = 20
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module")
+def matrices() -> list[np.ndarray]:
+    return [
+        utilities.random_adj_matrix_er(n=10, p=0.5, seed=seed)
+        for seed in range(1, N_FRAMES + 1)
+    ]
+
+
+async def burst(matrices: list[np.ndarray]) -> AsyncIterator[np.ndarray]:
+    """Producer emitting all the frames without yielding to the loop."""
+    for matrix in matrices:
+        yield matrix
+
+
+async def monitor_frames(
+    monitor: LiveMonitor, frames: AsyncIterator[np.ndarray]
+) -> list[LiveResult]:
+    async def collect() -> list[LiveResult]:
+        return [result async for result in monitor.results()]
+
+    consumer = asyncio.create_task(collect())
+    await monitor.run(frames)
+    return await consumer
+
+
+# ---------------- Tests ----------------
+
+
+def test_live_block(matrices: list[np.ndarray]) -> None:
+    """With backpressure, every frame is processed in order."""
+
+    async def main() -> list[LiveResult]:
+        queue: asyncio.Queue[np.ndarray | None] = asyncio.Queue()
+        monitor = LiveMonitor(["degree", "diameter"], max_pending=2)
+
+        async def produce() -> None:
+            for matrix in matrices:
+                await queue.put(matrix)
+                await asyncio.sleep(0)
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        results = await monitor_frames(monitor, iterate_queue(queue))
+        await producer
+        return results
+
+    results = asyncio.run(main())
+    series = GraphTimeSeries(matrices)
+    assert [res.frame for res in results] == list(range(N_FRAMES))
+    assert np.allclose(
+        [res.values["degree"] for res in results], series.degree_over_time()
+    )
+    assert np.allclose(
+        [res.values["diameter"] for res in results],
+        series.diameter_over_time(),
+    )
+
+
+@pytest.mark.parametrize(
+    ("policy", "kept"),
+    [("drop_oldest", [18, 19]), ("drop_newest", [0, 1])],
+)
+def test_live_drop(
+    matrices: list[np.ndarray], policy: str, kept: list[int]
+) -> None:
+    """When the buffer is full, frames are dropped."""
+    monitor = LiveMonitor(["n_nodes"], max_pending=2, policy=policy)
+    results = asyncio.run(monitor_frames(monitor, burst(matrices)))
+    assert [res.frame for res in results] == kept
+    assert monitor.n_received == N_FRAMES
+    assert monitor.n_dropped == N_FRAMES - len(kept)
+
+
+def test_live_process_pool(matrices: list[np.ndarray]) -> None:
+    """Heavy observables can run on a pool of processes."""
+
+    async def main(executor: ProcessPoolExecutor) -> list[LiveResult]:
+        queue: asyncio.Queue[np.ndarray | None] = asyncio.Queue()
+        monitor = LiveMonitor(
+            ["degree", "diameter"], max_pending=2, executor=executor
+        )
+        for matrix in matrices:
+            queue.put_nowait(matrix)
+        queue.put_nowait(None)
+        return await monitor_frames(monitor, iterate_queue(queue))
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = asyncio.run(main(executor))
+    series = GraphTimeSeries(matrices)
+    assert [res.frame for res in results] == list(range(N_FRAMES))
+    assert np.allclose(
+        [res.values["diameter"] for res in results],
+        series.diameter_over_time(),
+    )
+
+
+def test_live_errors(matrices: list[np.ndarray]) -> None:
+    def failing(_ctx: FrameContext) -> float:
+        raise ZeroDivisionError
+
+    monitor = LiveMonitor([("failing", failing)])
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(monitor_frames(monitor, burst(matrices)))
+    with pytest.raises(ValueError, match="policy"):
+        LiveMonitor(["degree"], policy="skip")
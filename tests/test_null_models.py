@@ -0,0 +1,134 @@
+"""Pytest for null-model ensembles."""
+
+from __future__ import annotations
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_time_series import FrameEdges, GraphTimeSeries, utilities
+from graph_time_series.observables import null_model_ensemble
+
+N_NODES = 40
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module")
+def series() -> GraphTimeSeries:
+    return GraphTimeSeries(
+        [
+            utilities.random_adj_matrix_ws(n=N_NODES, k=6, p=0.05, seed=s)
+            for s in range(4)
+        ]
+    )
+
+
+# ---------------- Tests ----------------
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_null_model_frames(directed: bool) -> None:
+    graph = nx.gnp_random_graph(N_NODES, 0.15, directed=directed, seed=3)
+    ad_mat = nx.to_numpy_array(graph)
+    ad_mat[ad_mat > 0] = np.arange(1, np.count_nonzero(ad_mat) + 1)
+    if not directed:
+        ad_mat = np.triu(ad_mat) + np.triu(ad_mat).T
+    edges = GraphTimeSeries([ad_mat], directed=directed).frame_edges(0)
+
+    def degrees(e: FrameEdges) -> tuple[np.ndarray, np.ndarray]:
+        return (
+            np.bincount(e.src, minlength=N_NODES),
+            np.bincount(e.dst, minlength=N_NODES),
+        )
+
+    original = set(zip(edges.src.tolist(), edges.dst.tolist()))
+    for model in ("degree_preserving", "erdos_renyi", "configuration"):
+        samples = utilities.null_model_frames(
+            edges, model, 10, directed=directed, seed=0
+        )
+        assert len(samples) == 10  # noqa: PLR2004
+        for sample in samples:
+            pairs = set(zip(sample.src.tolist(), sample.dst.tolist()))
+            # Simple graphs, sorted by (src, dst)
+            assert len(pairs) == sample.src.size
+            assert not any(s == d for s, d in pairs)
+            assert np.all(np.diff(sample.src) >= 0)
+            if not directed:
+                assert pairs == {(d, s) for s, d in pairs}
+            assert sorted(sample.weight) == sorted(edges.weight) or (
+                model == "configuration"
+            )
+            if model == "degree_preserving":
+                assert all(
+                    np.array_equal(x, y)
+                    for x, y in zip(degrees(sample), degrees(edges))
+                )
+            if model != "configuration":
+                assert sample.src.size == edges.src.size
+        # The randomization actually rewires the graph
+        assert pairs != original
+
+    with pytest.raises(ValueError, match="model must be"):
+        utilities.null_model_frames(edges, "rewire")
+
+
+def test_null_model_ensemble(series: GraphTimeSeries) -> None:
+    stats = null_model_ensemble(
+        series, ["clustering", "diameter"], n_samples=10, seed=0
+    )
+    clustering = stats["clustering"]
+    assert np.allclose(clustering.observed, series.clustering_over_time())
+    assert clustering.mean.shape == (len(series),)
+    # Small worlds are far more clustered than their null models
+    assert np.all(clustering.zscore > 3)  # noqa: PLR2004
+    assert np.allclose(
+        clustering.zscore,
+        (clustering.observed - clustering.mean) / clustering.std,
+    )
+    # ... and have longer paths
+    assert np.all(stats["diameter"].observed > stats["diameter"].mean)
+
+    er_stats = null_model_ensemble(
+        series, ["n_nodes"], "erdos_renyi", n_samples=5, seed=0, n_jobs=2
+    )
+    # Same nodes in every ER sample: no spread, undefined z-scores
+    assert np.all(er_stats["n_nodes"].std == 0)
+    assert np.all(np.isnan(er_stats["n_nodes"].zscore))
+
+    parallel = null_model_ensemble(
+        series, ["clustering", "diameter"], n_samples=10, seed=0, n_jobs=2
+    )
+    assert np.allclose(parallel["clustering"].mean, clustering.mean)
+
+
+def test_null_models_keep_dtype() -> None:
+    matrices = [
+        utilities.random_adj_matrix_er(n=10, p=0.4, seed=s) * 3
+        for s in range(2)
+    ]
+    series = GraphTimeSeries(matrices, dtype=np.uint8)
+    stats = null_model_ensemble(
+        series,
+        [("itemsize", lambda ctx: ctx.graph.dtype.itemsize)],
+        n_samples=3,
+        seed=0,
+    )
+    assert np.all(stats["itemsize"].observed == 1)
+    assert np.all(stats["itemsize"].mean == 1)
+
+
+def test_null_models_disconnected_frame() -> None:
+    split = np.zeros((N_NODES, N_NODES))
+    split[:20, :20] = utilities.random_adj_matrix_er(n=20, p=0.5, seed=0)
+    split[20:, 20:] = utilities.random_adj_matrix_er(n=20, p=0.5, seed=1)
+    connected = utilities.random_adj_matrix_ws(n=N_NODES, k=6, seed=0)
+    disconnected = GraphTimeSeries([split, connected])
+    stats = null_model_ensemble(
+        disconnected, ["diameter", "clustering"], n_samples=3, seed=0
+    )
+    # The diameter of the disconnected frame is undefined
+    assert np.isnan(stats["diameter"].observed[0])
+    assert np.isnan(stats["diameter"].zscore[0])
+    assert np.isfinite(stats["diameter"].observed[1])
+    assert np.all(np.isfinite(stats["clustering"].observed))
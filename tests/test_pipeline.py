@@ -0,0 +1,83 @@
+"""Pytest for the single-pass observable pipeline."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from graph_time_series import (
+    FrameContext,
+    GraphTimeSeries,
+    ObservablePipeline,
+    utilities,
+)
+from graph_time_series.observables import laplacian_spectrum
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module")
+def gts() -> GraphTimeSeries:
+    ad_mat_list = [
+        utilities.random_adj_matrix_er(n=12, p=0.5, seed=seed)
+        for seed in range(1, 21)
+    ]
+    return GraphTimeSeries(ad_mat_list)
+
+
+# ---------------- Tests ----------------
+
+
+def test_pipeline_matches_over_time(gts: GraphTimeSeries) -> None:
+    table = gts.observables_over_time(
+        [
+            "n_nodes",
+            "degree",
+            "clustering",
+            "diameter",
+            "average_distance",
+            "algebraic_connectivity",
+        ]
+    )
+    assert np.array_equal(table["frame"], np.arange(len(gts)))
+    assert np.allclose(table["n_nodes"], gts.n_nodes_over_time())
+    assert np.allclose(table["degree"], gts.degree_over_time())
+    assert np.allclose(table["clustering"], gts.clustering_over_time())
+    assert np.allclose(table["diameter"], gts.diameter_over_time())
+    assert np.allclose(
+        table["average_distance"], gts.aver_shortest_dist_over_time()
+    )
+    assert np.allclose(
+        table["algebraic_connectivity"],
+        [laplacian_spectrum(graph)[1] for graph in gts.graphs],
+    )
+
+
+def test_shared_intermediates(gts: GraphTimeSeries) -> None:
+    calls = []
+
+    def n_pairs(ctx: FrameContext) -> float:
+        calls.append(id(ctx.distances))
+        return float(np.isfinite(ctx.distances).sum())
+
+    def eccentricity(ctx: FrameContext) -> float:
+        calls.append(id(ctx.distances))
+        return float(ctx.distances.max(axis=1).mean())
+
+    pipeline = ObservablePipeline([("pairs", n_pairs), ("ecc", eccentricity)])
+    table = pipeline.run(gts)
+    assert np.allclose(table["pairs"], 144)
+    # Both observables used the same distance matrix of each frame
+    assert calls[0::2] == calls[1::2]
+
+
+def test_pipeline_errors() -> None:
+    with pytest.raises(ValueError, match="Unknown observable"):
+        ObservablePipeline(["not_an_observable"])
+    with pytest.raises(ValueError, match="already in the pipeline"):
+        ObservablePipeline(["degree", "degree"])
+
+    ad_mat = np.zeros((4, 4))
+    ad_mat[0, 1] = ad_mat[1, 0] = ad_mat[2, 3] = ad_mat[3, 2] = 1
+    with pytest.raises(RuntimeError, match="not connected"):
+        GraphTimeSeries([ad_mat]).observables_over_time(["diameter"])
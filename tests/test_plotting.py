@@ -0,0 +1,132 @@
+"""Pytest for plotting functions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from graph_time_series import FrameEdges, GraphTimeSeries
+from graph_time_series.plotting import (
+    export_animation,
+    lttb_downsample,
+    minmax_downsample,
+    plot_global_obs,
+    plot_global_obs_batch,
+)
+from graph_time_series.utilities import random_adj_matrix_er
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module")
+def long_series() -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(42)
+    n_frames = 100_000
+    return {
+        "walk": np.cumsum(rng.normal(size=n_frames)),
+        "noise": rng.normal(size=n_frames),
+    }
+
+
+# ---------------- Tests ----------------
+
+
+def test_downsampling(long_series: dict[str, np.ndarray]) -> None:
+    y = long_series["walk"]
+    x = np.arange(y.size, dtype=float)
+
+    x_lttb, _ = lttb_downsample(x, y, 1000)
+    assert x_lttb.size == 1000  # noqa: PLR2004
+    assert x_lttb[0] == x[0]
+    assert x_lttb[-1] == x[-1]
+    assert np.all(np.diff(x_lttb) > 0)
+
+    x_mm, y_mm = minmax_downsample(x, y, 1000)
+    assert x_mm.size <= 1000  # noqa: PLR2004
+    assert np.all(np.diff(x_mm) > 0)
+    assert y_mm.max() == y.max()
+    assert y_mm.min() == y.min()
+
+    with pytest.raises(ValueError, match="at least 3"):
+        lttb_downsample(x, y, 2)
+
+
+def test_batch_plot(
+    tmp_path: Path, long_series: dict[str, np.ndarray]
+) -> None:
+    panels = plot_global_obs_batch(tmp_path / "panels.png", long_series)
+    assert panels[0].exists()
+
+    files = plot_global_obs_batch(
+        tmp_path / "figs",
+        long_series,
+        layout="files",
+        downsampling="minmax",
+        n_jobs=2,
+    )
+    assert sorted(p.name for p in files) == ["noise.png", "walk.png"]
+    assert all(p.exists() for p in files)
+
+    with pytest.raises(ValueError, match="layout"):
+        plot_global_obs_batch(tmp_path, long_series, layout="grid")
+    with pytest.raises(ValueError, match="different lengths"):
+        plot_global_obs_batch(
+            tmp_path / "short.png", long_series, time=np.arange(10.0)
+        )
+
+
+def test_plot_global_obs(tmp_path: Path) -> None:
+    fig_path = str(tmp_path / "obs.png")
+    plot_global_obs(fig_path, np.arange(10.0), y_label="obs")
+    assert (tmp_path / "obs.png").exists()
+
+
+def test_export_animation(tmp_path: Path) -> None:
+    base = random_adj_matrix_er(n=15, p=0.2, seed=1)
+    changed = base.copy()
+    changed[0, 1:] = changed[1:, 0] = 0.0
+    series = GraphTimeSeries([base, base, changed], lazy=True)
+
+    positions = export_animation(series, tmp_path / "frames", seed=42)
+    assert positions.shape == (len(series), len(series.nodes), 2)
+    assert len(list((tmp_path / "frames").glob("frame_*.png"))) == len(series)
+    # No change between frames 0 and 1: the layout is reused
+    assert np.array_equal(positions[0], positions[1])
+    # Only node 0, its former neighbours and their neighbours can move
+    moved = np.any(positions[2] != positions[1], axis=1)
+    movable = base[0] > 0
+    movable[0] = True
+    movable |= changed[movable].any(axis=0)
+    assert moved[0]
+    assert not moved[~movable].any()
+
+    export_animation(series, tmp_path / "movie.gif", seed=42)
+    assert (tmp_path / "movie.gif").exists()
+    assert series.cache_info().misses == 0
+
+
+@pytest.mark.parametrize("failing_frame", [0, 1])
+def test_export_animation_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, failing_frame: int
+) -> None:
+    """A failure while drawing leaves no partial video behind."""
+    series = GraphTimeSeries(
+        [random_adj_matrix_er(n=10, p=0.3, seed=s) for s in range(3)]
+    )
+    frame_edges = GraphTimeSeries.frame_edges
+
+    def broken(self: GraphTimeSeries, idx: int) -> FrameEdges:
+        if idx == failing_frame:
+            msg = "unreadable frame"
+            raise OSError(msg)
+        return frame_edges(self, idx)
+
+    monkeypatch.setattr(GraphTimeSeries, "frame_edges", broken)
+    with pytest.raises(OSError, match="unreadable frame"):
+        export_animation(series, tmp_path / "movie.gif")
+    assert not (tmp_path / "movie.gif").exists()
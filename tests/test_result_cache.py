@@ -0,0 +1,131 @@
+"""Pytest for the on-disk result cache."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from graph_time_series import GraphTimeSeries, ResultCache, observables
+from graph_time_series.utilities import random_adj_matrix_er
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from graph_time_series import Graph
+
+CALLS: list[int] = []
+
+
+def _counted_n_edges(graph: Graph, scale: float = 1.0) -> float:
+    CALLS.append(1)
+    return scale * graph.nx_graph.number_of_edges()
+
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture
+def series() -> GraphTimeSeries:
+    """A trajectory with static stretches: 3 distinct frames out of 8."""
+    frames = [random_adj_matrix_er(n=12, p=0.3, seed=s) for s in range(3)]
+    return GraphTimeSeries(
+        [frames[i] for i in (0, 0, 0, 1, 1, 2, 2, 0)], lazy=True
+    )
+
+
+# ---------------- Tests ----------------
+
+
+def test_result_cache(series: GraphTimeSeries, tmp_path: Path) -> None:
+    CALLS.clear()
+    expected = series.global_observable_over_time(_counted_n_edges)
+    assert len(CALLS) == len(series)
+
+    CALLS.clear()
+    cache = ResultCache(tmp_path / "cache")
+    result = series.global_observable_over_time(_counted_n_edges, cache=cache)
+    assert np.array_equal(result, expected)
+    # Identical frames are computed once
+    assert len(CALLS) == cache.misses == 3  # noqa: PLR2004
+
+    # A new cache object on the same directory reuses the results
+    CALLS.clear()
+    cache = ResultCache(tmp_path / "cache")
+    result = series.global_observable_over_time(_counted_n_edges, cache=cache)
+    assert np.array_equal(result, expected)
+    assert not CALLS
+    assert cache.hits == 3  # noqa: PLR2004
+
+    # Parameters are part of the key
+    doubled = series.global_observable_over_time(
+        partial(_counted_n_edges, scale=2.0), cache=cache
+    )
+    assert np.array_equal(doubled, 2 * expected)
+    assert len(CALLS) == 3  # noqa: PLR2004
+
+    degrees = series.local_observable_array(observables.degree, cache=cache)
+    assert np.array_equal(
+        degrees, series.degree_array_over_time(), equal_nan=True
+    )
+    assert np.array_equal(
+        series.aver_shortest_dist_over_time(cache=cache),
+        series.aver_shortest_dist_over_time(),
+    )
+
+
+def test_result_cache_eviction(
+    series: GraphTimeSeries, tmp_path: Path
+) -> None:
+    cache = ResultCache(tmp_path, max_bytes=0)
+    series.global_observable_over_time(_counted_n_edges, cache=cache)
+    assert cache.size() == 0
+
+    unbounded = ResultCache(tmp_path)
+    series.local_observable_array(observables.degree, cache=unbounded)
+    file_size = unbounded.size() // 3
+    small = ResultCache(tmp_path, max_bytes=2 * file_size)
+    assert small.size() > small.max_bytes
+    key = ResultCache.key(series.frame_edges(0), directed=False, name="x")
+    small.put(key, 1.0)
+    assert small.size() <= small.max_bytes
+    # The newest result is kept
+    assert key in small
+
+    small.clear()
+    assert small.size() == 0
+    with pytest.raises(ValueError, match="non-negative"):
+        ResultCache(tmp_path, max_bytes=-1)
+
+
+def test_result_cache_closures(
+    series: GraphTimeSeries, tmp_path: Path
+) -> None:
+    cache = ResultCache(tmp_path)
+
+    def scaled(scale: float) -> Callable[[Graph], float]:
+        return lambda graph: scale * graph.nx_graph.number_of_edges()
+
+    n_edges = series.global_observable_over_time(
+        lambda graph: graph.nx_graph.number_of_edges(), cache=cache
+    )
+    n_nodes = series.global_observable_over_time(
+        lambda graph: graph.nx_graph.number_of_nodes(), cache=cache
+    )
+    assert not np.array_equal(n_edges, n_nodes)
+    for scale in (1.0, 2.0):
+        result = series.global_observable_over_time(scaled(scale), cache=cache)
+        assert np.array_equal(result, scale * n_edges)
+    assert cache.hits == 0
+    # The same closure over the same values is found again
+    series.global_observable_over_time(scaled(2.0), cache=cache)
+    assert cache.hits == 3  # noqa: PLR2004
+
+    unpicklable = lambda graph: graph  # noqa: E731
+    with pytest.raises(ValueError, match="cannot be pickled"):
+        series.global_observable_over_time(
+            lambda graph: unpicklable(graph).nx_graph.size(), cache=cache
+        )
@@ -0,0 +1,87 @@
+"""Pytest for the shared-memory frame store."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from graph_time_series import GraphTimeSeries, SharedFrameStore, utilities
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _frame_summary(store: SharedFrameStore, t: int) -> tuple[int, float]:
+    """Picklable per-frame function for the workers."""
+    frame = store.frame(t)
+    assert not frame.src.flags.writeable
+    return frame.src.size, store.graph(t).get_average_distance()
+
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module")
+def series() -> GraphTimeSeries:
+    matrices = [
+        utilities.random_adj_matrix_er(n=20, p=0.3, seed=seed)
+        for seed in range(12)
+    ]
+    return GraphTimeSeries(matrices, lazy=True, dtype=np.float32)
+
+
+# ---------------- Tests ----------------
+
+
+def test_shared_store(series: GraphTimeSeries, tmp_path: Path) -> None:
+    for path in (None, tmp_path / "frames.bin"):
+        with SharedFrameStore(series, path) as store:
+            assert len(store) == len(series)
+            attached = SharedFrameStore.attach(store.handle)
+            for t in (0, 5, 11):
+                for got, expected in zip(
+                    attached.frame(t), series.frame_edges(t)
+                ):
+                    assert got.dtype == expected.dtype
+                    assert np.array_equal(got, expected)
+            attached.close()
+
+
+def test_map_frames(series: GraphTimeSeries, tmp_path: Path) -> None:
+    expected = [
+        (series.frame_edges(t).src.size, series[t].get_average_distance())
+        for t in range(len(series))
+    ]
+    assert utilities.map_frames(series, _frame_summary, n_jobs=1) == expected
+    results = utilities.map_frames(
+        series, _frame_summary, n_jobs=2, chunksize=5
+    )
+    assert results == expected
+    results = utilities.map_frames(
+        series, _frame_summary, n_jobs=2, path=tmp_path / "frames.bin"
+    )
+    assert results == expected
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="the patched close only reaches forked workers",
+)
+def test_workers_close_store(
+    series: GraphTimeSeries, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    close = SharedFrameStore.close
+
+    def record_close(store: SharedFrameStore) -> None:
+        (tmp_path / str(os.getpid())).touch()
+        close(store)
+
+    monkeypatch.setattr(SharedFrameStore, "close", record_close)
+    utilities.map_frames(series, _frame_summary, n_jobs=2)
+    closed = {path.name for path in tmp_path.iterdir()}
+    assert str(os.getpid()) in closed
+    assert len(closed) == 3  # noqa: PLR2004
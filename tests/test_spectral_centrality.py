@@ -0,0 +1,83 @@
+"""Pytest for the spectral centralities over time."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Callable
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_time_series import GraphTimeSeries, utilities
+from graph_time_series.observables import spectral_centrality_over_time
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["undir", "dir"])
+def series(request: pytest.FixtureRequest) -> GraphTimeSeries:
+    """Weighted frames drifting slowly from one to the next."""
+    directed = request.param
+    rng = np.random.default_rng(0)
+    matrix = utilities.random_adj_matrix_er(
+        n=30, p=0.3, directed=directed, seed=0
+    ) * rng.uniform(1, 2, (30, 30))
+    matrices = []
+    for _ in range(8):
+        matrix = matrix * rng.uniform(0.998, 1.002, matrix.shape)
+        if not directed:
+            matrix = np.triu(matrix) + np.triu(matrix, 1).T
+        matrices.append(matrix)
+    return GraphTimeSeries(matrices, directed=directed)
+
+
+# ---------------- Tests ----------------
+
+
+@pytest.mark.parametrize(
+    ("measure", "reference"),
+    [
+        ("eigenvector", nx.eigenvector_centrality),
+        ("katz", partial(nx.katz_centrality, alpha=0.02)),
+        ("pagerank", nx.pagerank),
+    ],
+)
+@pytest.mark.parametrize("batch_size", [1, 3])
+def test_against_networkx(
+    series: GraphTimeSeries,
+    measure: str,
+    reference: Callable[..., dict[Any, float]],
+    batch_size: int,
+) -> None:
+    values = spectral_centrality_over_time(
+        series,
+        measure,
+        alpha=0.02 if measure == "katz" else None,
+        batch_size=batch_size,
+    )
+    assert values.shape == (len(series), series.n_nodes_total())
+    for t, graph in enumerate(series):
+        expected = reference(
+            graph.nx_graph, tol=1e-10, max_iter=10_000, weight="weight"
+        )
+        nodes = list(expected)
+        assert np.allclose(
+            values[t, nodes], list(expected.values()), atol=1e-6
+        )
+
+
+def test_warm_start(series: GraphTimeSeries) -> None:
+    values = spectral_centrality_over_time(series)
+    # Started from the first solution, each frame takes a few iterations
+    warm = spectral_centrality_over_time(series, nstart=values[0], max_iter=10)
+    assert np.allclose(warm, values, atol=1e-6)
+    with pytest.raises(RuntimeError, match="converge"):
+        spectral_centrality_over_time(series[3:4], max_iter=10)
+
+
+def test_invalid_arguments(series: GraphTimeSeries) -> None:
+    with pytest.raises(ValueError, match="measure"):
+        spectral_centrality_over_time(series, "hub")
+    with pytest.raises(ValueError, match="nstart"):
+        spectral_centrality_over_time(series, nstart=np.ones(3))
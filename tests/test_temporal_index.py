@@ -0,0 +1,96 @@
+"""Pytest for the per-node temporal index."""
+
+from __future__ import annotations
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_time_series import GraphTimeSeries, TemporalIndex, utilities
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["undir", "dir"])
+def series(request: pytest.FixtureRequest) -> GraphTimeSeries:
+    directed = request.param
+    return GraphTimeSeries(
+        [
+            utilities.random_adj_matrix_er(
+                n=25, p=0.08, directed=directed, seed=seed
+            )
+            for seed in range(12)
+        ],
+        directed=directed,
+    )
+
+
+# ---------------- Tests ----------------
+
+
+def test_neighbor_history(series: GraphTimeSeries) -> None:
+    index = TemporalIndex(series)
+    for node in (0, 7, 24):
+        frames, neighbors, weights = index.neighbor_history(node)
+        assert np.all(np.diff(frames) >= 0)
+        assert np.all(weights == 1.0)
+        for t, graph in enumerate(series):
+            nx_graph = graph.nx_graph
+            expected = sorted(nx_graph[node]) if node in nx_graph else []
+            assert neighbors[frames == t].tolist() == expected
+        assert np.array_equal(
+            index.degree_over_time(node), np.bincount(frames, minlength=12)
+        )
+
+        frames, _, _ = index.neighbor_history(node, start=3, stop=8)
+        assert np.all((frames >= 3) & (frames < 8))  # noqa: PLR2004
+
+    if series.directed:
+        frames, neighbors, _ = index.neighbor_history(7, direction="in")
+        for t, graph in enumerate(series):
+            nx_graph = graph.nx_graph
+            expected = (
+                sorted(nx_graph.predecessors(7)) if 7 in nx_graph else []  # noqa: PLR2004
+            )
+            assert neighbors[frames == t].tolist() == expected
+
+    with pytest.raises(ValueError, match="direction"):
+        index.neighbor_history(0, direction="both")
+    with pytest.raises(ValueError, match="out of range"):
+        index.neighbor_history(25)
+
+
+def test_edge_lifetimes() -> None:
+    ad_mat = np.zeros((3, 3))
+    ad_mat[0, 1] = ad_mat[1, 0] = 1.0
+    both = ad_mat.copy()
+    both[0, 2] = both[2, 0] = 1.0
+    empty = np.zeros((3, 3))
+    series = GraphTimeSeries([ad_mat, both, both, empty, ad_mat])
+    neighbors, starts, stops = TemporalIndex(series).edge_lifetimes(0)
+    assert neighbors.tolist() == [1, 1, 2]
+    assert starts.tolist() == [0, 4, 1]
+    assert stops.tolist() == [3, 5, 3]
+
+
+def test_ego_network(series: GraphTimeSeries) -> None:
+    index = TemporalIndex(series)
+    for k in (1, 2, 3):
+        ego = index.ego_network(5, k=k)
+        assert np.all(np.diff(ego.frames) >= 0)
+        for t, graph in enumerate(series):
+            nx_graph = graph.nx_graph
+            in_frame = ego.frames == t
+            if 5 not in nx_graph:  # noqa: PLR2004
+                assert not in_frame.any()
+                continue
+            lengths = nx.single_source_shortest_path_length(
+                nx_graph, 5, cutoff=k
+            )
+            got = dict(
+                zip(ego.nodes[in_frame].tolist(), ego.hops[in_frame].tolist())
+            )
+            assert got == lengths
+
+    windowed = index.ego_network(5, k=2, start=2, stop=6)
+    assert set(windowed.frames.tolist()) <= {2, 3, 4, 5}
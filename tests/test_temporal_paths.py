@@ -0,0 +1,104 @@
+"""Pytest for time-respecting paths."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from graph_time_series import GraphTimeSeries
+from graph_time_series.observables import (
+    earliest_arrival,
+    fastest_temporal_duration,
+    shortest_temporal_distance,
+    temporal_closeness,
+    temporal_reachability,
+)
+
+EDGE_PROB = 0.15
+
+
+def brute_force_paths(
+    matrices: list[np.ndarray], source: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Enumerate all time-respecting walks from `source`."""
+    n = matrices[0].shape[0]
+    arrival = np.full(n, np.inf)
+    hops = np.full(n, np.inf)
+    duration = np.full(n, np.inf)
+    # Each state: (node, last frame, number of hops, first frame)
+    states: list[tuple[int, int, int, int | None]] = [(source, -1, 0, None)]
+    while states:
+        node, last, n_hops, first = states.pop()
+        for t in range(last + 1, len(matrices)):
+            for nbr in np.flatnonzero(matrices[t][node]):
+                begin = t if first is None else first
+                arrival[nbr] = min(arrival[nbr], t)
+                hops[nbr] = min(hops[nbr], n_hops + 1)
+                duration[nbr] = min(duration[nbr], t - begin + 1)
+                states.append((int(nbr), t, n_hops + 1, begin))
+    arrival[source] = 0
+    hops[source] = duration[source] = 0
+    return arrival, hops, duration
+
+
+# ---------------- Fixtures ----------------
+
+
+@pytest.fixture(scope="module")
+def matrices() -> list[np.ndarray]:
+    rng = np.random.default_rng(42)
+    mats = []
+    for _ in range(6):
+        upper = np.triu(rng.random((6, 6)) < EDGE_PROB, k=1)
+        mats.append((upper | upper.T).astype(float))
+    # Make sure every node appears in at least one frame
+    mats[0][0, 5] = mats[0][5, 0] = 1.0
+    mats[0][1, 2] = mats[0][2, 1] = 1.0
+    mats[0][3, 4] = mats[0][4, 3] = 1.0
+    return mats
+
+
+# ---------------- Tests ----------------
+
+
+def test_against_brute_force(matrices: list[np.ndarray]) -> None:
+    series = GraphTimeSeries(matrices)
+    arrival = earliest_arrival(series)
+    hops = shortest_temporal_distance(series)
+    duration = fastest_temporal_duration(series)
+    for source in range(6):
+        exp_arrival, exp_hops, exp_duration = brute_force_paths(
+            matrices, source
+        )
+        assert np.array_equal(arrival[source], exp_arrival)
+        assert np.array_equal(hops[source], exp_hops)
+        assert np.array_equal(duration[source], exp_duration)
+
+
+def test_path_is_time_respecting() -> None:
+    # 1 - 2 happens before 0 - 1: node 2 is not reachable from 0
+    ad_mat_0 = np.zeros((3, 3))
+    ad_mat_0[1, 2] = ad_mat_0[2, 1] = 1
+    ad_mat_1 = np.zeros((3, 3))
+    ad_mat_1[0, 1] = ad_mat_1[1, 0] = 1
+    series = GraphTimeSeries([ad_mat_0, ad_mat_1])
+
+    reach = temporal_reachability(series, sources=[0, 2])
+    assert reach[0].tolist() == [True, True, False]
+    assert reach[1].tolist() == [True, True, True]
+
+    closeness = temporal_closeness(series, sources=[0, 2])
+    assert np.isclose(closeness[0], 0.25)
+    assert np.isclose(closeness[1], 0.75)
+
+
+def test_directed_and_window() -> None:
+    ad_mat = np.zeros((3, 3))
+    ad_mat[0, 1] = ad_mat[1, 2] = 1
+    series = GraphTimeSeries([ad_mat] * 3, directed=True)
+    arrival = earliest_arrival(series, sources=[0], start=1)
+    assert arrival[0].tolist() == [1, 1, 2]
+    arrival = earliest_arrival(series, sources=[2])
+    assert np.isinf(arrival[0, :2]).all()
+    with pytest.raises(ValueError, match="out of range"):
+        earliest_arrival(series, sources=[3])